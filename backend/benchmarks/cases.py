@@ -0,0 +1,191 @@
+"""
+Benchmark cases shared by the pytest-benchmark suite and the standalone runner
+
+Each case's setup is a context manager that prepares fixtures (outside the
+timed region) and yields the zero-argument callable to time.
+"""
+import asyncio
+import copy
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Iterator, List
+
+# The API cases must not touch the developer's clawdna.db
+os.environ.setdefault("CLAWDNA_USE_MEMORY_DB", "true")
+
+from src.domain.entities import (
+    Agent, EvolutionParameters, EvolutionResult, EvolutionStatus, GenerationStats, Genome
+)
+from src.application.evolution_use_cases import RunEvolutionUseCase, create_engine
+from src.adapters.persistence import SQLiteEvolutionRepository
+
+POPULATION_SIZES = (20, 200, 1000)
+SQLITE_ROWS = 10_000
+
+
+@dataclass
+class BenchmarkCase:
+    """A named, grouped benchmark"""
+    name: str
+    group: str
+    setup: Callable[[], ContextManager[Callable[[], Any]]]
+
+
+def _engine_case(operation: str, size: int, engine: str = "standard") -> BenchmarkCase:
+    @contextmanager
+    def setup() -> Iterator[Callable[[], Any]]:
+        params = EvolutionParameters(population_size=size, random_seed=42, engine=engine)
+        evolution = create_engine(params)
+        population = evolution.initial_population()
+        evolution.evaluate(population)
+        if operation == "evaluate":
+            # A fresh container each time, so no agent counts as already evaluated
+            yield lambda: evolution.evaluate(copy.copy(population))
+        elif operation == "generation_stats":
+            yield lambda: evolution.generation_stats(population, 1)
+        elif operation == "next_generation":
+            yield lambda: evolution.next_generation(population)
+        else:
+            raise ValueError(f"unknown engine operation: {operation}")
+    
+    return BenchmarkCase(f"engine.{engine}.{operation}[{size}]", f"engine-{operation}", setup)
+
+
+def _execute_case(size: int, generations: int, engine: str) -> BenchmarkCase:
+    @contextmanager
+    def setup() -> Iterator[Callable[[], Any]]:
+        params = EvolutionParameters(
+            population_size=size, generations=generations, random_seed=42, engine=engine
+        )
+        use_case = RunEvolutionUseCase()
+        yield lambda: asyncio.run(use_case.execute(params))
+    
+    return BenchmarkCase(f"execute.{engine}[{size}x{generations}]", "execute", setup)
+
+
+def make_result(generations: int = 10, population: int = 0) -> EvolutionResult:
+    """Completed result with synthetic history"""
+    genome = Genome(0.5, 0.6, 0.7, 0.8, 0.9)
+    return EvolutionResult(
+        id="",
+        status=EvolutionStatus.COMPLETED,
+        parameters=EvolutionParameters().__dict__,
+        generations=[
+            GenerationStats(
+                generation_number=n + 1,
+                avg_fitness=2.5,
+                max_fitness=3.5,
+                min_fitness=1.5,
+                diversity_score=0.08,
+                population_size=20
+            )
+            for n in range(generations)
+        ],
+        best_agent=Agent(id="", genome=genome, fitness=3.5),
+        final_population=[Agent(id="", genome=genome, fitness=3.5) for _ in range(population)]
+    )
+
+
+@contextmanager
+def _seeded_repository() -> Iterator[tuple]:
+    """SQLite repository in a temp dir holding SQLITE_ROWS results"""
+    loop = asyncio.new_event_loop()
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SQLiteEvolutionRepository(os.path.join(directory, "bench.db"))
+        
+        async def seed() -> None:
+            for _ in range(SQLITE_ROWS):
+                await repository.save(make_result())
+        
+        loop.run_until_complete(seed())
+        try:
+            yield repository, loop
+        finally:
+            repository.close()
+            loop.close()
+
+
+def _sqlite_case(operation: str) -> BenchmarkCase:
+    @contextmanager
+    def setup() -> Iterator[Callable[[], Any]]:
+        with _seeded_repository() as (repository, loop):
+            if operation == "save":
+                yield lambda: loop.run_until_complete(repository.save(make_result()))
+            elif operation == "list_all":
+                yield lambda: loop.run_until_complete(repository.list_all(limit=100))
+            elif operation == "list_all_summaries":
+                yield lambda: loop.run_until_complete(
+                    repository.list_all(limit=100, include_generations=False)
+                )
+            elif operation == "list_all_deep_offset":
+                yield lambda: loop.run_until_complete(
+                    repository.list_all(limit=100, offset=SQLITE_ROWS - 100)
+                )
+            else:
+                raise ValueError(f"unknown sqlite operation: {operation}")
+    
+    return BenchmarkCase(f"sqlite.{operation}[{SQLITE_ROWS}]", "sqlite", setup)
+
+
+def _to_dict_case(generations: int, population: int) -> BenchmarkCase:
+    @contextmanager
+    def setup() -> Iterator[Callable[[], Any]]:
+        result = make_result(generations, population)
+        yield result.to_dict
+    
+    return BenchmarkCase(f"to_dict[{generations}gen,{population}agents]", "serialization", setup)
+
+
+@contextmanager
+def _api_client() -> Iterator[Any]:
+    """TestClient with rate limiting switched off"""
+    from fastapi.testclient import TestClient
+    from src.main import app
+    from src.adapters.api import limiter
+    
+    limiter.enabled = False
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        limiter.enabled = True
+
+
+def _api_case(endpoint: str) -> BenchmarkCase:
+    @contextmanager
+    def setup() -> Iterator[Callable[[], Any]]:
+        with _api_client() as client:
+            payload = {"population_size": 20, "generations": 10}
+            if endpoint == "run":
+                yield lambda: client.post("/api/v1/evolution/run", json=payload)
+            elif endpoint == "results":
+                for _ in range(100):
+                    client.post("/api/v1/evolution/run", json=payload)
+                yield lambda: client.get("/api/v1/evolution/results?limit=100")
+            elif endpoint == "result":
+                result_id = client.post("/api/v1/evolution/run", json=payload).json()["id"]
+                yield lambda: client.get(f"/api/v1/evolution/results/{result_id}")
+            else:
+                raise ValueError(f"unknown endpoint: {endpoint}")
+    
+    return BenchmarkCase(f"api.{endpoint}", "api", setup)
+
+
+def all_cases() -> List[BenchmarkCase]:
+    """Every benchmark, in reporting order"""
+    cases = []
+    for operation in ("evaluate", "generation_stats", "next_generation"):
+        for size in POPULATION_SIZES:
+            cases.append(_engine_case(operation, size))
+        cases.append(_engine_case(operation, POPULATION_SIZES[-1], engine="vectorized"))
+    cases += [
+        _execute_case(200, 50, "standard"),
+        _execute_case(1000, 100, "standard"),
+        _execute_case(1000, 100, "vectorized"),
+    ]
+    cases += [_sqlite_case(op) for op in ("save", "list_all", "list_all_summaries", "list_all_deep_offset")]
+    cases += [_to_dict_case(100, 0), _to_dict_case(1000, 1000)]
+    cases += [_api_case(endpoint) for endpoint in ("run", "results", "result")]
+    return cases
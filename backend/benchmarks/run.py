@@ -0,0 +1,126 @@
+"""
+Standalone benchmark runner (no pytest needed)
+
+Run from backend/:
+    python -m benchmarks.run                          # print timings
+    python -m benchmarks.run --save benchmarks/baselines/main.json
+    python -m benchmarks.run --compare benchmarks/baselines/main.json
+    python -m benchmarks.run -k engine --quick
+
+With --compare the exit status is 1 when any benchmark's median is more
+than --threshold slower than the baseline.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.cases import BenchmarkCase, all_cases
+
+
+def measure(fn: Callable[[], Any], min_time: float, max_rounds: int) -> Dict[str, float]:
+    """Time fn repeatedly until min_time has elapsed or max_rounds is reached"""
+    fn()  # warm-up
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < max_rounds and (time.perf_counter() - started < min_time or len(timings) < 3):
+        begin = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - begin)
+    return {
+        "rounds": len(timings),
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(cases: List[BenchmarkCase], min_time: float, max_rounds: int) -> Dict[str, Any]:
+    """Run cases and return a baseline document"""
+    results: Dict[str, Any] = {}
+    for case in cases:
+        with case.setup() as fn:
+            stats = measure(fn, min_time, max_rounds)
+        results[case.name] = {"group": case.group, **stats}
+        print(f"{case.name:<50} median {stats['median'] * 1000:10.3f} ms  ({stats['rounds']} rounds)")
+    return {
+        "created_at": datetime.utcnow().isoformat(),
+        "commit": _git_commit(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "benchmarks": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Names of benchmarks whose median regressed by more than threshold"""
+    regressions = []
+    for name, stats in current["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            continue
+        ratio = stats["median"] / previous["median"]
+        marker = "REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{name:<50} {ratio:6.2f}x baseline {marker}")
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run ClawDNA performance benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--save", help="Write results as a JSON baseline to this path")
+    parser.add_argument("--compare", help="Compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown (0.2 = 20%%)")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds to spend timing each case")
+    parser.add_argument("--max-rounds", type=int, default=1000)
+    parser.add_argument("--quick", action="store_true", help="Short timing window for smoke runs")
+    args = parser.parse_args(argv)
+    
+    cases = [case for case in all_cases() if args.filter in case.name]
+    if not cases:
+        parser.error(f"no benchmark matches {args.filter!r}")
+    min_time = 0.05 if args.quick else args.min_time
+    max_rounds = 5 if args.quick else args.max_rounds
+    
+    current = run(cases, min_time, max_rounds)
+    
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write("\n")
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("machine") != current["machine"]:
+            print("warning: baseline was recorded on a different machine", file=sys.stderr)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) regressed", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""
+pytest-benchmark suite
+
+Run from backend/:
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:20%
+"""
+import pytest
+
+from benchmarks.cases import all_cases
+
+CASES = all_cases()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_benchmark(benchmark, case):
+    benchmark.group = case.group
+    with case.setup() as fn:
+        benchmark(fn)
@@ -11,6 +11,14 @@ from pydantic import BaseModel, EmailStr, Field
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from src.domain.entities import User
+from src.domain.exceptions import ConflictError
+from src.domain.repositories import UserRepository
+from src.adapters.metrics import register_gauge
+from src.adapters.persistence import InMemoryUserRepository, SQLiteUserRepository
+from .password_hasher import PasswordHasher, PasswordHasherBusy
+from .token_cache import TokenCache
+
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "clawdna-super-secret-key-change-in-production")
 ALGORITHM = "HS256"
@@ -70,21 +78,115 @@ class AuthResponse(BaseModel):
 
 
 # ============================================================================
-# IN-MEMORY USER STORE (Replace with database in production)
+# USER STORE
 # ============================================================================
 
-# Simple in-memory store - replace with actual database
-_users_db: dict = {}
+_user_repository: Optional[UserRepository] = None
+
+def get_user_repository() -> UserRepository:
+    """Get or create the user repository singleton
+    
+    Shares the results database (CLAWDNA_DB_PATH), so every worker sees the
+    same users; in memory when CLAWDNA_USE_MEMORY_DB is set.
+    """
+    global _user_repository
+    if _user_repository is None:
+        if os.getenv("CLAWDNA_USE_MEMORY_DB", "false").lower() == "true":
+            _user_repository = InMemoryUserRepository()
+        else:
+            _user_repository = SQLiteUserRepository(os.getenv("CLAWDNA_DB_PATH", "clawdna.db"))
+    return _user_repository
+
+
+def close_user_repository() -> None:
+    """Release user store resources (called on application shutdown)"""
+    global _user_repository
+    if _user_repository is not None and hasattr(_user_repository, "close"):
+        _user_repository.close()
+    _user_repository = None
+
+
+def user_response(user: User) -> UserResponse:
+    """Public view of a user (without password)"""
+    return UserResponse(
+        id=user.id,
+        email=user.email,
+        name=user.name,
+        created_at=user.created_at,
+        is_active=user.is_active
+    )
+
+
+# bcrypt worker pool
+_password_hasher: Optional[PasswordHasher] = None
+
+def get_password_hasher() -> PasswordHasher:
+    """Get or create the password hashing pool (CLAWDNA_PASSWORD_WORKERS, CLAWDNA_PASSWORD_QUEUE)"""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            pwd_context,
+            max_workers=int(os.getenv("CLAWDNA_PASSWORD_WORKERS", "2")),
+            max_queue=int(os.getenv("CLAWDNA_PASSWORD_QUEUE", "32"))
+        )
+    return _password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    """Stop the password hashing pool (called on application shutdown)"""
+    global _password_hasher
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+        _password_hasher = None
+
+
+register_gauge(
+    "clawdna_password_hash_tasks",
+    "Password hash/verify calls running on the bcrypt pool or waiting for it",
+    lambda: [
+        (("running",), _password_hasher.running if _password_hasher is not None else 0),
+        (("queued",), _password_hasher.queued if _password_hasher is not None else 0)
+    ],
+    labelnames=("state",)
+)
+register_gauge(
+    "clawdna_password_hash_rejected_total",
+    "Password hash/verify calls refused with 503 because the bcrypt pool was saturated",
+    lambda: [((), _password_hasher.rejected if _password_hasher is not None else 0)],
+    kind="counter"
+)
+
+
+def hasher_busy() -> HTTPException:
+    """503 telling the client to retry once the bcrypt pool drains"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry",
+        headers={"Retry-After": "1"}
+    )
+
 
+# Claims of verified tokens
+_token_cache: Optional[TokenCache] = None
 
-def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt"""
-    return pwd_context.hash(password)
+def get_token_cache() -> TokenCache:
+    """Get or create the verified-token cache (CLAWDNA_TOKEN_CACHE_SIZE)"""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache(max_entries=int(os.getenv("CLAWDNA_TOKEN_CACHE_SIZE", "10000")))
+    return _token_cache
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+register_gauge(
+    "clawdna_token_cache_lookups_total",
+    "Verified-token cache lookups by outcome",
+    lambda: [
+        (("hit",), _token_cache.hits if _token_cache is not None else 0),
+        (("miss",), _token_cache.misses if _token_cache is not None else 0)
+    ],
+    labelnames=("outcome",),
+    kind="counter"
+)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -95,44 +197,60 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-async def get_current_user(token: Optional[str] = Depends(oauth2_scheme)) -> Optional[dict]:
-    """Get current user from JWT token"""
+def issue_token(user: User, token_version: Optional[int] = None) -> Token:
+    """Access token for a user, bound to their current token_version"""
+    version = user.token_version if token_version is None else token_version
+    access_token = create_access_token(data={"sub": user.id, "email": user.email, "ver": version})
+    return Token(access_token=access_token, expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+
+def verified_claims(token: str) -> Optional[dict]:
+    """Claims of a valid token, from the cache when it was verified before"""
+    cache = get_token_cache()
+    claims = cache.get(token)
+    if claims is None:
+        try:
+            claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            return None
+        cache.put(token, claims)
+    return claims
+
+
+async def authenticated_user(token: Optional[str], users: UserRepository) -> Optional[User]:
+    """User a token was issued to, unless it is invalid, expired or revoked"""
     if not token:
         return None
-    
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-        return _users_db.get(user_id)
-    except JWTError:
+    claims = verified_claims(token)
+    if claims is None or claims.get("sub") is None:
+        return None
+    user = await users.get_by_id(claims["sub"])
+    # Tokens from before the "ver" claim count as version 0
+    if user is None or claims.get("ver", 0) != user.token_version:
         return None
+    return user
+
+
+async def get_current_user(
+    token: Optional[str] = Depends(oauth2_scheme),
+    users: UserRepository = Depends(get_user_repository)
+) -> Optional[User]:
+    """Get current user from JWT token"""
+    return await authenticated_user(token, users)
 
 
-async def require_auth(token: str = Depends(oauth2_scheme)) -> dict:
+async def require_auth(
+    token: str = Depends(oauth2_scheme),
+    users: UserRepository = Depends(get_user_repository)
+) -> User:
     """Require authentication - raises exception if not authenticated"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    if not token:
-        raise credentials_exception
-    
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    user = _users_db.get(user_id)
+    user = await authenticated_user(token, users)
     if user is None:
-        raise credentials_exception
-    
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
@@ -141,7 +259,11 @@ async def require_auth(token: str = Depends(oauth2_scheme)) -> dict:
 # ============================================================================
 
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate):
+async def register(
+    user_data: UserCreate,
+    users: UserRepository = Depends(get_user_repository),
+    hasher: PasswordHasher = Depends(get_password_hasher)
+):
     """
     Register a new user.
     
@@ -149,112 +271,104 @@ async def register(user_data: UserCreate):
     - **password**: Minimum 8 characters
     - **name**: User's display name
     """
-    # Check if email already exists
-    for user in _users_db.values():
-        if user["email"] == user_data.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-    
-    # Create user
-    import uuid
-    user_id = str(uuid.uuid4())
-    user = {
-        "id": user_id,
-        "email": user_data.email,
-        "name": user_data.name,
-        "hashed_password": get_password_hash(user_data.password),
-        "created_at": datetime.utcnow(),
-        "is_active": True
-    }
-    _users_db[user_id] = user
-    
-    # Generate token
-    access_token = create_access_token(data={"sub": user_id, "email": user_data.email})
+    email_taken = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Email already registered"
+    )
+    # Cheap indexed check first, so duplicates skip the password hash
+    if await users.get_by_email(user_data.email) is not None:
+        raise email_taken
     
-    return AuthResponse(
-        token=Token(
-            access_token=access_token,
-            expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
-        ),
-        user=UserResponse(
-            id=user_id,
-            email=user["email"],
-            name=user["name"],
-            created_at=user["created_at"],
-            is_active=user["is_active"]
-        )
+    # Create user; the store's unique email index settles concurrent registrations
+    try:
+        hashed_password = await hasher.hash(user_data.password)
+    except PasswordHasherBusy:
+        raise hasher_busy()
+    user = User(
+        id="",
+        email=user_data.email,
+        name=user_data.name,
+        hashed_password=hashed_password
     )
+    try:
+        await users.add(user)
+    except ConflictError:
+        raise email_taken
+    
+    return AuthResponse(token=issue_token(user), user=user_response(user))
 
 
 @router.post("/login", response_model=AuthResponse)
-async def login(form_data: OAuth2PasswordRequestForm = Depends()):
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    users: UserRepository = Depends(get_user_repository),
+    hasher: PasswordHasher = Depends(get_password_hasher)
+):
     """
     Authenticate user and return JWT token.
     
     Uses OAuth2 password flow.
     """
     # Find user by email (username field)
-    user = None
-    for u in _users_db.values():
-        if u["email"] == form_data.username:
-            user = u
-            break
+    user = await users.get_by_email(form_data.username)
+    try:
+        valid = user is not None and await hasher.verify(form_data.password, user.hashed_password)
+    except PasswordHasherBusy:
+        raise hasher_busy()
     
-    if not user or not verify_password(form_data.password, user["hashed_password"]):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Generate token
-    access_token = create_access_token(data={"sub": user["id"], "email": user["email"]})
-    
-    return AuthResponse(
-        token=Token(
-            access_token=access_token,
-            expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
-        ),
-        user=UserResponse(
-            id=user["id"],
-            email=user["email"],
-            name=user["name"],
-            created_at=user["created_at"],
-            is_active=user["is_active"]
-        )
-    )
+    return AuthResponse(token=issue_token(user), user=user_response(user))
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: dict = Depends(require_auth)):
+async def get_me(current_user: User = Depends(require_auth)):
     """
     Get current authenticated user information.
     
     Requires valid JWT token.
     """
-    return UserResponse(
-        id=current_user["id"],
-        email=current_user["email"],
-        name=current_user["name"],
-        created_at=current_user["created_at"],
-        is_active=current_user["is_active"]
-    )
+    return user_response(current_user)
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(current_user: dict = Depends(require_auth)):
+async def refresh_token(
+    current_user: User = Depends(require_auth),
+    token: str = Depends(oauth2_scheme),
+    users: UserRepository = Depends(get_user_repository)
+):
     """
     Refresh JWT token.
     
     Requires valid JWT token, returns new token with extended expiry.
+    Tokens issued earlier (including this one) stop working.
     """
-    access_token = create_access_token(
-        data={"sub": current_user["id"], "email": current_user["email"]}
-    )
+    version = await users.increment_token_version(current_user.id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    get_token_cache().discard(token)
+    return issue_token(current_user, version)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    current_user: User = Depends(require_auth),
+    token: str = Depends(oauth2_scheme),
+    users: UserRepository = Depends(get_user_repository)
+):
+    """
+    Revoke the user's tokens.
     
-    return Token(
-        access_token=access_token,
-        expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    )
+    Every token issued so far stops working, on all workers.
+    """
+    await users.increment_token_version(current_user.id)
+    get_token_cache().discard(token)
@@ -0,0 +1,66 @@
+"""
+Password hashing off the event loop
+Adapter layer - bcrypt on a bounded thread pool with backpressure
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class PasswordHasherBusy(Exception):
+    """Every worker is busy and the wait queue is full"""
+    pass
+
+
+class PasswordHasher:
+    """Runs a passlib context's hash/verify on a dedicated thread pool
+    
+    bcrypt releases the GIL, so up to `max_workers` hashes run in parallel
+    while the event loop keeps serving other requests. At most `max_queue`
+    more calls wait for a worker; beyond that, calls fail immediately with
+    PasswordHasherBusy instead of queueing unbounded work. Counters are
+    only updated on the event loop thread.
+    """
+    
+    def __init__(self, context: Any, max_workers: int = 2, max_queue: int = 32):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        self.context = context
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self.in_flight = 0
+        self.rejected = 0
+    
+    @property
+    def running(self) -> int:
+        return min(self.in_flight, self.max_workers)
+    
+    @property
+    def queued(self) -> int:
+        return max(0, self.in_flight - self.max_workers)
+    
+    async def hash(self, password: str) -> str:
+        """bcrypt hash of a password"""
+        return await self._run(self.context.hash, password)
+    
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Whether the password matches the hash"""
+        return await self._run(self.context.verify, password, hashed_password)
+    
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy("Password hashing is saturated")
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, function, *args)
+        finally:
+            self.in_flight -= 1
+    
+    def shutdown(self) -> None:
+        """Stop the worker threads, dropping queued work"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
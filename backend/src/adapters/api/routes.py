@@ -2,17 +2,39 @@
 API routes for evolution endpoints
 Adapter layer - HTTP interface adapters
 """
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, validator
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-
-from src.domain.entities import EvolutionParameters, EvolutionResult
-from src.domain.exceptions import NotFoundError, ValidationError
-from src.application import RunEvolutionUseCase, GetEvolutionResultUseCase, ListEvolutionResultsUseCase
-from src.adapters.persistence import InMemoryEvolutionRepository, SQLiteEvolutionRepository
+import structlog
+
+from src.domain.entities import CachedResult, EvolutionParameters, EvolutionResult, GenerationStats
+from src.domain.exceptions import ConflictError, EvolutionError, NotFoundError, ValidationError
+from src.application import (
+    EvolutionJobRunner,
+    GetEvolutionResultUseCase,
+    GetEvolutionStatsUseCase,
+    GetPopulationUseCase,
+    ListEvolutionResultsUseCase,
+    RunEvolutionUseCase,
+    fitness_names,
+    parameter_errors
+)
+from src.adapters.metrics import record_evolution_run, register_gauge
+from src.adapters.persistence import (
+    InMemoryEvolutionRepository,
+    InstrumentedEvolutionRepository,
+    LRUResultCache,
+    SQLiteEvolutionRepository,
+    SQLiteResultCache
+)
 
 # Router
 router = APIRouter(prefix="/api/v1/evolution", tags=["evolution"])
@@ -25,16 +47,145 @@ def get_repository():
     global _repository
     if _repository is None:
         # Use SQLite by default, can be configured via env var
-        import os
         if os.getenv("CLAWDNA_USE_MEMORY_DB", "false").lower() == "true":
-            _repository = InMemoryEvolutionRepository()
+            ttl = float(os.getenv("CLAWDNA_MEMORY_DB_TTL", "0"))
+            repository = InMemoryEvolutionRepository(
+                max_results=int(os.getenv("CLAWDNA_MEMORY_DB_MAX_RESULTS", "1000")),
+                max_bytes=int(float(os.getenv("CLAWDNA_MEMORY_DB_MAX_MB", "256")) * 1024 * 1024),
+                ttl_seconds=ttl if ttl > 0 else None
+            )
         else:
-            _repository = SQLiteEvolutionRepository(
+            repository = SQLiteEvolutionRepository(
                 os.getenv("CLAWDNA_DB_PATH", "clawdna.db")
             )
+        _repository = InstrumentedEvolutionRepository(repository)
     return _repository
 
 
+def profile_sample_rate() -> float:
+    """Fraction of runs profiled for phase metrics (CLAWDNA_PROFILE_SAMPLE_RATE)"""
+    return float(os.getenv("CLAWDNA_PROFILE_SAMPLE_RATE", "0"))
+
+
+def checkpoint_interval() -> int:
+    """Generations between persisted checkpoints (CLAWDNA_CHECKPOINT_INTERVAL)"""
+    return int(os.getenv("CLAWDNA_CHECKPOINT_INTERVAL", "100"))
+
+
+# Background job runner
+_job_runner = None
+
+def get_job_runner() -> EvolutionJobRunner:
+    """Get or create the background job runner singleton"""
+    global _job_runner
+    if _job_runner is None:
+        workers = os.getenv("CLAWDNA_JOB_WORKERS")
+        _job_runner = EvolutionJobRunner(
+            repository=get_repository(),
+            max_workers=int(workers) if workers else None,
+            profile_sample_rate=profile_sample_rate(),
+            on_complete=record_evolution_run,
+            checkpoint_interval=checkpoint_interval()
+        )
+    return _job_runner
+
+
+# Cache of seeded results
+_result_cache = None
+
+def get_result_cache() -> LRUResultCache:
+    """Get or create the result cache singleton"""
+    global _result_cache
+    if _result_cache is None:
+        # Optional persistent second tier behind the in-memory LRU
+        cache_db = os.getenv("CLAWDNA_RESULT_CACHE_DB")
+        _result_cache = LRUResultCache(
+            max_entries=int(os.getenv("CLAWDNA_RESULT_CACHE_SIZE", "256")),
+            max_bytes=int(float(os.getenv("CLAWDNA_RESULT_CACHE_MAX_MB", "16")) * 1024 * 1024),
+            backing=SQLiteResultCache(cache_db) if cache_db else None
+        )
+    return _result_cache
+
+
+# Worker pool for expensive fitness functions
+_fitness_executor = None
+
+def get_fitness_executor() -> Optional[ProcessPoolExecutor]:
+    """Get or create the fitness worker pool (CLAWDNA_FITNESS_WORKERS=0 disables it)"""
+    global _fitness_executor
+    workers = os.getenv("CLAWDNA_FITNESS_WORKERS")
+    if workers is not None and int(workers) <= 0:
+        return None
+    if _fitness_executor is None:
+        _fitness_executor = ProcessPoolExecutor(max_workers=int(workers) if workers else None)
+    return _fitness_executor
+
+
+# Worker pool for island-model runs, shared across requests
+_island_executor = None
+
+def get_island_executor() -> ProcessPoolExecutor:
+    """Get or create the island worker pool (size from CLAWDNA_ISLAND_WORKERS)"""
+    global _island_executor
+    if _island_executor is None:
+        workers = os.getenv("CLAWDNA_ISLAND_WORKERS")
+        _island_executor = ProcessPoolExecutor(max_workers=int(workers) if workers else None)
+    return _island_executor
+
+
+def close_repository() -> None:
+    """Release repository resources (called on application shutdown)"""
+    global _repository, _result_cache
+    if _repository is not None and hasattr(_repository, "close"):
+        _repository.close()
+    _repository = None
+    if _result_cache is not None:
+        _result_cache.close()
+    _result_cache = None
+
+
+def shutdown_job_runner() -> None:
+    """Stop the background worker pool (called on application shutdown)"""
+    global _job_runner
+    if _job_runner is not None:
+        _job_runner.shutdown()
+        _job_runner = None
+
+
+def shutdown_fitness_executor() -> None:
+    """Stop the fitness worker pool (called on application shutdown)"""
+    global _fitness_executor
+    if _fitness_executor is not None:
+        _fitness_executor.shutdown(wait=True, cancel_futures=True)
+        _fitness_executor = None
+
+
+def shutdown_island_executor() -> None:
+    """Stop the island worker pool (called on application shutdown)"""
+    global _island_executor
+    if _island_executor is not None:
+        _island_executor.shutdown(wait=True, cancel_futures=True)
+        _island_executor = None
+
+
+# Scrape-time views of the singletons; nothing is created just to be measured
+register_gauge(
+    "clawdna_evolution_jobs_active",
+    "Background evolution jobs submitted and not yet finished",
+    lambda: [((), _job_runner.active_jobs if _job_runner is not None else 0)]
+)
+register_gauge(
+    "clawdna_result_cache_lookups_total",
+    "Result cache lookups by outcome",
+    lambda: [
+        (("hit",), _result_cache.hits if _result_cache is not None else 0),
+        (("miss",), _result_cache.misses if _result_cache is not None else 0)
+    ],
+    labelnames=("outcome",),
+    kind="counter"
+)
+
+
 # Pydantic Models
 class EvolutionRequest(BaseModel):
     """Request model for evolution run"""
@@ -72,12 +223,75 @@ class EvolutionRequest(BaseModel):
         default=None,
         description="Random seed for reproducibility"
     )
+    engine: Literal["standard", "vectorized"] = Field(
+        default="standard",
+        description="Engine implementation; 'vectorized' evolves the population as a NumPy array"
+    )
+    selection_strategy: Literal["tournament", "rank", "sus", "truncation"] = Field(
+        default="tournament",
+        description="Parent selection scheme: tournament, linear rank, stochastic universal sampling or uniform truncation"
+    )
+    fitness_function: str = Field(
+        default="trait_sum",
+        description="Registered fitness function: trait_sum, weighted_traits, balanced or arena"
+    )
+    islands: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Number of sub-populations evolved in parallel worker processes"
+    )
+    migration_interval: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Generations between elite migrations when islands > 1"
+    )
+    migration_size: int = Field(
+        default=2,
+        ge=1,
+        le=100,
+        description="Elites each island sends to its neighbour per migration"
+    )
     
     @validator('tournament_size')
     def validate_tournament_size(cls, v, values):
         if 'population_size' in values and v > values['population_size']:
             raise ValueError('tournament_size cannot exceed population_size')
         return v
+    
+    @validator('fitness_function')
+    def validate_fitness_function(cls, v):
+        if v not in fitness_names():
+            raise ValueError(f"fitness_function must be one of: {', '.join(fitness_names())}")
+        return v
+    
+    def to_domain(self) -> EvolutionParameters:
+        """Convert to domain entity"""
+        return EvolutionParameters(
+            population_size=self.population_size,
+            generations=self.generations,
+            mutation_rate=self.mutation_rate,
+            survival_rate=self.survival_rate,
+            tournament_size=self.tournament_size,
+            random_seed=self.random_seed,
+            engine=self.engine,
+            selection_strategy=self.selection_strategy,
+            fitness_function=self.fitness_function,
+            islands=self.islands,
+            migration_interval=self.migration_interval,
+            migration_size=self.migration_size
+        )
+
+
+class ContinueRequest(BaseModel):
+    """Request model for continuing a stored run"""
+    generations: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Additional generations to evolve from the latest checkpoint"
+    )
 
 
 class GenomeResponse(BaseModel):
@@ -97,6 +311,16 @@ class AgentResponse(BaseModel):
     generation: Optional[int]
 
 
+class PopulationResponse(BaseModel):
+    """Response model for a page of a final population"""
+    result_id: str
+    total: int
+    offset: int
+    limit: int
+    order: str
+    agents: List[AgentResponse]
+
+
 class GenerationStatsResponse(BaseModel):
     """Response model for generation statistics"""
     generation_number: int
@@ -104,6 +328,7 @@ class GenerationStatsResponse(BaseModel):
     max_fitness: float
     min_fitness: float
     diversity_score: float
+    pairwise_distance: Optional[float] = None
     population_size: int
     timestamp: str
 
@@ -116,9 +341,12 @@ class EvolutionResponse(BaseModel):
     generations: List[GenerationStatsResponse]
     best_agent: Optional[AgentResponse]
     fitness_history: List[GenerationStatsResponse]
+    generation_count: int = 0
     created_at: str
     completed_at: Optional[str]
     execution_time_ms: Optional[int]
+    error_message: Optional[str] = None
+    profile: Optional[dict] = None
 
 
 class ErrorResponse(BaseModel):
@@ -136,15 +364,41 @@ class HealthResponse(BaseModel):
     checks: dict = {}
 
 
+logger = structlog.get_logger()
+
 # Rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
 
+async def cached_run(
+    request: Request,
+    params: EvolutionRequest,
+    profile: bool = Query(default=False, description="Report per-phase timings in the result")
+) -> Optional[CachedResult]:
+    """Look up an identical seeded run before the rate limit is charged"""
+    result = None
+    if not profile:
+        try:
+            use_case = RunEvolutionUseCase(repository=get_repository(), cache=get_result_cache())
+            result = await use_case.cached(params.to_domain())
+        except sqlite3.Error as e:
+            # A broken cache tier only costs a recomputation
+            logger.warning("result_cache_lookup_failed", error_type=type(e).__name__, error_message=str(e))
+    request.state.cached_run = result
+    return result
+
+
+def _run_cost(request: Request) -> int:
+    """Cached replays are free; only runs that compute count against the limit"""
+    return 0 if getattr(request.state, "cached_run", None) is not None else 1
+
+
 @router.post(
     "/run",
     response_model=EvolutionResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        202: {"model": EvolutionResponse, "description": "Job accepted (background=true)"},
         400: {"model": ErrorResponse, "description": "Invalid parameters"},
         429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
@@ -152,11 +406,18 @@ limiter = Limiter(key_func=get_remote_address)
     summary="Run evolution simulation",
     description="Run a genetic algorithm evolution with specified parameters"
 )
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", cost=_run_cost)
 async def run_evolution(
     request: Request,
+    response: Response,
     params: EvolutionRequest,
-    persist: bool = Query(default=True, description="Persist results to database")
+    cached: Optional[CachedResult] = Depends(cached_run),
+    profile: bool = Query(default=False, description="Report per-phase timings in the result"),
+    persist: bool = Query(default=True, description="Persist results to database"),
+    background: bool = Query(
+        default=False,
+        description="Run in a worker process and return a PENDING result to poll via /results/{id}"
+    )
 ):
     """
     Run a genetic algorithm evolution simulation.
@@ -167,33 +428,55 @@ async def run_evolution(
     - **survival_rate**: Fraction surviving each generation (0-1]
     - **tournament_size**: Tournament selection size (2-100)
     - **random_seed**: Optional seed for reproducibility
+    - **engine**: `standard` or `vectorized` (NumPy, faster for large runs)
+    - **selection_strategy**: `tournament`, `rank`, `sus` or `truncation`
+    - **fitness_function**: `trait_sum`, `weighted_traits`, `balanced` or `arena`
+    
+    With `background=true` the run is always persisted and the response is
+    `202 Accepted` with status `pending`; poll `/results/{id}` for progress.
+    
+    Requests with a `random_seed` are deterministic: an identical earlier run
+    is returned from the result cache without counting against the rate limit.
+    
+    With `profile=true` the result includes time and call counts per phase
+    (fitness, selection, variation, statistics, persistence), per generation.
     """
+    if cached is not None:
+        # Served as serialized when it was cached
+        return Response(content=cached.payload, media_type="application/json")
+    
     try:
         # Convert to domain entity
-        domain_params = EvolutionParameters(
-            population_size=params.population_size,
-            generations=params.generations,
-            mutation_rate=params.mutation_rate,
-            survival_rate=params.survival_rate,
-            tournament_size=params.tournament_size,
-            random_seed=params.random_seed
-        )
+        domain_params = params.to_domain()
         
         # Validate parameters
-        errors = domain_params.validate()
+        errors = parameter_errors(domain_params)
         if errors:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={"error": "Validation failed", "details": errors}
             )
         
+        if background:
+            result = await get_job_runner().submit(domain_params)
+            response.status_code = status.HTTP_202_ACCEPTED
+            return result.to_dict()
+        
         # Run evolution
         repo = get_repository() if persist else None
-        use_case = RunEvolutionUseCase(repository=repo)
-        result = await use_case.execute(domain_params)
+        use_case = RunEvolutionUseCase(
+            repository=repo,
+            cache=get_result_cache(),
+            profile_sample_rate=profile_sample_rate(),
+            fitness_executor=get_fitness_executor(),
+            checkpoint_interval=checkpoint_interval(),
+            island_executor=get_island_executor()
+        )
+        result = await use_case.execute(domain_params, profile=profile)
+        record_evolution_run(result)
         
         return result.to_dict()
-        
+    
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -206,6 +489,74 @@ async def run_evolution(
         )
 
 
+def _sse_event(event: str, data: dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _evolution_events(
+    use_case: RunEvolutionUseCase, params: EvolutionParameters
+) -> AsyncIterator[str]:
+    """Translate the use case's progress stream into SSE frames"""
+    try:
+        async for item in use_case.stream(params):
+            if isinstance(item, GenerationStats):
+                yield _sse_event("generation", item.to_dict())
+            else:
+                record_evolution_run(item)
+                # History was already streamed; send the summary only
+                summary = item.to_dict()
+                summary["generations"] = []
+                summary["fitness_history"] = []
+                yield _sse_event("result", summary)
+    except Exception as e:
+        yield _sse_event("error", {"error": f"Evolution failed: {str(e)}"})
+
+
+@router.post(
+    "/run/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Stream of SSE events"},
+        400: {"model": ErrorResponse, "description": "Invalid parameters"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"}
+    },
+    summary="Run evolution with streamed progress",
+    description="Run an evolution and stream each generation as a Server-Sent Event"
+)
+@limiter.limit("10/minute")
+async def run_evolution_stream(
+    request: Request,
+    params: EvolutionRequest,
+    persist: bool = Query(default=True, description="Persist results to database")
+):
+    """
+    Run an evolution and stream progress as `text/event-stream`.
+    
+    Emits one `generation` event per generation (same shape as the
+    `generations` items of `/run`), then a final `result` event carrying the
+    result without its history, or an `error` event.
+    """
+    domain_params = params.to_domain()
+    errors = parameter_errors(domain_params)
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "Validation failed", "details": errors}
+        )
+    
+    repo = get_repository() if persist else None
+    use_case = RunEvolutionUseCase(
+        repository=repo,
+        fitness_executor=get_fitness_executor(),
+        island_executor=get_island_executor()
+    )
+    return StreamingResponse(
+        _evolution_events(use_case, domain_params),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get(
     "/results/{result_id}",
     response_model=EvolutionResponse,
@@ -232,6 +583,110 @@ async def get_result(request: Request, result_id: str):
     return result.to_dict()
 
 
+@router.get(
+    "/results/{result_id}/population",
+    response_model=PopulationResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Result not found"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"}
+    },
+    summary="Get final population",
+    description="Page through a result's final population, optionally fittest first"
+)
+@limiter.limit("100/minute")
+async def get_population(
+    request: Request,
+    result_id: str,
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    order: Literal["index", "fitness"] = Query(
+        default="index",
+        description="'index' keeps population order; 'fitness' is fittest first, so limit=k gives the top k"
+    )
+):
+    """Get a page of the final population"""
+    use_case = GetPopulationUseCase(repository=get_repository())
+    page = await use_case.execute(result_id, limit, offset, by_fitness=order == "fitness")
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": f"Evolution result '{result_id}' not found"}
+        )
+    
+    return {
+        "result_id": result_id,
+        "total": page.total,
+        "offset": offset,
+        "limit": limit,
+        "order": order,
+        "agents": [
+            {
+                "id": agent.id,
+                "genome": agent.genome.to_dict(),
+                "fitness": round(agent.fitness, 4),
+                "generation": agent.generation
+            }
+            for agent in page.agents
+        ]
+    }
+
+
+@router.post(
+    "/results/{result_id}/continue",
+    response_model=EvolutionResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "No checkpoint or invalid generations"},
+        404: {"model": ErrorResponse, "description": "Result not found"},
+        409: {"model": ErrorResponse, "description": "Run has not finished yet"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+        500: {"model": ErrorResponse, "description": "Checkpoint unreadable or evolution failed"}
+    },
+    summary="Continue evolution run",
+    description="Evolve a stored run further from its latest checkpoint"
+)
+@limiter.limit("10/minute")
+async def continue_evolution(request: Request, result_id: str, params: ContinueRequest):
+    """
+    Continue a stored run for `generations` more generations.
+    
+    Resumes from the run's latest checkpoint (population and RNG state)
+    instead of recomputing from generation zero, and returns a new result
+    covering the whole run. Only finished (completed or failed) runs can
+    be continued; pending or running ones are rejected with 409.
+    """
+    use_case = RunEvolutionUseCase(
+        repository=get_repository(),
+        cache=get_result_cache(),
+        fitness_executor=get_fitness_executor(),
+        checkpoint_interval=checkpoint_interval(),
+        island_executor=get_island_executor()
+    )
+    try:
+        result = await use_case.resume(result_id, params.generations)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": str(e)}
+        )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": str(e), "details": e.errors}
+        )
+    except ConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"error": str(e)}
+        )
+    except EvolutionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"error": str(e)}
+        )
+    record_evolution_run(result)
+    return result.to_dict()
+
+
 @router.get(
     "/results",
     response_model=List[EvolutionResponse],
@@ -244,12 +699,18 @@ async def get_result(request: Request, result_id: str):
 @limiter.limit("60/minute")
 async def list_results(request: Request,
     limit: int = Query(default=100, ge=1, le=1000),
-    offset: int = Query(default=0, ge=0)
+    offset: int = Query(default=0, ge=0),
+    include_generations: bool = Query(
+        default=True,
+        description="Include per-generation history; false returns summaries only"
+    )
 ):
     """List evolution results"""
     repo = get_repository()
     use_case = ListEvolutionResultsUseCase(repository=repo)
-    results = await use_case.execute(limit=limit, offset=offset)
+    results = await use_case.execute(
+        limit=limit, offset=offset, include_generations=include_generations
+    )
     
     return [r.to_dict() for r in results]
 
@@ -276,12 +737,9 @@ async def health_check(request: Request):
     try:
         db_start = time.time()
         repo = get_repository()
-        # Try to list one result to verify DB connection
-        if hasattr(repo, 'db_path'):
-            import sqlite3
-            conn = sqlite3.connect(repo.db_path)
-            conn.execute("SELECT 1")
-            conn.close()
+        # Round-trip a query to verify the DB connection
+        if hasattr(repo, 'ping'):
+            await repo.ping()
         checks["database"] = {
             "status": "ok",
             "latency_ms": int((time.time() - db_start) * 1000)
@@ -289,26 +747,20 @@ async def health_check(request: Request):
     except Exception as e:
         checks["database"] = {"status": "error", "error": str(e)}
     
-    # Check Solana RPC if configured
+    # Check Solana RPC if configured (over the adapter's pooled connections)
     solana_url = os.getenv("SOLANA_RPC_URL")
     if solana_url:
-        try:
-            rpc_start = time.time()
-            import urllib.request
-            import json
-            req = urllib.request.Request(
-                solana_url,
-                data=json.dumps({"jsonrpc": "2.0", "id": 1, "method": "getHealth"}).encode(),
-                headers={"Content-Type": "application/json"},
-                timeout=5
-            )
-            response = urllib.request.urlopen(req)
+        from src.adapters.solana_adapter import get_solana_adapter
+        
+        rpc_start = time.time()
+        health = await get_solana_adapter().get_health()
+        if health["status"] == "error":
+            checks["solana_rpc"] = {"status": "error", "error": health["error"]}
+        else:
             checks["solana_rpc"] = {
                 "status": "ok",
                 "latency_ms": int((time.time() - rpc_start) * 1000)
             }
-        except Exception as e:
-            checks["solana_rpc"] = {"status": "error", "error": str(e)}
     else:
         checks["solana_rpc"] = {"status": "not_configured"}
     
@@ -336,36 +788,22 @@ async def get_stats(request: Request):
     """Get evolution statistics"""
     try:
         repo = get_repository()
-        use_case = ListEvolutionResultsUseCase(repository=repo)
-        results = await use_case.execute(limit=1000, offset=0)
-        
-        total = len(results)
-        if total == 0:
-            return {
-                "totalEvolutions": 0,
-                "avgFitness": 0.0,
-                "bestFitness": 0.0,
-                "activeAgents": 0,
-                "recentEvolutions": []
-            }
-        
-        fitness_values = [r.best_agent.fitness for r in results if r.best_agent]
-        avg_fitness = sum(fitness_values) / len(fitness_values) if fitness_values else 0.0
-        best_fitness = max(fitness_values) if fitness_values else 0.0
+        use_case = GetEvolutionStatsUseCase(repository=repo)
+        stats = await use_case.execute(recent=10)
         
         return {
-            "totalEvolutions": total,
-            "avgFitness": round(avg_fitness, 2),
-            "bestFitness": round(best_fitness, 2),
-            "activeAgents": total * 50,  # Estimate
+            "totalEvolutions": stats.total_count,
+            "avgFitness": round(stats.avg_fitness, 2),
+            "bestFitness": round(stats.best_fitness or 0.0, 2),
+            "activeAgents": stats.total_count * 50,  # Estimate
             "recentEvolutions": [
                 {
                     "id": r.id,
-                    "generation": len(r.generations),
-                    "fitness": r.best_agent.fitness if r.best_agent else 0.0,
-                    "createdAt": r.created_at.isoformat() if hasattr(r.created_at, 'isoformat') else str(r.created_at)
+                    "generation": r.generation_count,
+                    "fitness": r.best_fitness or 0.0,
+                    "createdAt": r.created_at.isoformat()
                 }
-                for r in results[:10]
+                for r in stats.recent
             ]
         }
     except Exception as e:
@@ -386,8 +824,7 @@ async def solana_health(request: Request):
     from src.adapters.solana_adapter import get_solana_adapter
     
     adapter = get_solana_adapter()
-    health = await adapter.get_health()
-    slot = await adapter.get_slot()
+    health, slot = await adapter.get_health_and_slot()
     
     return {
         "rpc_url": adapter.rpc_url,
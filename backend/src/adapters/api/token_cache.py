@@ -0,0 +1,71 @@
+"""
+Verified-token cache
+Adapter layer - Claims of recently verified JWTs, so repeat requests skip HMAC and JSON work
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+
+class TokenCache:
+    """Least-recently-used claims of verified tokens, keyed by SHA-256 of the token
+    
+    Only the digest is kept, never the bearer token itself. Entries are
+    dropped once the token's `exp` passes, so a cached token is never
+    accepted after it would have failed verification. Revocation is not
+    decided here: callers still compare the claims' token version with the
+    user's, and discard() tokens they revoke.
+    """
+    
+    def __init__(self, max_entries: int = 10_000, clock: Callable[[], float] = time.time):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._clock = clock
+        # digest -> (claims, exp as a Unix timestamp)
+        self._entries: "OrderedDict[bytes, Tuple[Dict, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, token: str) -> Optional[Dict]:
+        """Claims of a previously verified, unexpired token"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= self._clock():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    
+    def put(self, token: str, claims: Dict) -> None:
+        """Remember a verified token's claims until its `exp`"""
+        exp = claims.get("exp")
+        if exp is None:
+            # Without an expiry the cache could outlive the token's validity
+            return
+        key = self._key(token)
+        self._entries[key] = (claims, float(exp))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def discard(self, token: str) -> None:
+        """Forget a token (on logout or refresh)"""
+        self._entries.pop(self._key(token), None)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,274 @@
+"""
+Prometheus metrics
+Adapter layer - prometheus_client registry plus a lock-free request counter
+
+The per-request counter writes only to the calling thread's own cell, so the
+middleware never takes a lock; a scrape sums the cells. Everything else uses
+prometheus_client directly.
+"""
+import asyncio
+import bisect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, disable_created_metrics, generate_latest
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+
+from src.domain.entities import EvolutionResult
+from src.application.fitness import fitness_cache_metrics
+from src.application.profiling import phase_metrics
+
+LabelValues = Tuple[str, ...]
+
+# Seconds; covers sub-millisecond repository calls up to long evolution runs
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# No *_created series: they double the scrape size and nothing reads them
+disable_created_metrics()
+
+
+class ThreadCellCounter:
+    """Counter sharded per thread, exposed through a custom collector"""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # thread id -> that thread's private cell
+        self._cells: Dict[int, Dict[LabelValues, float]] = {}
+    
+    def inc(self, amount: float = 1.0, labels: LabelValues = ()) -> None:
+        ident = threading.get_ident()
+        cell = self._cells.get(ident)
+        if cell is None:
+            # Only this thread ever creates or writes its own key
+            cell = self._cells[ident] = {}
+        cell[labels] = cell.get(labels, 0.0) + amount
+    
+    def values(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for cell in list(self._cells.values()):
+            for labels, value in dict(cell).items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+    
+    def describe(self) -> List[CounterMetricFamily]:
+        return [CounterMetricFamily(self.name, self.documentation, labels=self.labelnames)]
+    
+    def collect(self) -> List[CounterMetricFamily]:
+        family = CounterMetricFamily(self.name, self.documentation, labels=self.labelnames)
+        for labels, value in sorted(self.values().items()):
+            family.add_metric(labels, value)
+        return [family]
+
+
+class _CallbackCollector:
+    """Gauge or counter whose samples are read from a callback at scrape time"""
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        labelnames: Sequence[str],
+        kind: str
+    ):
+        self.family = CounterMetricFamily if kind == "counter" else GaugeMetricFamily
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+        self.labelnames = tuple(labelnames)
+    
+    def describe(self) -> List[Metric]:
+        return [self.family(self.name, self.documentation, labels=self.labelnames)]
+    
+    def collect(self) -> List[Metric]:
+        family = self.family(self.name, self.documentation, labels=self.labelnames)
+        for labels, value in self.callback():
+            family.add_metric(labels, value)
+        return [family]
+
+
+registry = CollectorRegistry()
+
+HTTP_REQUESTS = ThreadCellCounter(
+    "clawdna_http_requests_total",
+    "HTTP requests by method, route template and status code",
+    ("method", "route", "status")
+)
+registry.register(HTTP_REQUESTS)
+HTTP_LATENCY = Histogram(
+    "clawdna_http_request_duration_seconds",
+    "HTTP request latency by method and route template",
+    ("method", "route"),
+    buckets=DEFAULT_BUCKETS,
+    registry=registry
+)
+EVOLUTION_RUNS = Counter(
+    "clawdna_evolution_runs_total",
+    "Finished evolution runs by status, engine and size bucket",
+    ("status", "engine", "population_size", "generations"),
+    registry=registry
+)
+EVOLUTION_DURATION = Histogram(
+    "clawdna_evolution_run_duration_seconds",
+    "Evolution run execution time by engine and size bucket",
+    ("engine", "population_size", "generations"),
+    buckets=DEFAULT_BUCKETS,
+    registry=registry
+)
+REPOSITORY_LATENCY = Histogram(
+    "clawdna_repository_call_duration_seconds",
+    "Repository call latency by repository, operation and outcome",
+    ("repository", "operation", "outcome"),
+    buckets=DEFAULT_BUCKETS,
+    registry=registry
+)
+SOLANA_RPC_LATENCY = Histogram(
+    "clawdna_solana_rpc_duration_seconds",
+    "Solana JSON-RPC call latency by method and outcome",
+    ("method", "outcome"),
+    buckets=DEFAULT_BUCKETS,
+    registry=registry
+)
+EVENT_LOOP_LAG = Histogram(
+    "clawdna_event_loop_lag_seconds",
+    "Delay between a scheduled event-loop wakeup and when it ran",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    registry=registry
+)
+
+# Upper bounds of the size buckets used as evolution-run labels
+POPULATION_BUCKETS = (20, 100, 200, 500, 1000)
+GENERATION_BUCKETS = (10, 50, 100, 500, 1000)
+
+
+def size_bucket(value: int, bounds: Sequence[int]) -> str:
+    """Label for the smallest bound that holds value, e.g. 150 -> 'le_200'"""
+    index = bisect.bisect_left(bounds, value)
+    return f"le_{bounds[index]}" if index < len(bounds) else f"gt_{bounds[-1]}"
+
+
+def record_evolution_run(result: EvolutionResult) -> None:
+    """Count a finished run and observe its duration in its size bucket"""
+    parameters = result.parameters or {}
+    engine = str(parameters.get("engine", "standard"))
+    population = size_bucket(int(parameters.get("population_size", 0)), POPULATION_BUCKETS)
+    generations = size_bucket(int(parameters.get("generations", 0)), GENERATION_BUCKETS)
+    EVOLUTION_RUNS.labels(result.status.value, engine, population, generations).inc()
+    if result.execution_time_ms is not None:
+        EVOLUTION_DURATION.labels(engine, population, generations).observe(result.execution_time_ms / 1000)
+
+
+def observe_repository_call(repository: str, operation: str, outcome: str, seconds: float) -> None:
+    REPOSITORY_LATENCY.labels(repository, operation, outcome).observe(seconds)
+
+
+def observe_solana_rpc(method: str, outcome: str, seconds: float) -> None:
+    SOLANA_RPC_LATENCY.labels(method, outcome).observe(seconds)
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request
+    
+    Requests are labelled with the matched route template (e.g.
+    /api/v1/evolution/results/{result_id}) rather than the raw path, so
+    label cardinality stays bounded.
+    """
+    
+    def __init__(self, app, exclude_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUESTS.inc(labels=(method, template, str(status_code)))
+            HTTP_LATENCY.labels(method, template).observe(elapsed)
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """Sample event-loop scheduling delay until cancelled"""
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - scheduled))
+
+
+def register_gauge(
+    name: str,
+    documentation: str,
+    callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    labelnames: Sequence[str] = (),
+    kind: str = "gauge"
+) -> None:
+    """Expose a value owned elsewhere (read at scrape time)"""
+    registry.register(_CallbackCollector(name, documentation, callback, labelnames, kind))
+
+
+register_gauge(
+    "clawdna_profiled_runs_total",
+    "Evolution runs that were phase-profiled",
+    lambda: [((), phase_metrics.snapshot()["runs"])],
+    kind="counter"
+)
+register_gauge(
+    "clawdna_evolution_phase_seconds_total",
+    "Time spent per evolution phase across profiled runs",
+    lambda: [((phase,), seconds) for phase, seconds in phase_metrics.snapshot()["seconds"].items()],
+    labelnames=("phase",),
+    kind="counter"
+)
+register_gauge(
+    "clawdna_evolution_phase_calls_total",
+    "Calls per evolution phase across profiled runs",
+    lambda: [((phase,), calls) for phase, calls in phase_metrics.snapshot()["calls"].items()],
+    labelnames=("phase",),
+    kind="counter"
+)
+
+
+def _fitness_cache_lookups() -> List[Tuple[LabelValues, float]]:
+    counts = fitness_cache_metrics.snapshot()
+    return [(("hit",), counts["hits"]), (("miss",), counts["misses"])]
+
+
+register_gauge(
+    "clawdna_fitness_cache_lookups_total",
+    "Memoized fitness lookups by outcome, summed over finished runs",
+    _fitness_cache_lookups,
+    labelnames=("outcome",),
+    kind="counter"
+)
+
+
+def render_metrics() -> str:
+    """All registered metrics in Prometheus text exposition format"""
+    return generate_latest(registry).decode()
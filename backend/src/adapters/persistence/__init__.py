@@ -2,6 +2,21 @@
 Persistence adapters
 """
 from .memory_repository import InMemoryEvolutionRepository
+from .instrumented_repository import InstrumentedEvolutionRepository
+from .memory_result_cache import LRUResultCache
+from .memory_user_repository import InMemoryUserRepository
+from .sqlite_pool import SQLiteConnectionPool
 from .sqlite_repository import SQLiteEvolutionRepository
+from .sqlite_result_cache import SQLiteResultCache
+from .sqlite_user_repository import SQLiteUserRepository
 
-__all__ = ["InMemoryEvolutionRepository", "SQLiteEvolutionRepository"]
+__all__ = [
+    "InMemoryEvolutionRepository",
+    "InMemoryUserRepository",
+    "InstrumentedEvolutionRepository",
+    "LRUResultCache",
+    "SQLiteConnectionPool",
+    "SQLiteEvolutionRepository",
+    "SQLiteResultCache",
+    "SQLiteUserRepository"
+]
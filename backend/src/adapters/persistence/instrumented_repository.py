@@ -0,0 +1,69 @@
+"""
+Instrumented repository
+Adapter layer - Times every repository call for the metrics endpoint
+"""
+import time
+from typing import Any, List, Optional
+
+from src.domain.entities import (
+    EvolutionAggregates, EvolutionCheckpoint, EvolutionResult, PopulationPage
+)
+from src.domain.repositories import EvolutionRepository
+from src.adapters.metrics import observe_repository_call
+
+
+class InstrumentedEvolutionRepository(EvolutionRepository):
+    """Wraps a repository and records latency and outcome per operation
+    
+    Methods outside the EvolutionRepository interface (ping, close, ...)
+    are forwarded to the wrapped repository untimed.
+    """
+    
+    def __init__(self, inner: EvolutionRepository):
+        self.inner = inner
+        self.label = type(inner).__name__
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+    
+    async def _timed(self, operation: str, call):
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            value = await call
+            outcome = "ok"
+            return value
+        finally:
+            observe_repository_call(self.label, operation, outcome, time.perf_counter() - start)
+    
+    async def save(self, result: EvolutionResult) -> None:
+        await self._timed("save", self.inner.save(result))
+    
+    async def get_by_id(
+        self, result_id: str, include_generations: bool = True
+    ) -> Optional[EvolutionResult]:
+        return await self._timed("get_by_id", self.inner.get_by_id(result_id, include_generations))
+    
+    async def list_all(
+        self, limit: int = 100, offset: int = 0, include_generations: bool = True
+    ) -> List[EvolutionResult]:
+        return await self._timed("list_all", self.inner.list_all(limit, offset, include_generations))
+    
+    async def delete(self, result_id: str) -> bool:
+        return await self._timed("delete", self.inner.delete(result_id))
+    
+    async def get_aggregates(self, recent: int = 10) -> EvolutionAggregates:
+        return await self._timed("get_aggregates", self.inner.get_aggregates(recent))
+    
+    async def get_population(
+        self, result_id: str, limit: int = 100, offset: int = 0, by_fitness: bool = False
+    ) -> Optional[PopulationPage]:
+        return await self._timed(
+            "get_population", self.inner.get_population(result_id, limit, offset, by_fitness)
+        )
+    
+    async def save_checkpoint(self, checkpoint: EvolutionCheckpoint) -> None:
+        await self._timed("save_checkpoint", self.inner.save_checkpoint(checkpoint))
+    
+    async def get_checkpoint(self, result_id: str) -> Optional[EvolutionCheckpoint]:
+        return await self._timed("get_checkpoint", self.inner.get_checkpoint(result_id))
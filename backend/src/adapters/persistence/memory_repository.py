@@ -2,39 +2,269 @@
 In-memory repository implementation
 Adapter layer - Concrete data access implementation
 """
-from typing import Dict, List, Optional
-from src.domain.entities import EvolutionResult
+import bisect
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from src.domain.entities import (
+    EvolutionAggregates, EvolutionCheckpoint, EvolutionResult, EvolutionSummary, PopulationPage
+)
 from src.domain.repositories import EvolutionRepository
+from .population_codec import PackedPopulation, pack_population
+
+# Rough footprint of a stored result, for the byte budget
+RESULT_BYTES = 1024
+GENERATION_BYTES = 320
 
 
 class InMemoryEvolutionRepository(EvolutionRepository):
-    """In-memory implementation of evolution repository"""
+    """In-memory implementation of evolution repository
+    
+    Bounded by `max_results` and by `max_bytes` (estimated from generation
+    counts plus packed population and checkpoint sizes): beyond either, the
+    least recently saved or read results are evicted together with their
+    checkpoint and population. With `ttl_seconds`, results untouched for
+    that long expire. None means unbounded. Reads by id (the result, its
+    population or checkpoint) count as use; listing and aggregates do not,
+    so paging through everything doesn't keep every result alive.
+    
+    Final populations are kept packed (about 60 bytes per agent) rather
+    than as Agent lists, and are served page by page like SQLite's.
+    Results are indexed by (created_at, id), so list_all slices a page
+    instead of sorting everything.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_results: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_results = max_results
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
         self._storage: Dict[str, EvolutionResult] = {}
+        self._checkpoints: Dict[str, EvolutionCheckpoint] = {}
+        self._populations: Dict[str, PackedPopulation] = {}
+        self._reset_usage()
+        self._reset_aggregates()
+        self.evictions = 0
+    
+    def _reset_usage(self) -> None:
+        # Last save or read of each result, least recent first
+        self._used: "OrderedDict[str, float]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.bytes_used = 0
+    
+    def _reset_aggregates(self) -> None:
+        # Best-agent fitness each stored result contributed when it was saved
+        self._fitness: Dict[str, Optional[float]] = {}
+        self._fitness_sum = 0.0
+        self._fitness_count = 0
+        self._best_fitness: Optional[float] = None
+        self._best_stale = False
+        # (created_at, id) of every stored result, oldest first
+        self._index: List[Tuple[datetime, str]] = []
     
     async def save(self, result: EvolutionResult) -> None:
         """Save an evolution result"""
+        self._expire()
+        previous = self._storage.get(result.id)
+        if previous is not None:
+            self._untrack(previous.id, previous.created_at)
+        if result.final_population:
+            self._populations[result.id] = PackedPopulation(pack_population(result.final_population))
+            result = replace(result, final_population=[])
         self._storage[result.id] = result
+        self._track(result)
+        self._resize(result.id)
+        self._touch(result.id)
+        self._evict()
+    
+    def _resize(self, result_id: str) -> None:
+        """Re-estimate a result's footprint after it or its blobs changed"""
+        size = RESULT_BYTES + GENERATION_BYTES * len(self._storage[result_id].generations)
+        population = self._populations.get(result_id)
+        if population is not None:
+            size += population.nbytes
+        checkpoint = self._checkpoints.get(result_id)
+        if checkpoint is not None:
+            size += len(checkpoint.state)
+        self.bytes_used += size - self._sizes.get(result_id, 0)
+        self._sizes[result_id] = size
+    
+    def _touch(self, result_id: str) -> None:
+        self._used[result_id] = self._clock()
+        self._used.move_to_end(result_id)
+    
+    def _evict(self) -> None:
+        """Drop least recently used results until within bounds, keeping the newest"""
+        while len(self._used) > 1 and (
+            (self.max_results is not None and len(self._used) > self.max_results)
+            or (self.max_bytes is not None and self.bytes_used > self.max_bytes)
+        ):
+            self._remove(next(iter(self._used)))
+            self.evictions += 1
+    
+    def _expire(self) -> None:
+        """Drop results not saved or read within the TTL"""
+        if self.ttl_seconds is None:
+            return
+        deadline = self._clock() - self.ttl_seconds
+        while self._used:
+            result_id, used_at = next(iter(self._used.items()))
+            if used_at > deadline:
+                break
+            self._remove(result_id)
+            self.evictions += 1
     
-    async def get_by_id(self, result_id: str) -> Optional[EvolutionResult]:
+    def _track(self, result: EvolutionResult) -> None:
+        """Add a result's contribution to the running aggregates"""
+        fitness = result.best_agent.fitness if result.best_agent else None
+        self._fitness[result.id] = fitness
+        if fitness is not None:
+            self._fitness_sum += fitness
+            self._fitness_count += 1
+            if self._best_fitness is None or fitness > self._best_fitness:
+                self._best_fitness = fitness
+        
+        # Usually newest, so the insert lands at the end
+        bisect.insort(self._index, (result.created_at, result.id))
+    
+    def _untrack(self, result_id: str, created_at: datetime) -> None:
+        """Remove a result's contribution from the running aggregates"""
+        fitness = self._fitness.pop(result_id, None)
+        if fitness is not None:
+            self._fitness_sum -= fitness
+            self._fitness_count -= 1
+            if fitness == self._best_fitness:
+                self._best_stale = True
+        
+        entry = (created_at, result_id)
+        index = bisect.bisect_left(self._index, entry)
+        if index < len(self._index) and self._index[index] == entry:
+            del self._index[index]
+    
+    async def get_by_id(
+        self, result_id: str, include_generations: bool = True
+    ) -> Optional[EvolutionResult]:
         """Get evolution result by ID"""
-        return self._storage.get(result_id)
+        self._expire()
+        result = self._storage.get(result_id)
+        if result is not None:
+            self._touch(result_id)
+        if result is None or include_generations:
+            return result
+        return self._summary(result)
     
-    async def list_all(self, limit: int = 100, offset: int = 0) -> List[EvolutionResult]:
+    async def list_all(
+        self, limit: int = 100, offset: int = 0, include_generations: bool = True
+    ) -> List[EvolutionResult]:
         """List all evolution results with pagination"""
-        results = list(self._storage.values())
-        # Sort by creation date descending
-        results.sort(key=lambda r: r.created_at, reverse=True)
-        return results[offset:offset + limit]
+        self._expire()
+        # Newest first: walk the index backwards from `offset`
+        end = len(self._index) - offset
+        if end <= 0 or limit <= 0:
+            return []
+        page = [
+            self._storage[result_id]
+            for _, result_id in reversed(self._index[max(end - limit, 0):end])
+        ]
+        if include_generations:
+            return page
+        return [self._summary(r) for r in page]
+    
+    def _summary(self, result: EvolutionResult) -> EvolutionResult:
+        """Shallow copy without generation history"""
+        return replace(
+            result,
+            generations=[],
+            generation_count=result.total_generations
+        )
     
     async def delete(self, result_id: str) -> bool:
         """Delete an evolution result"""
         if result_id in self._storage:
-            del self._storage[result_id]
+            self._remove(result_id)
             return True
         return False
     
+    def _remove(self, result_id: str) -> None:
+        result = self._storage.pop(result_id)
+        self._checkpoints.pop(result_id, None)
+        self._populations.pop(result_id, None)
+        self._used.pop(result_id, None)
+        self.bytes_used -= self._sizes.pop(result_id, 0)
+        self._untrack(result_id, result.created_at)
+    
+    async def get_population(
+        self, result_id: str, limit: int = 100, offset: int = 0, by_fitness: bool = False
+    ) -> Optional[PopulationPage]:
+        """A page of the result's final population"""
+        self._expire()
+        if result_id not in self._storage:
+            return None
+        self._touch(result_id)
+        population = self._populations.get(result_id)
+        if population is None:
+            return PopulationPage(total=0)
+        return population.page(limit, offset, by_fitness)
+    
+    async def save_checkpoint(self, checkpoint: EvolutionCheckpoint) -> None:
+        """Store a checkpoint, replacing the result's previous one
+        
+        Ignored when the result is not stored (or was evicted), since the
+        checkpoint would never be reclaimed.
+        """
+        if checkpoint.result_id not in self._storage:
+            return
+        self._checkpoints[checkpoint.result_id] = checkpoint
+        self._resize(checkpoint.result_id)
+        self._touch(checkpoint.result_id)
+        self._evict()
+    
+    async def get_checkpoint(self, result_id: str) -> Optional[EvolutionCheckpoint]:
+        """Latest checkpoint of a result"""
+        self._expire()
+        checkpoint = self._checkpoints.get(result_id)
+        if checkpoint is not None:
+            self._touch(result_id)
+        return checkpoint
+    
+    async def get_aggregates(self, recent: int = 10) -> EvolutionAggregates:
+        """Running totals maintained by save/delete, plus the newest results"""
+        self._expire()
+        if self._best_stale:
+            # Only after the best result was removed or downgraded
+            values = [f for f in self._fitness.values() if f is not None]
+            self._best_fitness = max(values) if values else None
+            self._best_stale = False
+        
+        newest = self._index[:-recent - 1:-1] if recent > 0 else []
+        return EvolutionAggregates(
+            total_count=len(self._storage),
+            fitness_sum=self._fitness_sum,
+            fitness_count=self._fitness_count,
+            best_fitness=self._best_fitness,
+            recent=[
+                EvolutionSummary(
+                    id=result_id,
+                    generation_count=self._storage[result_id].total_generations,
+                    best_fitness=self._fitness[result_id],
+                    created_at=created_at
+                )
+                for created_at, result_id in newest
+            ]
+        )
+    
     def clear(self) -> None:
         """Clear all stored results (for testing)"""
         self._storage.clear()
+        self._checkpoints.clear()
+        self._populations.clear()
+        self._reset_usage()
+        self._reset_aggregates()
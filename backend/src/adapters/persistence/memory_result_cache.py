@@ -0,0 +1,92 @@
+"""
+In-memory result cache
+Adapter layer - Bounded LRU in front of an optional slower tier
+"""
+from collections import OrderedDict
+from typing import Optional
+
+from src.domain.entities import CachedResult
+from src.domain.repositories import EvolutionResultCache
+
+
+class LRUResultCache(EvolutionResultCache):
+    """Least-recently-used cache bounded by `max_entries` and `max_bytes`
+    
+    Entries are immutable pre-serialized payloads, so hits are returned as
+    stored, without copying. Misses fall through to `backing` (e.g.
+    SQLiteResultCache) when given; entries found there are promoted into
+    memory. Writes go to both tiers.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        backing: Optional[EvolutionResultCache] = None
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.backing = backing
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    async def get(self, key: str) -> Optional[CachedResult]:
+        """Cached result for the key, if any"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.backing is not None:
+            entry = await self.backing.get(key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+    
+    async def put(self, key: str, entry: CachedResult) -> None:
+        """Store a completed result under the key"""
+        self._remember(key, entry)
+        if self.backing is not None:
+            await self.backing.put(key, entry)
+    
+    async def discard(self, key: str) -> None:
+        """Forget the key in both tiers"""
+        self._forget(key)
+        if self.backing is not None:
+            await self.backing.discard(key)
+    
+    def _remember(self, key: str, entry: CachedResult) -> None:
+        self._forget(key)
+        if len(entry.payload) > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.bytes_used += len(entry.payload)
+        while len(self._entries) > self.max_entries or self.bytes_used > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes_used -= len(evicted.payload)
+    
+    def _forget(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes_used -= len(entry.payload)
+    
+    def clear(self) -> None:
+        """Drop the memory tier (for testing)"""
+        self._entries.clear()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def close(self) -> None:
+        """Release the backing tier's resources"""
+        if self.backing is not None and hasattr(self.backing, "close"):
+            self.backing.close()
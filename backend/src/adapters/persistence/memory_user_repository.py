@@ -0,0 +1,49 @@
+"""
+In-memory user repository
+Adapter layer - Users indexed by id and by email
+"""
+from typing import Dict, Optional
+
+from src.domain.entities import User
+from src.domain.exceptions import ConflictError
+from src.domain.repositories import UserRepository
+
+
+class InMemoryUserRepository(UserRepository):
+    """Users in process memory, with a dict index on email
+    
+    Not shared between worker processes; use SQLiteUserRepository when
+    running more than one.
+    """
+    
+    def __init__(self):
+        self._users: Dict[str, User] = {}
+        self._by_email: Dict[str, User] = {}
+    
+    async def add(self, user: User) -> None:
+        """Store a new user; raises ConflictError if the email is taken"""
+        if user.email in self._by_email:
+            raise ConflictError("Email already registered")
+        self._users[user.id] = user
+        self._by_email[user.email] = user
+    
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        return self._users.get(user_id)
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email (exact match)"""
+        return self._by_email.get(email)
+    
+    async def increment_token_version(self, user_id: str) -> Optional[int]:
+        """Revoke the user's tokens; the new token_version, or None if no such user"""
+        user = self._users.get(user_id)
+        if user is None:
+            return None
+        user.token_version += 1
+        return user.token_version
+    
+    def clear(self) -> None:
+        """Remove all users (for testing)"""
+        self._users.clear()
+        self._by_email.clear()
@@ -0,0 +1,116 @@
+"""
+Packed final populations
+Adapter layer - Columnar binary storage of a run's final agents
+"""
+import struct
+import uuid
+from typing import List
+
+import numpy as np
+
+from src.domain.entities import Agent, Genome, PopulationPage, TRAIT_NAMES
+
+_MAGIC = b"CDPP"
+_VERSION = 1
+# Agent ids are 16 raw UUID bytes when every id is a UUID, else newline-joined text
+_UUID_IDS = 0x01
+
+# magic, version, flags, agent count
+_HEADER = struct.Struct("<4sBBI")
+
+
+def pack_population(agents: List[Agent]) -> bytes:
+    """Columns of a population: genomes and fitness (float64), generation (int32), ids"""
+    count = len(agents)
+    genomes = np.array([a.genome.to_tuple() for a in agents], dtype="<f8")
+    fitness = np.fromiter((a.fitness for a in agents), dtype="<f8", count=count)
+    generation = np.fromiter((a.generation for a in agents), dtype="<i4", count=count)
+    ids = [a.id for a in agents]
+    try:
+        uuids = [uuid.UUID(agent_id) for agent_id in ids]
+    except ValueError:
+        uuids = None
+    # Only canonical UUID strings survive the round trip through raw bytes
+    if uuids is not None and all(str(u) == agent_id for u, agent_id in zip(uuids, ids)):
+        packed_ids = b"".join(u.bytes for u in uuids)
+        flags = _UUID_IDS
+    else:
+        packed_ids = "\n".join(ids).encode()
+        flags = 0
+    return b"".join((
+        _HEADER.pack(_MAGIC, _VERSION, flags, count),
+        genomes.tobytes(),
+        fitness.tobytes(),
+        generation.tobytes(),
+        packed_ids
+    ))
+
+
+class PackedPopulation:
+    """Read-only view over pack_population() bytes
+    
+    Columns are NumPy views into the buffer; Agent entities are only built
+    for the rows of the requested page.
+    """
+    
+    def __init__(self, data: bytes):
+        view = memoryview(data)
+        magic, version, self._flags, count = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Unsupported population format")
+        traits = len(TRAIT_NAMES)
+        offset = _HEADER.size
+        self.genomes = np.frombuffer(
+            view, dtype="<f8", count=count * traits, offset=offset
+        ).reshape(count, traits)
+        offset += self.genomes.nbytes
+        self.fitness = np.frombuffer(view, dtype="<f8", count=count, offset=offset)
+        offset += self.fitness.nbytes
+        self.generation = np.frombuffer(view, dtype="<i4", count=count, offset=offset)
+        offset += self.generation.nbytes
+        self._ids = view[offset:]
+        self._id_list = None
+        self.nbytes = len(view)
+    
+    def __len__(self) -> int:
+        return self.fitness.shape[0]
+    
+    def _id(self, index: int) -> str:
+        if self._flags & _UUID_IDS:
+            return str(uuid.UUID(bytes=bytes(self._ids[16 * index:16 * (index + 1)])))
+        if self._id_list is None:
+            self._id_list = bytes(self._ids).decode().split("\n")
+        return self._id_list[index]
+    
+    def page(self, limit: int, offset: int = 0, by_fitness: bool = False) -> PopulationPage:
+        """Agents [offset, offset + limit) in stored order, or fittest first
+        
+        By fitness, only the offset + limit best are selected (a partial
+        partition) and sorted; ties keep stored order.
+        """
+        total = len(self)
+        end = min(offset + limit, total)
+        if offset >= end:
+            return PopulationPage(total=total, agents=[])
+        if by_fitness:
+            if end < total:
+                # The end-th best value; of agents tied on it, the first stored win
+                threshold = -np.partition(-self.fitness, end - 1)[end - 1]
+                above = np.flatnonzero(self.fitness > threshold)
+                tied = np.flatnonzero(self.fitness == threshold)[:end - above.size]
+                candidates = np.sort(np.concatenate((above, tied)))
+            else:
+                candidates = np.arange(total)
+            order = candidates[np.argsort(-self.fitness[candidates], kind="stable")]
+            indices = order[offset:end].tolist()
+        else:
+            indices = range(offset, end)
+        return PopulationPage(total=total, agents=[self._agent(i) for i in indices])
+    
+    def _agent(self, index: int) -> Agent:
+        return Agent(
+            id=self._id(index),
+            genome=Genome(*self.genomes[index].tolist()),
+            fitness=float(self.fitness[index]),
+            generation=int(self.generation[index])
+        )
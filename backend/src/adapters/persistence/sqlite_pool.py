@@ -0,0 +1,119 @@
+"""
+SQLite connection pool
+Adapter layer - Persistent, WAL-mode connections with off-loop execution
+"""
+import asyncio
+import itertools
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+_memory_ids = itertools.count()
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of persistent SQLite connections
+    
+    Connections are opened once, switched to WAL journaling and tuned with
+    pragmas, and keep their prepared-statement cache for the life of the
+    pool. Blocking calls are dispatched to a thread pool with one worker per
+    connection, so the event loop never waits on disk I/O and the executor
+    can never queue more work than there are connections.
+    """
+    
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-16000",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA foreign_keys=ON",
+    )
+    
+    def __init__(self, db_path: str, size: int = 4, cached_statements: int = 256):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.db_path = db_path
+        self.size = size
+        self.cached_statements = cached_statements
+        # ':memory:' would give every connection its own database; share one instead
+        if db_path == ":memory:":
+            self._uri = f"file:clawdna-memory-{next(_memory_ids)}?mode=memory&cache=shared"
+        else:
+            self._uri = None
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=size)
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="sqlite")
+        self._closed = False
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a new connection"""
+        if self._uri is not None:
+            conn = sqlite3.connect(
+                self._uri,
+                uri=True,
+                check_same_thread=False,
+                cached_statements=self.cached_statements
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=self.cached_statements
+            )
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.size:
+                conn = self._connect()
+                self._all.append(conn)
+                return conn
+        return self._idle.get()
+    
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of the block"""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+    
+    def _call(self, fn: Callable[..., T], args: tuple) -> T:
+        with self.connection() as conn:
+            return fn(conn, *args)
+    
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(conn, *args) on a pooled connection off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args)
+    
+    def close(self) -> None:
+        """Close all connections and stop the executor"""
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
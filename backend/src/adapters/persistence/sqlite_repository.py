@@ -5,38 +5,323 @@ Adapter layer - Persistent data access implementation
 import json
 import sqlite3
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from src.domain.entities import (
-    Agent, EvolutionResult, EvolutionStatus, GenerationStats, Genome
+    Agent, EvolutionAggregates, EvolutionCheckpoint, EvolutionResult,
+    EvolutionStatus, EvolutionSummary, GenerationStats, Genome, PopulationPage
 )
 from src.domain.repositories import EvolutionRepository
+from .population_codec import PackedPopulation, pack_population
+from .sqlite_pool import SQLiteConnectionPool
+
+# Statements are module constants so every pooled connection reuses its
+# prepared-statement cache instead of re-parsing the SQL on each call.
+_RESULT_COLUMNS = """
+    id, status, parameters, best_agent, best_fitness, generation_count,
+    created_at, completed_at, execution_time_ms, error_message
+"""
+_UPSERT_RESULT = f"""
+    INSERT INTO evolution_results ({_RESULT_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        status = excluded.status,
+        parameters = excluded.parameters,
+        best_agent = excluded.best_agent,
+        best_fitness = excluded.best_fitness,
+        generation_count = excluded.generation_count,
+        created_at = excluded.created_at,
+        completed_at = excluded.completed_at,
+        execution_time_ms = excluded.execution_time_ms,
+        error_message = excluded.error_message
+"""
+_SELECT_RESULT = f"SELECT {_RESULT_COLUMNS} FROM evolution_results WHERE id = ?"
+_SELECT_PAGE = f"""
+    SELECT {_RESULT_COLUMNS} FROM evolution_results
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+_DELETE_RESULT = "DELETE FROM evolution_results WHERE id = ?"
+
+_GENERATION_COLUMNS = """
+    result_id, generation_number, avg_fitness, max_fitness, min_fitness,
+    diversity_score, population_size, timestamp, pairwise_distance
+"""
+_INSERT_GENERATION = f"""
+    INSERT INTO generation_stats ({_GENERATION_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SELECT_GENERATIONS = f"""
+    SELECT {_GENERATION_COLUMNS} FROM generation_stats
+    WHERE result_id = ?
+    ORDER BY generation_number
+"""
+_DELETE_GENERATIONS = "DELETE FROM generation_stats WHERE result_id = ?"
+_DELETE_GENERATIONS_AFTER = """
+    DELETE FROM generation_stats WHERE result_id = ? AND generation_number > ?
+"""
+_SELECT_LAST_GENERATION = """
+    SELECT COALESCE(MAX(generation_number), 0) FROM generation_stats WHERE result_id = ?
+"""
+
+_UPSERT_CHECKPOINT = """
+    INSERT INTO evolution_checkpoints (result_id, generation, state, created_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (result_id) DO UPDATE SET
+        generation = excluded.generation,
+        state = excluded.state,
+        created_at = excluded.created_at
+"""
+_SELECT_CHECKPOINT = """
+    SELECT generation, state, created_at FROM evolution_checkpoints WHERE result_id = ?
+"""
+_DELETE_CHECKPOINT = "DELETE FROM evolution_checkpoints WHERE result_id = ?"
+
+_UPSERT_POPULATION = """
+    INSERT INTO final_populations (result_id, agent_count, data) VALUES (?, ?, ?)
+    ON CONFLICT (result_id) DO UPDATE SET
+        agent_count = excluded.agent_count,
+        data = excluded.data
+"""
+_SELECT_POPULATION = """
+    SELECT p.data FROM evolution_results r
+    LEFT JOIN final_populations p ON p.result_id = r.id
+    WHERE r.id = ?
+"""
+_DELETE_POPULATION = "DELETE FROM final_populations WHERE result_id = ?"
+
+_SELECT_BEST_FITNESS = "SELECT best_fitness FROM evolution_results WHERE id = ?"
+_UPDATE_AGGREGATES = """
+    UPDATE evolution_aggregates SET
+        total_count = total_count + ?,
+        fitness_sum = fitness_sum + ?,
+        fitness_count = fitness_count + ?,
+        best_fitness = CASE
+            WHEN ? IS NOT NULL AND (best_fitness IS NULL OR ? > best_fitness) THEN ?
+            ELSE best_fitness
+        END
+    WHERE id = 1
+"""
+_RECOMPUTE_BEST_FITNESS = """
+    UPDATE evolution_aggregates
+    SET best_fitness = (SELECT MAX(best_fitness) FROM evolution_results)
+    WHERE id = 1
+"""
+_SELECT_AGGREGATES = """
+    SELECT total_count, fitness_sum, fitness_count, best_fitness
+    FROM evolution_aggregates WHERE id = 1
+"""
+_SELECT_RECENT = """
+    SELECT id, generation_count, best_fitness, created_at
+    FROM evolution_results
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+
+def _create_legacy_schema(conn: sqlite3.Connection) -> None:
+    """v1: one row per result, generation history as a JSON blob"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS evolution_results (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            parameters TEXT NOT NULL,
+            generations TEXT NOT NULL,
+            best_agent TEXT,
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            execution_time_ms INTEGER,
+            error_message TEXT
+        )
+    """)
+
+
+def _normalize_generations(conn: sqlite3.Connection) -> None:
+    """v2: move generation history into generation_stats, keep a summary on the result row"""
+    conn.execute("""
+        CREATE TABLE generation_stats (
+            result_id TEXT NOT NULL
+                REFERENCES evolution_results (id) ON DELETE CASCADE,
+            generation_number INTEGER NOT NULL,
+            avg_fitness REAL NOT NULL,
+            max_fitness REAL NOT NULL,
+            min_fitness REAL NOT NULL,
+            diversity_score REAL NOT NULL,
+            population_size INTEGER NOT NULL,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY (result_id, generation_number)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        CREATE TABLE evolution_results_v2 (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            parameters TEXT NOT NULL,
+            best_agent TEXT,
+            best_fitness REAL,
+            generation_count INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            execution_time_ms INTEGER,
+            error_message TEXT
+        )
+    """)
+    
+    legacy_rows = conn.execute("""
+        SELECT id, status, parameters, generations, best_agent,
+               created_at, completed_at, execution_time_ms, error_message
+        FROM evolution_results
+    """)
+    for row in legacy_rows.fetchall():
+        generations = json.loads(row[3])
+        best_agent = json.loads(row[4]) if row[4] else None
+        conn.execute(
+            f"INSERT INTO evolution_results_v2 ({_RESULT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                row[0], row[1], row[2], row[4],
+                best_agent["fitness"] if best_agent else None,
+                len(generations),
+                row[5], row[6], row[7], row[8]
+            )
+        )
+        # Columns as of v2; later migrations add to generation_stats
+        conn.executemany("""
+            INSERT INTO generation_stats (
+                result_id, generation_number, avg_fitness, max_fitness, min_fitness,
+                diversity_score, population_size, timestamp
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                row[0],
+                g["generation_number"],
+                g["avg_fitness"],
+                g["max_fitness"],
+                g["min_fitness"],
+                g["diversity_score"],
+                g["population_size"],
+                g["timestamp"]
+            )
+            for g in generations
+        ])
+    
+    conn.execute("DROP TABLE evolution_results")
+    conn.execute("ALTER TABLE evolution_results_v2 RENAME TO evolution_results")
+    conn.execute("""
+        CREATE INDEX idx_evolution_results_created_at
+        ON evolution_results (created_at DESC)
+    """)
+    conn.execute("""
+        CREATE INDEX idx_evolution_results_best_fitness
+        ON evolution_results (best_fitness DESC)
+    """)
+
+
+def _create_aggregates(conn: sqlite3.Connection) -> None:
+    """v3: single-row running totals maintained by save/delete"""
+    conn.execute("""
+        CREATE TABLE evolution_aggregates (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_count INTEGER NOT NULL,
+            fitness_sum REAL NOT NULL,
+            fitness_count INTEGER NOT NULL,
+            best_fitness REAL
+        )
+    """)
+    conn.execute("""
+        INSERT INTO evolution_aggregates
+        SELECT 1, COUNT(*), COALESCE(SUM(best_fitness), 0.0),
+               COUNT(best_fitness), MAX(best_fitness)
+        FROM evolution_results
+    """)
+
+
+def _add_pairwise_distance(conn: sqlite3.Connection) -> None:
+    """v4: per-generation mean pairwise distance (NULL for older runs)"""
+    conn.execute("ALTER TABLE generation_stats ADD COLUMN pairwise_distance REAL")
+
+
+def _create_checkpoints(conn: sqlite3.Connection) -> None:
+    """v5: latest resumable checkpoint per result, as a binary blob"""
+    conn.execute("""
+        CREATE TABLE evolution_checkpoints (
+            result_id TEXT PRIMARY KEY
+                REFERENCES evolution_results (id) ON DELETE CASCADE,
+            generation INTEGER NOT NULL,
+            state BLOB NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    """)
+
+
+def _create_final_populations(conn: sqlite3.Connection) -> None:
+    """v6: final population per result, packed column-wise into one blob"""
+    conn.execute("""
+        CREATE TABLE final_populations (
+            result_id TEXT PRIMARY KEY
+                REFERENCES evolution_results (id) ON DELETE CASCADE,
+            agent_count INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+    """)
+
+
+# Schema migrations, applied in order; PRAGMA user_version records progress
+_MIGRATIONS = (
+    _create_legacy_schema,
+    _normalize_generations,
+    _create_aggregates,
+    _add_pairwise_distance,
+    _create_checkpoints,
+    _create_final_populations,
+)
 
 
 class SQLiteEvolutionRepository(EvolutionRepository):
     """SQLite implementation of evolution repository"""
     
-    def __init__(self, db_path: str = "clawdna.db"):
+    def __init__(self, db_path: str = "clawdna.db", pool_size: int = 4):
         self.db_path = db_path
+        self._pool = SQLiteConnectionPool(db_path, size=pool_size)
         self._init_db()
     
     def _init_db(self) -> None:
-        """Initialize database schema"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS evolution_results (
-                    id TEXT PRIMARY KEY,
-                    status TEXT NOT NULL,
-                    parameters TEXT NOT NULL,
-                    generations TEXT NOT NULL,
-                    best_agent TEXT,
-                    created_at TEXT NOT NULL,
-                    completed_at TEXT,
-                    execution_time_ms INTEGER,
-                    error_message TEXT
-                )
-            """)
-            conn.commit()
+        """Initialize database schema, migrating older layouts in place"""
+        with self._pool.connection() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(_MIGRATIONS):
+                return
+            
+            # Table rebuilds must not cascade deletes into child tables
+            conn.execute("PRAGMA foreign_keys=OFF")
+            conn.isolation_level = None
+            try:
+                for number, migration in enumerate(_MIGRATIONS[version:], start=version + 1):
+                    # Explicit transaction so DDL and data moves commit atomically
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        migration(conn)
+                        conn.execute(f"PRAGMA user_version = {number}")
+                        conn.execute("COMMIT")
+                    except Exception:
+                        conn.execute("ROLLBACK")
+                        raise
+            finally:
+                conn.isolation_level = ""
+                conn.execute("PRAGMA foreign_keys=ON")
+    
+    @property
+    def schema_version(self) -> int:
+        """Current PRAGMA user_version of the database"""
+        with self._pool.connection() as conn:
+            return conn.execute("PRAGMA user_version").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close pooled connections"""
+        self._pool.close()
+    
+    async def ping(self) -> None:
+        """Round-trip a trivial query through the pool"""
+        await self._pool.run(lambda conn: conn.execute("SELECT 1").fetchone())
     
     def _serialize_agent(self, agent: Optional[Agent]) -> Optional[str]:
         """Serialize agent to JSON string"""
@@ -61,100 +346,271 @@ class SQLiteEvolutionRepository(EvolutionRepository):
             generation=parsed["generation"]
         )
     
-    def _serialize_generations(self, generations: List[GenerationStats]) -> str:
-        """Serialize generations to JSON string"""
-        return json.dumps([g.to_dict() for g in generations])
-    
-    def _deserialize_generations(self, data: str) -> List[GenerationStats]:
-        """Deserialize generations from JSON string"""
-        parsed_list = json.loads(data)
-        generations = []
-        for parsed in parsed_list:
-            generations.append(GenerationStats(
-                generation_number=parsed["generation_number"],
-                avg_fitness=parsed["avg_fitness"],
-                max_fitness=parsed["max_fitness"],
-                min_fitness=parsed["min_fitness"],
-                diversity_score=parsed["diversity_score"],
-                population_size=parsed["population_size"],
-                timestamp=datetime.fromisoformat(parsed["timestamp"])
-            ))
-        return generations
+    def _generation_rows(self, result: EvolutionResult, after: int = 0) -> List[tuple]:
+        """Rows for generation_stats, for generations numbered above `after`"""
+        return [
+            (
+                result.id,
+                g.generation_number,
+                g.avg_fitness,
+                g.max_fitness,
+                g.min_fitness,
+                g.diversity_score,
+                g.population_size,
+                g.timestamp.isoformat(),
+                g.pairwise_distance
+            )
+            for g in result.generations
+            if g.generation_number > after
+        ]
+    
+    def _row_to_generation(self, row) -> GenerationStats:
+        """Convert generation_stats row to GenerationStats"""
+        return GenerationStats(
+            generation_number=row[1],
+            avg_fitness=row[2],
+            max_fitness=row[3],
+            min_fitness=row[4],
+            diversity_score=row[5],
+            population_size=row[6],
+            timestamp=datetime.fromisoformat(row[7]),
+            pairwise_distance=row[8]
+        )
+    
+    def _load_generations(
+        self, conn: sqlite3.Connection, result_ids: Sequence[str]
+    ) -> Dict[str, List[GenerationStats]]:
+        """Load full generation history for several results in one query"""
+        if len(result_ids) == 1:
+            rows = conn.execute(_SELECT_GENERATIONS, (result_ids[0],)).fetchall()
+        else:
+            placeholders = ", ".join("?" * len(result_ids))
+            rows = conn.execute(
+                f"""
+                SELECT {_GENERATION_COLUMNS} FROM generation_stats
+                WHERE result_id IN ({placeholders})
+                ORDER BY result_id, generation_number
+                """,
+                tuple(result_ids)
+            ).fetchall()
+        
+        history: Dict[str, List[GenerationStats]] = {result_id: [] for result_id in result_ids}
+        for row in rows:
+            history[row[0]].append(self._row_to_generation(row))
+        return history
     
     async def save(self, result: EvolutionResult) -> None:
         """Save an evolution result"""
-        with sqlite3.connect(self.db_path) as conn:
+        await self._pool.run(self._save, result)
+    
+    def _save(self, conn: sqlite3.Connection, result: EvolutionResult) -> None:
+        # Packed outside the write lock; an empty list leaves a stored population alone
+        population = pack_population(result.final_population) if result.final_population else None
+        fitness = result.best_agent.fitness if result.best_agent else None
+        with conn:
+            # Write lock up front so the aggregate read-modify-write is atomic
+            conn.execute("BEGIN IMMEDIATE")
+            previous = conn.execute(_SELECT_BEST_FITNESS, (result.id,)).fetchone()
             conn.execute(
-                """
-                INSERT OR REPLACE INTO evolution_results (
-                    id, status, parameters, generations, best_agent,
-                    created_at, completed_at, execution_time_ms, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _UPSERT_RESULT,
                 (
                     result.id,
                     result.status.value,
                     json.dumps(result.parameters),
-                    self._serialize_generations(result.generations),
                     self._serialize_agent(result.best_agent),
+                    fitness,
+                    result.total_generations,
                     result.created_at.isoformat(),
                     result.completed_at.isoformat() if result.completed_at else None,
                     result.execution_time_ms,
                     result.error_message
                 )
             )
-            conn.commit()
+            if result.generations or not result.generation_count:
+                # History only grows, so re-saves (e.g. between checkpoint
+                # segments) write just the generations added since the last one
+                stored = conn.execute(_SELECT_LAST_GENERATION, (result.id,)).fetchone()[0]
+                last = result.generations[-1].generation_number if result.generations else 0
+                conn.execute(_DELETE_GENERATIONS_AFTER, (result.id, last))
+                conn.executemany(_INSERT_GENERATION, self._generation_rows(result, after=stored))
+            if population is not None:
+                conn.execute(
+                    _UPSERT_POPULATION, (result.id, len(result.final_population), population)
+                )
+            self._update_aggregates(
+                conn,
+                added=previous is None,
+                removed_fitness=previous[0] if previous else None,
+                added_fitness=fitness
+            )
     
-    async def get_by_id(self, result_id: str) -> Optional[EvolutionResult]:
-        """Get evolution result by ID"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT * FROM evolution_results WHERE id = ?",
-                (result_id,)
+    def _update_aggregates(
+        self,
+        conn: sqlite3.Connection,
+        added: bool,
+        removed_fitness: Optional[float],
+        added_fitness: Optional[float],
+        removed: bool = False
+    ) -> None:
+        """Apply one save/delete to evolution_aggregates (inside its transaction)"""
+        fitness_delta = (added_fitness or 0.0) - (removed_fitness or 0.0)
+        count_delta = (added_fitness is not None) - (removed_fitness is not None)
+        conn.execute(
+            _UPDATE_AGGREGATES,
+            (
+                int(added) - int(removed),
+                fitness_delta,
+                count_delta,
+                added_fitness, added_fitness, added_fitness
             )
-            row = cursor.fetchone()
-            
-            if row is None:
-                return None
-            
-            return self._row_to_result(row)
+        )
+        if removed_fitness is not None and (added_fitness is None or added_fitness < removed_fitness):
+            # The previous best may be gone; the best_fitness index makes this a seek
+            best = conn.execute("SELECT best_fitness FROM evolution_aggregates WHERE id = 1").fetchone()[0]
+            if best is None or removed_fitness >= best:
+                conn.execute(_RECOMPUTE_BEST_FITNESS)
+    
+    async def get_by_id(
+        self, result_id: str, include_generations: bool = True
+    ) -> Optional[EvolutionResult]:
+        """Get evolution result by ID"""
+        return await self._pool.run(self._get_by_id, result_id, include_generations)
+    
+    def _get_by_id(
+        self, conn: sqlite3.Connection, result_id: str, include_generations: bool
+    ) -> Optional[EvolutionResult]:
+        row = conn.execute(_SELECT_RESULT, (result_id,)).fetchone()
+        if row is None:
+            return None
+        result = self._row_to_result(row)
+        if include_generations:
+            result.generations = self._load_generations(conn, [result_id])[result_id]
+        return result
     
-    async def list_all(self, limit: int = 100, offset: int = 0) -> List[EvolutionResult]:
+    async def list_all(
+        self, limit: int = 100, offset: int = 0, include_generations: bool = True
+    ) -> List[EvolutionResult]:
         """List all evolution results with pagination"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                """
-                SELECT * FROM evolution_results 
-                ORDER BY created_at DESC 
-                LIMIT ? OFFSET ?
-                """,
-                (limit, offset)
-            )
-            rows = cursor.fetchall()
-            
-            return [self._row_to_result(row) for row in rows]
+        return await self._pool.run(self._list_all, limit, offset, include_generations)
+    
+    def _list_all(
+        self, conn: sqlite3.Connection, limit: int, offset: int, include_generations: bool
+    ) -> List[EvolutionResult]:
+        rows = conn.execute(_SELECT_PAGE, (limit, offset)).fetchall()
+        results = [self._row_to_result(row) for row in rows]
+        if include_generations and results:
+            history = self._load_generations(conn, [r.id for r in results])
+            for result in results:
+                result.generations = history[result.id]
+        return results
     
     async def delete(self, result_id: str) -> bool:
         """Delete an evolution result"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "DELETE FROM evolution_results WHERE id = ?",
-                (result_id,)
+        return await self._pool.run(self._delete, result_id)
+    
+    def _delete(self, conn: sqlite3.Connection, result_id: str) -> bool:
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            previous = conn.execute(_SELECT_BEST_FITNESS, (result_id,)).fetchone()
+            if previous is None:
+                return False
+            conn.execute(_DELETE_GENERATIONS, (result_id,))
+            conn.execute(_DELETE_CHECKPOINT, (result_id,))
+            conn.execute(_DELETE_POPULATION, (result_id,))
+            conn.execute(_DELETE_RESULT, (result_id,))
+            self._update_aggregates(
+                conn,
+                added=False,
+                removed_fitness=previous[0],
+                added_fitness=None,
+                removed=True
+            )
+        return True
+    
+    async def get_aggregates(self, recent: int = 10) -> EvolutionAggregates:
+        """Running totals maintained by save/delete, plus the newest results"""
+        return await self._pool.run(self._get_aggregates, recent)
+    
+    def _get_aggregates(self, conn: sqlite3.Connection, recent: int) -> EvolutionAggregates:
+        total_count, fitness_sum, fitness_count, best_fitness = conn.execute(
+            _SELECT_AGGREGATES
+        ).fetchone()
+        # Walks the created_at index; touches `recent` rows, never the history table
+        rows = conn.execute(_SELECT_RECENT, (recent,)).fetchall()
+        return EvolutionAggregates(
+            total_count=total_count,
+            fitness_sum=fitness_sum,
+            fitness_count=fitness_count,
+            best_fitness=best_fitness,
+            recent=[
+                EvolutionSummary(
+                    id=row[0],
+                    generation_count=row[1],
+                    best_fitness=row[2],
+                    created_at=datetime.fromisoformat(row[3])
+                )
+                for row in rows
+            ]
+        )
+    
+    async def get_population(
+        self, result_id: str, limit: int = 100, offset: int = 0, by_fitness: bool = False
+    ) -> Optional[PopulationPage]:
+        """A page of the result's final population"""
+        return await self._pool.run(self._get_population, result_id, limit, offset, by_fitness)
+    
+    def _get_population(
+        self, conn: sqlite3.Connection, result_id: str, limit: int, offset: int, by_fitness: bool
+    ) -> Optional[PopulationPage]:
+        row = conn.execute(_SELECT_POPULATION, (result_id,)).fetchone()
+        if row is None:
+            return None
+        if row[0] is None:
+            return PopulationPage(total=0)
+        return PackedPopulation(row[0]).page(limit, offset, by_fitness)
+    
+    async def save_checkpoint(self, checkpoint: EvolutionCheckpoint) -> None:
+        """Store a checkpoint, replacing the result's previous one"""
+        await self._pool.run(self._save_checkpoint, checkpoint)
+    
+    def _save_checkpoint(self, conn: sqlite3.Connection, checkpoint: EvolutionCheckpoint) -> None:
+        with conn:
+            conn.execute(
+                _UPSERT_CHECKPOINT,
+                (
+                    checkpoint.result_id,
+                    checkpoint.generation,
+                    checkpoint.state,
+                    checkpoint.created_at.isoformat()
+                )
             )
-            conn.commit()
-            return cursor.rowcount > 0
+    
+    async def get_checkpoint(self, result_id: str) -> Optional[EvolutionCheckpoint]:
+        """Latest checkpoint of a result"""
+        return await self._pool.run(self._get_checkpoint, result_id)
+    
+    def _get_checkpoint(self, conn: sqlite3.Connection, result_id: str) -> Optional[EvolutionCheckpoint]:
+        row = conn.execute(_SELECT_CHECKPOINT, (result_id,)).fetchone()
+        if row is None:
+            return None
+        return EvolutionCheckpoint(
+            result_id=result_id,
+            generation=row[0],
+            state=bytes(row[1]),
+            created_at=datetime.fromisoformat(row[2])
+        )
     
     def _row_to_result(self, row) -> EvolutionResult:
-        """Convert database row to EvolutionResult"""
+        """Convert evolution_results row to a summary EvolutionResult (no history)"""
         return EvolutionResult(
             id=row[0],
             status=EvolutionStatus(row[1]),
             parameters=json.loads(row[2]),
-            generations=self._deserialize_generations(row[3]),
-            best_agent=self._deserialize_agent(row[4]),
-            created_at=datetime.fromisoformat(row[5]),
-            completed_at=datetime.fromisoformat(row[6]) if row[6] else None,
-            execution_time_ms=row[7],
-            error_message=row[8],
+            best_agent=self._deserialize_agent(row[3]),
+            generation_count=row[5],
+            created_at=datetime.fromisoformat(row[6]),
+            completed_at=datetime.fromisoformat(row[7]) if row[7] else None,
+            execution_time_ms=row[8],
+            error_message=row[9],
             final_population=[]
         )
@@ -0,0 +1,79 @@
+"""
+SQLite result cache
+Adapter layer - Persistent second tier for cached evolution results
+"""
+import sqlite3
+import time
+from typing import Optional, Tuple
+
+from src.domain.entities import CachedResult
+from src.domain.repositories import EvolutionResultCache
+from .sqlite_pool import SQLiteConnectionPool
+
+# Superseded table of pickled results
+_DROP_LEGACY_TABLE = "DROP TABLE IF EXISTS result_cache"
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS result_cache_entries (
+        key TEXT PRIMARY KEY,
+        result_id TEXT NOT NULL,
+        payload BLOB NOT NULL,
+        stored_at REAL NOT NULL
+    )
+"""
+_CREATE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_result_cache_entries_stored_at ON result_cache_entries (stored_at)"
+)
+_SELECT_ENTRY = "SELECT result_id, payload FROM result_cache_entries WHERE key = ?"
+_UPSERT_ENTRY = """
+    INSERT INTO result_cache_entries (key, result_id, payload, stored_at) VALUES (?, ?, ?, ?)
+    ON CONFLICT (key) DO UPDATE SET
+        result_id = excluded.result_id, payload = excluded.payload, stored_at = excluded.stored_at
+"""
+_DELETE_ENTRY = "DELETE FROM result_cache_entries WHERE key = ?"
+_EVICT_OLDEST = """
+    DELETE FROM result_cache_entries WHERE key IN (
+        SELECT key FROM result_cache_entries ORDER BY stored_at DESC LIMIT -1 OFFSET ?
+    )
+"""
+
+
+class SQLiteResultCache(EvolutionResultCache):
+    """Serialized results in a SQLite table, oldest evicted past `max_entries`"""
+    
+    def __init__(self, db_path: str, max_entries: int = 10_000, pool_size: int = 2):
+        self.max_entries = max_entries
+        self._pool = SQLiteConnectionPool(db_path, size=pool_size)
+        with self._pool.connection() as conn:
+            with conn:
+                conn.execute(_DROP_LEGACY_TABLE)
+                conn.execute(_CREATE_TABLE)
+                conn.execute(_CREATE_INDEX)
+    
+    def close(self) -> None:
+        """Close pooled connections"""
+        self._pool.close()
+    
+    async def get(self, key: str) -> Optional[CachedResult]:
+        """Cached result for the key, if any"""
+        row = await self._pool.run(self._get, key)
+        return CachedResult(result_id=row[0], payload=bytes(row[1])) if row else None
+    
+    def _get(self, conn: sqlite3.Connection, key: str) -> Optional[Tuple[str, bytes]]:
+        return conn.execute(_SELECT_ENTRY, (key,)).fetchone()
+    
+    async def put(self, key: str, entry: CachedResult) -> None:
+        """Store a completed result under the key"""
+        await self._pool.run(self._put, key, entry)
+    
+    def _put(self, conn: sqlite3.Connection, key: str, entry: CachedResult) -> None:
+        with conn:
+            conn.execute(_UPSERT_ENTRY, (key, entry.result_id, entry.payload, time.time()))
+            conn.execute(_EVICT_OLDEST, (self.max_entries,))
+    
+    async def discard(self, key: str) -> None:
+        """Forget the key"""
+        await self._pool.run(self._discard, key)
+    
+    def _discard(self, conn: sqlite3.Connection, key: str) -> None:
+        with conn:
+            conn.execute(_DELETE_ENTRY, (key,))
@@ -0,0 +1,108 @@
+"""
+SQLite user repository
+Adapter layer - Users shared by every worker through one database file
+"""
+import sqlite3
+from datetime import datetime
+from typing import Optional
+
+from src.domain.entities import User
+from src.domain.exceptions import ConflictError
+from src.domain.repositories import UserRepository
+from .sqlite_pool import SQLiteConnectionPool
+
+_USER_COLUMNS = "id, email, name, hashed_password, created_at, is_active, token_version"
+_CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS users (
+        id TEXT PRIMARY KEY,
+        email TEXT NOT NULL,
+        name TEXT NOT NULL,
+        hashed_password TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        is_active INTEGER NOT NULL DEFAULT 1,
+        token_version INTEGER NOT NULL DEFAULT 0
+    )
+"""
+_CREATE_EMAIL_INDEX = "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users (email)"
+# Tables created before token versioning
+_ADD_TOKEN_VERSION = "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"
+_INSERT_USER = f"INSERT INTO users ({_USER_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+_SELECT_BY_ID = f"SELECT {_USER_COLUMNS} FROM users WHERE id = ?"
+_SELECT_BY_EMAIL = f"SELECT {_USER_COLUMNS} FROM users WHERE email = ?"
+_INCREMENT_TOKEN_VERSION = """
+    UPDATE users SET token_version = token_version + 1 WHERE id = ? RETURNING token_version
+"""
+
+
+class SQLiteUserRepository(UserRepository):
+    """Users in a SQLite table with a unique index on email
+    
+    The index makes email lookups O(log n) and lets concurrent registrations
+    from different workers race safely: the loser gets a ConflictError.
+    """
+    
+    def __init__(self, db_path: str = "clawdna.db", pool_size: int = 2):
+        self.db_path = db_path
+        self._pool = SQLiteConnectionPool(db_path, size=pool_size)
+        with self._pool.connection() as conn:
+            with conn:
+                conn.execute(_CREATE_TABLE)
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(users)")}
+                if "token_version" not in columns:
+                    conn.execute(_ADD_TOKEN_VERSION)
+                conn.execute(_CREATE_EMAIL_INDEX)
+    
+    def close(self) -> None:
+        """Close pooled connections"""
+        self._pool.close()
+    
+    async def add(self, user: User) -> None:
+        """Store a new user; raises ConflictError if the email is taken"""
+        await self._pool.run(self._add, user)
+    
+    def _add(self, conn: sqlite3.Connection, user: User) -> None:
+        try:
+            with conn:
+                conn.execute(_INSERT_USER, (
+                    user.id,
+                    user.email,
+                    user.name,
+                    user.hashed_password,
+                    user.created_at.isoformat(),
+                    int(user.is_active),
+                    user.token_version
+                ))
+        except sqlite3.IntegrityError:
+            raise ConflictError("Email already registered") from None
+    
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        return await self._pool.run(self._select, _SELECT_BY_ID, user_id)
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email (exact match)"""
+        return await self._pool.run(self._select, _SELECT_BY_EMAIL, email)
+    
+    async def increment_token_version(self, user_id: str) -> Optional[int]:
+        """Revoke the user's tokens; the new token_version, or None if no such user"""
+        return await self._pool.run(self._increment_token_version, user_id)
+    
+    def _increment_token_version(self, conn: sqlite3.Connection, user_id: str) -> Optional[int]:
+        # Atomic in SQL, so concurrent logouts from different workers both count
+        with conn:
+            row = conn.execute(_INCREMENT_TOKEN_VERSION, (user_id,)).fetchone()
+        return row[0] if row else None
+    
+    def _select(self, conn: sqlite3.Connection, statement: str, key: str) -> Optional[User]:
+        row = conn.execute(statement, (key,)).fetchone()
+        if row is None:
+            return None
+        return User(
+            id=row[0],
+            email=row[1],
+            name=row[2],
+            hashed_password=row[3],
+            created_at=datetime.fromisoformat(row[4]),
+            is_active=bool(row[5]),
+            token_version=row[6]
+        )
@@ -0,0 +1,101 @@
+"""
+On-chain account decoding
+Adapter layer - Borsh layout of the ClawDNA program's AgentData accounts
+"""
+import base64
+import hashlib
+import struct
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Mirrors TRAIT_COUNT in clawdna/programs/clawdna/src/lib.rs
+TRAIT_COUNT = 8
+
+# Anchor account discriminator: first 8 bytes of sha256("account:<Name>")
+AGENT_DATA_DISCRIMINATOR = hashlib.sha256(b"account:AgentData").digest()[:8]
+
+# discriminator, mint, genome, generation, parents, created_at, name length
+# (Borsh is little-endian and unpadded)
+_AGENT_HEADER = struct.Struct(f"<8s32s{TRAIT_COUNT}sH32s32sqI")
+# Byte offset of the mint, for getProgramAccounts memcmp filters
+AGENT_MINT_OFFSET = 8
+
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+@lru_cache(maxsize=4096)
+def b58encode(data: bytes) -> str:
+    """Base58 (Bitcoin alphabet), the text form of Solana public keys
+    
+    Cached: bulk loads see the same parents over and over.
+    """
+    number = int.from_bytes(data, "big")
+    digits = []
+    while number:
+        number, remainder = divmod(number, 58)
+        digits.append(_BASE58_ALPHABET[remainder])
+    leading_zeros = len(data) - len(data.lstrip(b"\0"))
+    return "1" * leading_zeros + "".join(reversed(digits))
+
+
+@dataclass(frozen=True, slots=True)
+class AgentAccount:
+    """Decoded AgentData account"""
+    mint: str
+    genome: Tuple[int, ...]
+    generation: int
+    parents: Tuple[str, str]
+    created_at: int
+    name: str
+    bump: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mint": self.mint,
+            "genome": list(self.genome),
+            "generation": self.generation,
+            "parents": list(self.parents),
+            "created_at": datetime.fromtimestamp(self.created_at, timezone.utc).isoformat(),
+            "name": self.name,
+            "bump": self.bump
+        }
+
+
+def decode_agent_data(data: Union[bytes, bytearray, memoryview]) -> AgentAccount:
+    """Decode an AgentData account, reading fields in place from the buffer
+    
+    Raises ValueError for other account types and truncated data. Trailing
+    bytes (accounts are allocated for the longest name) are ignored.
+    """
+    view = memoryview(data)
+    if len(view) < _AGENT_HEADER.size + 1:
+        raise ValueError("Account data too short for AgentData")
+    (
+        discriminator, mint, genome, generation, parent1, parent2, created_at, name_length
+    ) = _AGENT_HEADER.unpack_from(view)
+    if discriminator != AGENT_DATA_DISCRIMINATOR:
+        raise ValueError("Not an AgentData account")
+    name_end = _AGENT_HEADER.size + name_length
+    if name_end + 1 > len(view):
+        raise ValueError("AgentData name overruns the account")
+    return AgentAccount(
+        mint=b58encode(mint),
+        genome=tuple(genome),
+        generation=generation,
+        parents=(b58encode(parent1), b58encode(parent2)),
+        created_at=created_at,
+        name=str(view[_AGENT_HEADER.size:name_end], "utf-8"),
+        bump=view[name_end]
+    )
+
+
+def decode_agent_account(account: Optional[Dict[str, Any]]) -> Optional[AgentAccount]:
+    """AgentData from an RPC account object with base64 data, or None if it is not one"""
+    if not account or not account.get("data"):
+        return None
+    try:
+        return decode_agent_data(base64.b64decode(account["data"][0]))
+    except ValueError:
+        return None
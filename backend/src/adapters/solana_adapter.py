@@ -4,22 +4,58 @@ Integração com a Solana para leitura de dados on-chain
 """
 import os
 import asyncio
-from typing import Optional, Dict, Any, List
+import itertools
+import time
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 import aiohttp
 
+from src.adapters.metrics import observe_solana_rpc
+from src.adapters.solana_accounts import (
+    AGENT_DATA_DISCRIMINATOR, AGENT_MINT_OFFSET, AgentAccount, b58encode, decode_agent_account
+)
+
+# One JSON-RPC call: method and params
+RpcCall = Tuple[str, Optional[list]]
+
 
 class SolanaAdapter:
-    """Adapter para comunicação com Solana RPC"""
+    """Adapter para comunicação com Solana RPC
+    
+    All calls share one session whose connector keeps connections alive and
+    caches DNS. Request ids are unique per adapter, so batched responses are
+    matched to their calls by id rather than by position.
+    """
+    
+    # Connector tuning: total and per-host connection caps, DNS cache and keep-alive (seconds)
+    CONNECTION_LIMIT = 64
+    CONNECTION_LIMIT_PER_HOST = 32
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
+    REQUEST_TIMEOUT = 10
+    # Calls per batch POST; public RPC nodes reject larger batches
+    MAX_BATCH_SIZE = 100
+    # Accounts per getMultipleAccounts call (the RPC's limit)
+    MAX_MULTIPLE_ACCOUNTS = 100
     
     def __init__(self, rpc_url: Optional[str] = None, program_id: Optional[str] = None):
         self.rpc_url = rpc_url or os.getenv("SOLANA_RPC_URL", "https://api.devnet.solana.com")
         self.program_id = program_id or os.getenv("CLAWDNA_PROGRAM_ID")
         self._session: Optional[aiohttp.ClientSession] = None
+        self._ids = itertools.count(1)
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
+        """Get or create the pooled aiohttp session"""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=self.CONNECTION_LIMIT,
+                limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+            )
         return self._session
     
     async def close(self):
@@ -27,32 +63,70 @@ class SolanaAdapter:
         if self._session and not self._session.closed:
             await self._session.close()
     
-    async def _rpc_call(self, method: str, params: list = None) -> Dict[str, Any]:
-        """Make RPC call to Solana"""
-        session = await self._get_session()
-        
-        payload = {
+    def _request(self, method: str, params: Optional[list]) -> Dict[str, Any]:
+        return {
             "jsonrpc": "2.0",
-            "id": 1,
+            "id": next(self._ids),
             "method": method,
             "params": params or []
         }
-        
+    
+    async def _post(self, payload: Any, label: str) -> Tuple[Any, Optional[str]]:
+        """POST a request or batch; the decoded body, or an error message"""
+        session = await self._get_session()
+        start = time.perf_counter()
+        outcome = "error"
         try:
-            async with session.post(self.rpc_url, json=payload, timeout=10) as response:
+            async with session.post(self.rpc_url, json=payload) as response:
                 if response.status == 200:
-                    return await response.json()
+                    body = await response.json()
+                    outcome = "rpc_error" if isinstance(body, dict) and "error" in body else "ok"
+                    return body, None
                 else:
-                    return {"error": f"HTTP {response.status}"}
+                    outcome = f"http_{response.status}"
+                    return None, f"HTTP {response.status}"
         except asyncio.TimeoutError:
-            return {"error": "Timeout"}
+            outcome = "timeout"
+            return None, "Timeout"
         except Exception as e:
-            return {"error": str(e)}
+            return None, str(e)
+        finally:
+            observe_solana_rpc(label, outcome, time.perf_counter() - start)
     
-    async def get_health(self) -> Dict[str, Any]:
-        """Get Solana RPC health status"""
-        result = await self._rpc_call("getHealth")
+    async def _rpc_call(self, method: str, params: list = None) -> Dict[str, Any]:
+        """Make RPC call to Solana"""
+        body, error = await self._post(self._request(method, params), method)
+        if error is not None:
+            return {"error": error}
+        return body
+    
+    async def rpc_batch(self, calls: Sequence[RpcCall]) -> List[Dict[str, Any]]:
+        """Several calls pipelined as JSON-RPC batches; responses in call order
         
+        Calls are split into batches of MAX_BATCH_SIZE, POSTed concurrently
+        over the pooled connections. Each response has the same shape as
+        _rpc_call's: the JSON-RPC response, or {"error": ...} when its batch
+        failed or the node left the call unanswered.
+        """
+        chunks = [calls[i:i + self.MAX_BATCH_SIZE] for i in range(0, len(calls), self.MAX_BATCH_SIZE)]
+        results = await asyncio.gather(*(self._batch(chunk) for chunk in chunks))
+        return [response for chunk in results for response in chunk]
+    
+    async def _batch(self, calls: Sequence[RpcCall]) -> List[Dict[str, Any]]:
+        requests = [self._request(method, params) for method, params in calls]
+        body, error = await self._post(requests, "batch")
+        if error is None and not isinstance(body, list):
+            # A rejected batch comes back as one error object, not a list
+            rejected = body.get("error") if isinstance(body, dict) else None
+            error = str(rejected) if rejected is not None else "Invalid batch response"
+        if error is not None:
+            return [{"error": error} for _ in requests]
+        # Nodes may answer a batch in any order
+        by_id = {response.get("id"): response for response in body if isinstance(response, dict)}
+        return [by_id.get(request["id"], {"error": "Missing response"}) for request in requests]
+    
+    @staticmethod
+    def _health(result: Dict[str, Any]) -> Dict[str, Any]:
         if "error" in result:
             return {"status": "error", "error": result["error"]}
         
@@ -61,13 +135,22 @@ class SolanaAdapter:
             "response": result.get("result")
         }
     
+    async def get_health(self) -> Dict[str, Any]:
+        """Get Solana RPC health status"""
+        return self._health(await self._rpc_call("getHealth"))
+    
     async def get_slot(self) -> int:
         """Get current slot"""
         result = await self._rpc_call("getSlot")
         return result.get("result", 0)
     
+    async def get_health_and_slot(self) -> Tuple[Dict[str, Any], int]:
+        """get_health() and get_slot() in a single batched round trip"""
+        health, slot = await self.rpc_batch([("getHealth", None), ("getSlot", None)])
+        return self._health(health), slot.get("result", 0)
+    
     async def get_program_accounts(self) -> List[Dict[str, Any]]:
-        """Get all accounts for ClawDNA program"""
+        """Get all accounts for ClawDNA program, with AgentData decoded where present"""
         if not self.program_id:
             return []
         
@@ -85,13 +168,15 @@ class SolanaAdapter:
             return []
         
         accounts = result.get("result", [])
+        decoded = [decode_agent_account(acc["account"]) for acc in accounts]
         return [
             {
                 "pubkey": acc["pubkey"],
                 "lamports": acc["account"]["lamports"],
                 "owner": acc["account"]["owner"],
+                "agent": agent.to_dict() if agent is not None else None,
             }
-            for acc in accounts
+            for acc, agent in zip(accounts, decoded)
         ]
     
     async def get_account_info(self, pubkey: str) -> Optional[Dict[str, Any]]:
@@ -114,17 +199,56 @@ class SolanaAdapter:
             "executable": account["executable"]
         }
     
+    async def get_agent_accounts(self, addresses: Sequence[str]) -> Dict[str, Optional[AgentAccount]]:
+        """Decode many AgentData accounts with chunked getMultipleAccounts calls
+        
+        Chunks of MAX_MULTIPLE_ACCOUNTS addresses are fetched concurrently.
+        Addresses that are missing, not AgentData, or in a failed chunk map
+        to None.
+        """
+        chunks = [
+            list(addresses[i:i + self.MAX_MULTIPLE_ACCOUNTS])
+            for i in range(0, len(addresses), self.MAX_MULTIPLE_ACCOUNTS)
+        ]
+        options = {"encoding": "base64", "commitment": "confirmed"}
+        results = await asyncio.gather(*(
+            self._rpc_call("getMultipleAccounts", [chunk, options]) for chunk in chunks
+        ))
+        
+        agents: Dict[str, Optional[AgentAccount]] = {}
+        for chunk, result in zip(chunks, results):
+            values = (result.get("result") or {}).get("value") or [None] * len(chunk)
+            for address, account in zip(chunk, values):
+                agents[address] = decode_agent_account(account)
+        return agents
+    
+    def _agent_filters(self, mint: Optional[str] = None) -> List[Dict[str, Any]]:
+        """getProgramAccounts filters selecting AgentData (optionally one mint's)"""
+        filters = [{"memcmp": {"offset": 0, "bytes": b58encode(AGENT_DATA_DISCRIMINATOR)}}]
+        if mint is not None:
+            filters.append({"memcmp": {"offset": AGENT_MINT_OFFSET, "bytes": mint}})
+        return filters
+    
+    async def get_program_agents(self, mint: Optional[str] = None) -> List[AgentAccount]:
+        """All AgentData accounts of the program in one round trip (filtered node-side)"""
+        if not self.program_id:
+            return []
+        
+        params = [
+            self.program_id,
+            {"encoding": "base64", "commitment": "confirmed", "filters": self._agent_filters(mint)}
+        ]
+        result = await self._rpc_call("getProgramAccounts", params)
+        if "error" in result:
+            return []
+        
+        agents = (decode_agent_account(acc["account"]) for acc in result.get("result") or [])
+        return [agent for agent in agents if agent is not None]
+    
     async def get_genome_data(self, agent_mint: str) -> Optional[Dict[str, Any]]:
-        """Get genome data for an agent (mock implementation)"""
-        # In production, this would deserialize the account data
-        # For now, return mock data
-        return {
-            "mint": agent_mint,
-            "genome": [80, 75, 90, 65, 85, 70, 88, 72],
-            "generation": 5,
-            "fitness": 4.5,
-            "parents": ["parent1", "parent2"]
-        }
+        """Decoded on-chain data of the agent minted as `agent_mint`, if any"""
+        agents = await self.get_program_agents(mint=agent_mint)
+        return agents[0].to_dict() if agents else None
 
 
 # Singleton instance
@@ -137,3 +261,11 @@ def get_solana_adapter() -> SolanaAdapter:
     if _solana_adapter is None:
         _solana_adapter = SolanaAdapter()
     return _solana_adapter
+
+
+async def close_solana_adapter() -> None:
+    """Close the singleton's pooled connections (called on application shutdown)"""
+    global _solana_adapter
+    if _solana_adapter is not None:
+        await _solana_adapter.close()
+        _solana_adapter = None
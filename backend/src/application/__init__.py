@@ -4,13 +4,39 @@ Application layer - Business logic and use cases
 from .evolution_use_cases import (
     EvolutionEngine,
     GetEvolutionResultUseCase,
+    GetEvolutionStatsUseCase,
+    GetPopulationUseCase,
     ListEvolutionResultsUseCase,
-    RunEvolutionUseCase
+    RunEvolutionUseCase,
+    cache_entry,
+    create_engine,
+    parameter_errors,
+    result_cache_key
 )
+from .evolution_jobs import EvolutionJobRunner, run_evolution_job
+from .fitness import FitnessEvaluator, fitness_names, register_fitness
+from .island_model import IslandModel
+from .rng import EvolutionRandom
+from .vectorized_engine import PopulationArray, VectorizedEvolutionEngine
 
 __all__ = [
     "EvolutionEngine",
     "GetEvolutionResultUseCase",
+    "GetEvolutionStatsUseCase",
+    "GetPopulationUseCase",
     "ListEvolutionResultsUseCase",
-    "RunEvolutionUseCase"
+    "RunEvolutionUseCase",
+    "cache_entry",
+    "create_engine",
+    "parameter_errors",
+    "result_cache_key",
+    "EvolutionJobRunner",
+    "run_evolution_job",
+    "FitnessEvaluator",
+    "fitness_names",
+    "register_fitness",
+    "IslandModel",
+    "EvolutionRandom",
+    "PopulationArray",
+    "VectorizedEvolutionEngine"
 ]
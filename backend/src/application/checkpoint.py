@@ -0,0 +1,89 @@
+"""
+Run checkpoints
+Application layer - Compact binary snapshots of a population and its RNG
+"""
+import json
+import struct
+from typing import Tuple
+
+import numpy as np
+
+from src.domain.entities import EvolutionCheckpoint
+from src.application.rng import EvolutionRandom
+from src.application.vectorized_engine import PopulationArray
+
+CHECKPOINT_MAGIC = b"CDCP"
+CHECKPOINT_VERSION = 2
+
+# magic, version, trait count, agents, RNG header bytes, buffered RNG draws
+_HEADER_V1 = struct.Struct("<4sBBIII")
+# ... plus the byte length of the agent id block (0 when ids aren't kept)
+_HEADER = struct.Struct("<4sBBIIII")
+
+
+def encode_checkpoint(
+    result_id: str, generation: int, population: PopulationArray, rng: EvolutionRandom
+) -> EvolutionCheckpoint:
+    """Pack an evaluated population and the RNG that will breed its successor
+    
+    Layout after the header: the RNG's seed sequence and bit generator state
+    (small JSON, since PCG64 state words exceed 64 bits), its buffered draws,
+    then genomes, fitness (little-endian float64), birth generation (int32)
+    and the agents' 16-byte UUIDs.
+    """
+    state = rng.get_state()
+    buffer = np.asarray(state.pop("buffer"), dtype="<f8")
+    rng_header = json.dumps(state, separators=(",", ":")).encode()
+    ids = b""
+    if population.ids is not None:
+        ids = np.ascontiguousarray(population.ids, dtype=np.uint8).tobytes()
+    rows, traits = population.genomes.shape
+    parts = [
+        _HEADER.pack(
+            CHECKPOINT_MAGIC, CHECKPOINT_VERSION, traits, rows, len(rng_header), len(buffer), len(ids)
+        ),
+        rng_header,
+        buffer.tobytes(),
+        np.ascontiguousarray(population.genomes, dtype="<f8").tobytes(),
+        np.ascontiguousarray(population.fitness, dtype="<f8").tobytes(),
+        np.ascontiguousarray(population.generation, dtype="<i4").tobytes(),
+        ids,
+    ]
+    return EvolutionCheckpoint(result_id=result_id, generation=generation, state=b"".join(parts))
+
+
+def decode_checkpoint(checkpoint: EvolutionCheckpoint) -> Tuple[PopulationArray, EvolutionRandom]:
+    """Population and RNG exactly as they were when the checkpoint was taken"""
+    data = memoryview(checkpoint.state)
+    magic, version, traits, rows, rng_bytes, buffered = _HEADER_V1.unpack_from(data)
+    if magic != CHECKPOINT_MAGIC or version not in (1, CHECKPOINT_VERSION):
+        raise ValueError("Unsupported checkpoint format")
+    
+    if version == 1:
+        id_bytes, offset = 0, _HEADER_V1.size
+    else:
+        id_bytes, offset = _HEADER.unpack_from(data)[-1], _HEADER.size
+    state = json.loads(bytes(data[offset:offset + rng_bytes]))
+    offset += rng_bytes
+    buffer = np.frombuffer(data, dtype="<f8", count=buffered, offset=offset)
+    offset += buffer.nbytes
+    state["buffer"] = buffer.tolist()
+    
+    genomes = np.frombuffer(data, dtype="<f8", count=rows * traits, offset=offset)
+    offset += genomes.nbytes
+    fitness = np.frombuffer(data, dtype="<f8", count=rows, offset=offset)
+    offset += fitness.nbytes
+    generation = np.frombuffer(data, dtype="<i4", count=rows, offset=offset)
+    offset += generation.nbytes
+    ids = (
+        np.frombuffer(data, dtype=np.uint8, count=id_bytes, offset=offset).reshape(rows, 16)
+        if id_bytes else None
+    )
+    
+    population = PopulationArray(
+        genomes=genomes.reshape(rows, traits),
+        fitness=fitness,
+        generation=generation.astype(np.int64),
+        ids=ids
+    )
+    return population, EvolutionRandom.from_state(state)
@@ -0,0 +1,94 @@
+"""
+Population diversity
+Application layer - Running per-trait moments updated as agents come and go
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+
+class TraitMoments:
+    """Per-trait count, mean and sum of squared deviations (Welford / Chan)
+    
+    Batches of genomes are merged in and taken out with the parallel-variance
+    update, so when few agents change between generations only offspring and
+    culled agents are touched; survivors keep their contribution.
+    """
+    
+    def __init__(self, trait_count: int):
+        self.count = 0
+        self.mean = np.zeros(trait_count)
+        self.m2 = np.zeros(trait_count)
+    
+    @classmethod
+    def of(cls, genomes: np.ndarray) -> "TraitMoments":
+        """Moments of a (N x traits) genome array"""
+        moments = cls(genomes.shape[1])
+        moments.add(genomes)
+        return moments
+    
+    def add(self, genomes: np.ndarray) -> None:
+        """Merge rows into the moments"""
+        size = genomes.shape[0]
+        if size == 0:
+            return
+        batch_mean = genomes.mean(axis=0)
+        batch_m2 = np.square(genomes - batch_mean).sum(axis=0)
+        total = self.count + size
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * (size / total)
+        self.m2 = self.m2 + batch_m2 + np.square(delta) * (self.count * size / total)
+        self.count = total
+    
+    def remove(self, genomes: np.ndarray) -> None:
+        """Take previously added rows back out of the moments"""
+        size = genomes.shape[0]
+        if size == 0:
+            return
+        remaining = self.count - size
+        if remaining <= 0:
+            self.count = 0
+            self.mean = np.zeros_like(self.mean)
+            self.m2 = np.zeros_like(self.m2)
+            return
+        batch_mean = genomes.mean(axis=0)
+        batch_m2 = np.square(genomes - batch_mean).sum(axis=0)
+        rest_mean = (self.mean * self.count - batch_mean * size) / remaining
+        delta = batch_mean - rest_mean
+        m2 = self.m2 - batch_m2 - np.square(delta) * (remaining * size / self.count)
+        self.m2 = np.maximum(m2, 0.0)
+        self.mean = rest_mean
+        self.count = remaining
+    
+    def variance(self) -> np.ndarray:
+        """Population variance per trait"""
+        if self.count == 0:
+            return np.zeros_like(self.m2)
+        return self.m2 / self.count
+    
+    def diversity(self) -> float:
+        """Average per-trait variance (GenerationStats.diversity_score)"""
+        if self.count < 2:
+            return 0.0
+        return float(self.variance().mean())
+    
+    def pairwise_distance(self) -> float:
+        """Mean squared Euclidean distance over distinct pairs of agents"""
+        return pairwise_distance(self.count, float(self.variance().sum()))
+    
+    def sums(self) -> Tuple[List[float], List[float]]:
+        """Per-trait sums and sums of squares, for merging across islands"""
+        sums = self.mean * self.count
+        squares = self.m2 + np.square(self.mean) * self.count
+        return sums.tolist(), squares.tolist()
+
+
+def pairwise_distance(count: int, total_variance: float) -> float:
+    """Mean squared pairwise distance from the summed per-trait variance
+    
+    sum over i<j of |x_i - x_j|^2 equals n^2 * total variance, so the mean
+    over the n(n-1)/2 pairs needs the moments, not the O(n^2) pairs.
+    """
+    if count < 2:
+        return 0.0
+    return 2.0 * count * total_variance / (count - 1)
@@ -0,0 +1,171 @@
+"""
+Background evolution jobs
+Application layer - Off-loop execution of evolution runs
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional, Set, Tuple
+
+from src.domain.entities import (
+    EvolutionCheckpoint, EvolutionParameters, EvolutionResult, EvolutionStatus
+)
+from src.domain.exceptions import ValidationError
+from src.domain.repositories import EvolutionRepository
+from src.application.evolution_use_cases import RunEvolutionUseCase, parameter_errors, run_in_segments
+from src.application.island_model import InlineExecutor
+from src.application.profiling import PhaseProfile, phase_metrics, should_profile
+
+
+def run_evolution_job(
+    params: EvolutionParameters,
+    result: EvolutionResult,
+    profile: bool = False,
+    checkpoint: Optional[EvolutionCheckpoint] = None,
+    stop_after: Optional[int] = None
+) -> Tuple[EvolutionResult, Optional[EvolutionCheckpoint]]:
+    """Worker-process entry point (module level so it can be pickled)
+    
+    Runs one segment of a job, from `checkpoint` up to `stop_after`, and
+    returns the result with the checkpoint to continue from. Islands run
+    one after another here, since the job already has a worker process.
+    """
+    profiler = PhaseProfile() if profile else None
+    return RunEvolutionUseCase(island_executor=InlineExecutor()).run_segment(
+        params, result, checkpoint, stop_after or params.generations, profiler
+    )
+
+
+class EvolutionJobRunner:
+    """Runs evolutions in a process pool and tracks status through the repository
+    
+    submit() persists a PENDING result and returns immediately; the GA runs in
+    a worker process while the event loop keeps serving other requests. Jobs
+    run `checkpoint_interval` generations per worker call, and the result and
+    a checkpoint are persisted in between.
+    """
+    
+    def __init__(
+        self,
+        repository: EvolutionRepository,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        profile_sample_rate: float = 0.0,
+        on_complete: Optional[Callable[[EvolutionResult], None]] = None,
+        checkpoint_interval: int = 0
+    ):
+        self.repository = repository
+        self.max_workers = max_workers
+        self._executor = executor
+        self.profile_sample_rate = profile_sample_rate
+        self.on_complete = on_complete
+        self.checkpoint_interval = checkpoint_interval
+        self._tasks: Set[asyncio.Task] = set()
+    
+    def _get_executor(self) -> Executor:
+        """Get or create the worker pool"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+    
+    @property
+    def active_jobs(self) -> int:
+        """Number of submitted jobs that have not finished yet"""
+        return len(self._tasks)
+    
+    async def submit(self, params: EvolutionParameters) -> EvolutionResult:
+        """Validate, persist as PENDING and schedule the run"""
+        errors = parameter_errors(params)
+        if errors:
+            raise ValidationError("Invalid evolution parameters", errors)
+        
+        result = EvolutionResult(
+            id="",
+            status=EvolutionStatus.PENDING,
+            parameters=dict(params.__dict__)
+        )
+        await self.repository.save(result)
+        
+        # Sampled jobs feed phase_metrics; profiles are not persisted with results
+        sampled = should_profile(False, self.profile_sample_rate)
+        task = asyncio.create_task(self._run(params, result, sampled))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return result
+    
+    async def _run(
+        self,
+        params: EvolutionParameters,
+        result: EvolutionResult,
+        sampled: bool = False
+    ) -> None:
+        """Run one job and report the finished result to on_complete"""
+        finished = await self._execute(params, result, sampled)
+        if self.on_complete is not None:
+            self.on_complete(finished)
+    
+    async def _execute(
+        self,
+        params: EvolutionParameters,
+        result: EvolutionResult,
+        sampled: bool
+    ) -> EvolutionResult:
+        """Drive one job through RUNNING to COMPLETED or FAILED"""
+        result.status = EvolutionStatus.RUNNING
+        await self.repository.save(result)
+        
+        loop = asyncio.get_running_loop()
+        profiles = []
+        
+        async def segment(current, checkpoint, stop_after):
+            nonlocal result
+            result, checkpoint = await loop.run_in_executor(
+                self._get_executor(), run_evolution_job, params, current, sampled, checkpoint, stop_after
+            )
+            # Each segment reports its own profile; merged once the job is done
+            if result.profile is not None:
+                profiles.append(PhaseProfile.from_dict(result.profile))
+                result.profile = None
+            return result, checkpoint
+        
+        try:
+            completed, checkpoint = await run_in_segments(
+                params, segment, self.repository, self.checkpoint_interval, result
+            )
+        except Exception as e:
+            # `result` is the last segment's, so persisted progress is kept
+            result.status = EvolutionStatus.FAILED
+            result.error_message = str(e)
+            result.completed_at = datetime.utcnow()
+            await self.repository.save(result)
+            return result
+        
+        if not profiles:
+            await self._persist(completed, checkpoint)
+            return completed
+        
+        profiler = PhaseProfile.merge(profiles)
+        mark = profiler.clock()
+        await self._persist(completed, checkpoint)
+        profiler.lap("persistence", mark)
+        phase_metrics.observe(profiler.to_dict())
+        return completed
+    
+    async def _persist(
+        self, result: EvolutionResult, checkpoint: Optional[EvolutionCheckpoint]
+    ) -> None:
+        await self.repository.save(result)
+        if checkpoint is not None:
+            await self.repository.save_checkpoint(checkpoint)
+    
+    async def wait(self) -> None:
+        """Wait for all in-flight jobs (for tests and graceful shutdown)"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    def shutdown(self) -> None:
+        """Stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
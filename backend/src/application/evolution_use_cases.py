@@ -2,218 +2,748 @@
 Evolution use cases
 Application layer - Business logic and orchestration
 """
-import random
+import asyncio
+import hashlib
+import json
+import logging
+import threading
 import time
+import uuid
+from concurrent.futures import Executor
+from dataclasses import asdict, fields, replace
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Dict, Any, Tuple, Union
+
+import numpy as np
 
 from src.domain.entities import (
-    Agent, EvolutionParameters, EvolutionResult, 
-    EvolutionStatus, GenerationStats, Genome
+    Agent, CachedResult, EvolutionAggregates, EvolutionCheckpoint, EvolutionParameters, EvolutionResult, 
+    EvolutionStatus, GenerationStats, Genome, PopulationPage, TRAIT_NAMES
 )
-from src.domain.exceptions import ValidationError, EvolutionError
-from src.domain.repositories import EvolutionRepository
+from src.domain.exceptions import ValidationError, EvolutionError, NotFoundError, ConflictError
+from src.domain.repositories import EvolutionRepository, EvolutionResultCache
+from src.application.checkpoint import decode_checkpoint, encode_checkpoint
+from src.application.diversity import TraitMoments
+from src.application.fitness import FitnessEvaluator, fitness_cache_metrics, fitness_names
+from src.application.profiling import PhaseProfile, phase_metrics, should_profile
+from src.application.rng import EvolutionRandom
+from src.application.selection import select_parent_pairs, top_k, tournament
+from src.application.vectorized_engine import PopulationArray, VectorizedEvolutionEngine
+
+
+logger = logging.getLogger(__name__)
+
+
+class _StreamClosed(EvolutionError):
+    """Raised inside a streamed run once its consumer has gone away"""
+
+
+def _retrieve_abandoned_run(future: "asyncio.Future[EvolutionResult]") -> None:
+    """Consume the outcome of a run whose stream was closed before it finished"""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None and not isinstance(error.__cause__, _StreamClosed):
+        logger.warning("Abandoned evolution run failed: %s", error)
 
 
 class EvolutionEngine:
     """Core evolution engine - implements genetic algorithm logic"""
     
-    def __init__(self, params: EvolutionParameters):
+    def __init__(self, params: EvolutionParameters, rng: Optional[EvolutionRandom] = None):
         self.params = params
-        if params.random_seed is not None:
-            random.seed(params.random_seed)
+        self.rng = rng if rng is not None else EvolutionRandom(params.random_seed)
+        self.profiler: Optional[PhaseProfile] = None
+        self.fitness_evaluator = FitnessEvaluator(params.fitness_function)
+        # Running trait moments of the last population next_generation returned
+        self._moments: Optional[TraitMoments] = None
+        self._tracked: Optional[List[Agent]] = None
+        # A population and how many of its leading agents already have fitness
+        self._evaluated: Tuple[Optional[List[Agent]], int] = (None, 0)
     
     def create_random_genome(self) -> Genome:
         """Create a random genome"""
-        return Genome(
-            speed=random.uniform(0, 1),
-            strength=random.uniform(0, 1),
-            intelligence=random.uniform(0, 1),
-            cooperation=random.uniform(0, 1),
-            adaptability=random.uniform(0, 1)
-        )
+        return Genome(*self.rng.batch(len(TRAIT_NAMES)))
     
     def calculate_fitness(self, genome: Genome) -> float:
         """Calculate fitness for a genome"""
-        return sum(genome.to_dict().values())
+        return float(self.fitness_evaluator.function(np.array([genome.to_tuple()]))[0])
     
     def mutate(self, genome: Genome) -> Genome:
         """Mutate a genome"""
-        traits = genome.to_dict()
-        new_traits = {}
+        rng = self.rng
+        rate = self.params.mutation_rate
+        new_traits = []
         
-        for trait, value in traits.items():
-            if random.random() < self.params.mutation_rate:
-                change = random.uniform(-0.2, 0.2)
-                new_traits[trait] = max(0, min(1, value + change))
+        for value in genome.to_tuple():
+            if rng.random() < rate:
+                change = rng.uniform(-0.2, 0.2)
+                new_traits.append(max(0, min(1, value + change)))
             else:
-                new_traits[trait] = value
+                new_traits.append(value)
         
-        return Genome(**new_traits)
+        return Genome(*new_traits)
     
     def crossover(self, parent1: Agent, parent2: Agent) -> Genome:
         """Crossover two parent genomes"""
-        traits1 = parent1.genome.to_dict()
-        traits2 = parent2.genome.to_dict()
-        child_traits = {}
-        
-        for trait in traits1:
-            if random.random() < 0.5:
-                child_traits[trait] = traits1[trait]
-            else:
-                child_traits[trait] = traits2[trait]
-        
-        return Genome(**child_traits)
+        rng = self.rng
+        return Genome(*[
+            value1 if rng.random() < 0.5 else value2
+            for value1, value2 in zip(parent1.genome.to_tuple(), parent2.genome.to_tuple())
+        ])
     
     def tournament_select(self, population: List[Agent]) -> Agent:
         """Tournament selection"""
-        tournament = random.sample(
-            population, 
-            min(self.params.tournament_size, len(population))
-        )
-        return max(tournament, key=lambda a: a.fitness)
+        winner = tournament(
+            self._fitness_array(population), 1, self.rng.generator, self.params.tournament_size
+        )[0]
+        return population[int(winner)]
     
     def natural_selection(self, population: List[Agent]) -> List[Agent]:
         """Select survivors based on fitness"""
-        sorted_pop = sorted(population, key=lambda a: a.fitness, reverse=True)
+        return self._survivors(population)[0]
+    
+    def _survivors(self, population: List[Agent]) -> Tuple[List[Agent], np.ndarray, np.ndarray]:
+        """Fittest survival_rate fraction, best first, with their fitness and indices"""
+        fitness = self._fitness_array(population)
         survivors_count = max(1, int(len(population) * self.params.survival_rate))
-        return sorted_pop[:survivors_count]
+        order = top_k(fitness, survivors_count)
+        return [population[i] for i in order.tolist()], fitness[order], order
+    
+    @staticmethod
+    def _fitness_array(population: List[Agent]) -> np.ndarray:
+        return np.fromiter((a.fitness for a in population), dtype=np.float64, count=len(population))
+    
+    @staticmethod
+    def _genome_array(agents: List[Agent]) -> np.ndarray:
+        genomes = np.array([a.genome.to_tuple() for a in agents], dtype=np.float64)
+        return genomes.reshape(len(agents), len(TRAIT_NAMES))
     
     def calculate_diversity(self, population: List[Agent]) -> float:
         """Calculate population diversity as average variance across traits"""
-        if len(population) < 2:
-            return 0.0
+        return TraitMoments.of(self._genome_array(population)).diversity()
+    
+    def _moments_for(self, population: List[Agent]) -> TraitMoments:
+        """Trait moments of the population, rebuilt unless it is the tracked one
         
-        trait_values = {trait: [] for trait in population[0].genome.to_dict().keys()}
+        Populations are never modified in place, so identity is enough to
+        tell that the running moments still describe it.
+        """
+        if population is not self._tracked:
+            self._moments = TraitMoments.of(self._genome_array(population))
+            self._tracked = population
+        return self._moments
+    
+    def _track(
+        self, population: List[Agent], kept: np.ndarray, added: List[Agent], result: List[Agent]
+    ) -> None:
+        """Carry the running moments from population over to result
         
-        for agent in population:
-            for trait, value in agent.genome.to_dict().items():
-                trait_values[trait].append(value)
+        The delta (culled agents out, added ones in) is only applied when it
+        touches fewer agents than a rebuild; otherwise the moments are
+        rebuilt from result when next needed.
+        """
+        if population is not self._tracked:
+            return
+        if len(population) - len(kept) + len(added) >= len(result):
+            self._tracked = None
+            return
+        culled_mask = np.ones(len(population), dtype=bool)
+        culled_mask[kept] = False
+        self._moments.remove(
+            self._genome_array([population[i] for i in np.flatnonzero(culled_mask).tolist()])
+        )
+        self._moments.add(self._genome_array(added))
+        self._tracked = result
+    
+    def initial_population(self) -> List[Agent]:
+        """Create the generation-zero population"""
+        return [
+            Agent(
+                id="",
+                genome=self.create_random_genome(),
+                generation=0
+            )
+            for _ in range(self.params.population_size)
+        ]
+    
+    def evaluate(self, population: List[Agent]) -> int:
+        """Calculate fitness for agents that need it; returns how many were evaluated
         
-        # Calculate average variance across all traits
-        total_variance = 0
-        for values in trait_values.values():
-            mean = sum(values) / len(values)
-            variance = sum((v - mean) ** 2 for v in values) / len(values)
-            total_variance += variance
+        Survivors at the front of a population from next_generation keep
+        their fitness; the rest go through the memoizing evaluator.
+        """
+        tracked, done = self._evaluated
+        pending = population[done:] if population is tracked else population
+        if pending:
+            fitness = self.fitness_evaluator.evaluate(self._genome_array(pending))
+            for agent, value in zip(pending, fitness.tolist()):
+                agent.fitness = value
+        self._evaluated = (population, len(population))
+        return len(pending)
+    
+    def generation_stats(self, population: List[Agent], generation_number: int) -> GenerationStats:
+        """Summarize an evaluated population"""
+        fitnesses = [a.fitness for a in population]
+        moments = self._moments_for(population)
+        return GenerationStats(
+            generation_number=generation_number,
+            avg_fitness=sum(fitnesses) / len(fitnesses),
+            max_fitness=max(fitnesses),
+            min_fitness=min(fitnesses),
+            diversity_score=moments.diversity(),
+            population_size=len(population),
+            pairwise_distance=moments.pairwise_distance()
+        )
+    
+    def best_agent(self, population: List[Agent]) -> Agent:
+        """Detached copy of the fittest agent"""
+        return self._detached(max(population, key=lambda a: a.fitness))
+    
+    def _detached(self, agent: Agent) -> Agent:
+        return Agent(
+            id=agent.id,
+            genome=Genome(
+                speed=agent.genome.speed,
+                strength=agent.genome.strength,
+                intelligence=agent.genome.intelligence,
+                cooperation=agent.genome.cooperation,
+                adaptability=agent.genome.adaptability
+            ),
+            fitness=agent.fitness,
+            generation=agent.generation
+        )
+    
+    def select_elites(self, population: List[Agent], count: int) -> List[Agent]:
+        """Detached copies of the `count` fittest agents"""
+        order = top_k(self._fitness_array(population), count)
+        return [self._detached(population[i]) for i in order.tolist()]
+    
+    def replace_worst(self, population: List[Agent], migrants: List[Agent]) -> List[Agent]:
+        """Replace the least fit agents with migrants, keeping the size
         
-        return total_variance / len(trait_values)
+        Migrants get new ids, since their originals live on in the source island.
+        """
+        order = top_k(self._fitness_array(population), len(population) - len(migrants))
+        return [population[i] for i in order.tolist()] + [
+            replace(migrant, id=str(uuid.uuid4())) for migrant in migrants
+        ]
+    
+    def trait_moments(self, population: List[Agent]) -> Tuple[List[float], List[float]]:
+        """Per-trait sums and sums of squares, for merging statistics"""
+        return self._moments_for(population).sums()
+    
+    def next_generation(self, population: List[Agent]) -> List[Agent]:
+        """Select survivors and fill the population with offspring"""
+        profiler = self.profiler
+        if profiler is not None:
+            mark = profiler.clock()
+        
+        params = self.params
+        survivors, fitness, order = self._survivors(population)
+        offspring_count = params.population_size - len(survivors)
+        if offspring_count <= 0:
+            self._track(population, order, [], survivors)
+            self._evaluated = (survivors, len(survivors))
+            if profiler is not None:
+                profiler.lap("selection", mark)
+            return survivors
+        
+        # All parent pairs for the generation in one batch
+        parents1, parents2 = select_parent_pairs(
+            params.selection_strategy,
+            fitness,
+            offspring_count,
+            self.rng.generator,
+            params.tournament_size
+        )
+        if profiler is not None:
+            mark = profiler.lap("selection", mark, calls=2 * offspring_count + 1)
+        
+        offspring = []
+        for i, j in zip(parents1.tolist(), parents2.tolist()):
+            parent1 = survivors[i]
+            parent2 = survivors[j]
+            child_genome = self.crossover(parent1, parent2)
+            child_genome = self.mutate(child_genome)
+            
+            child = Agent(
+                id="",
+                genome=child_genome,
+                generation=max(parent1.generation, parent2.generation) + 1
+            )
+            offspring.append(child)
+        
+        next_population = survivors + offspring
+        self._track(population, order, offspring, next_population)
+        self._evaluated = (next_population, len(survivors))
+        if profiler is not None:
+            profiler.lap("variation", mark, calls=offspring_count)
+        
+        return next_population
+    
+    def to_agents(self, population: List[Agent]) -> List[Agent]:
+        """Materialize the population as Agent entities"""
+        return population
+    
+    def to_arrays(self, population: List[Agent]) -> PopulationArray:
+        """The population in array form, for checkpoints"""
+        return PopulationArray(
+            genomes=self._genome_array(population),
+            fitness=self._fitness_array(population),
+            generation=np.fromiter(
+                (a.generation for a in population), dtype=np.int64, count=len(population)
+            ),
+            ids=np.frombuffer(
+                b"".join(uuid.UUID(a.id).bytes for a in population), dtype=np.uint8
+            ).reshape(len(population), 16)
+        )
+    
+    def from_arrays(self, arrays: PopulationArray) -> List[Agent]:
+        """Restore an evaluated population from a checkpoint, keeping its agent ids"""
+        ids = (
+            [arrays.agent_id(i) for i in range(len(arrays))]
+            if arrays.ids is not None else [""] * len(arrays)
+        )
+        population = [
+            Agent(id=agent_id, genome=Genome(*genome), fitness=fitness, generation=generation)
+            for agent_id, genome, fitness, generation in zip(
+                ids, arrays.genomes.tolist(), arrays.fitness.tolist(), arrays.generation.tolist()
+            )
+        ]
+        self._evaluated = (population, len(population))
+        return population
+
+
+def create_engine(params: EvolutionParameters, rng: Optional[EvolutionRandom] = None):
+    """Instantiate the engine implementation selected by params.engine"""
+    if params.engine == "vectorized":
+        return VectorizedEvolutionEngine(params, rng)
+    return EvolutionEngine(params, rng)
+
+
+def parameter_errors(params: EvolutionParameters) -> List[str]:
+    """params.validate() plus checks against application-level registries"""
+    errors = params.validate()
+    if params.fitness_function not in fitness_names():
+        errors.append(f"fitness_function must be one of: {', '.join(fitness_names())}")
+    return errors
+
+
+# Bump whenever a change to the engines alters what a seeded run produces,
+# so cached results from the old behaviour stop matching
+ENGINE_VERSION = 4
+
+
+def result_cache_key(params: EvolutionParameters) -> Optional[str]:
+    """Fingerprint of canonicalized parameters, or None if the run is not deterministic"""
+    if params.random_seed is None:
+        return None
+    canonical = json.dumps(
+        {"engine_version": ENGINE_VERSION, "parameters": asdict(params)},
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def cache_entry(result: EvolutionResult) -> CachedResult:
+    """Serialize a persisted result once, without any per-request profile"""
+    payload = replace(result, profile=None).to_dict()
+    return CachedResult(result_id=result.id, payload=json.dumps(payload, separators=(",", ":")).encode())
+
+
+# One leg of a checkpointed run: (result, checkpoint to resume from, generation to stop after)
+SegmentRunner = Callable[
+    [Optional[EvolutionResult], Optional[EvolutionCheckpoint], int],
+    Awaitable[Tuple[EvolutionResult, Optional[EvolutionCheckpoint]]]
+]
+
+
+async def run_in_segments(
+    params: EvolutionParameters,
+    run_segment: SegmentRunner,
+    repository: EvolutionRepository,
+    interval: int,
+    result: Optional[EvolutionResult] = None,
+    checkpoint: Optional[EvolutionCheckpoint] = None
+) -> Tuple[EvolutionResult, Optional[EvolutionCheckpoint]]:
+    """Drive a run to completion `interval` generations at a time
+    
+    After every segment but the last, the partial (RUNNING) result and its
+    checkpoint are persisted, so an interrupted run loses at most one
+    segment. The completed result and its final checkpoint are returned for
+    the caller to persist. interval=0 runs in one segment.
+    """
+    done = checkpoint.generation if checkpoint is not None else 0
+    while True:
+        stop = params.generations if interval <= 0 else min(done + interval, params.generations)
+        result, checkpoint = await run_segment(result, checkpoint, stop)
+        # Island runs produce no checkpoint and always finish in one segment
+        if checkpoint is None or result.status is not EvolutionStatus.RUNNING:
+            return result, checkpoint
+        done = checkpoint.generation
+        await repository.save(result)
+        await repository.save_checkpoint(checkpoint)
+
+
+def stored_parameters(result: EvolutionResult) -> EvolutionParameters:
+    """EvolutionParameters of a stored result (defaults for fields added since)"""
+    names = {f.name for f in fields(EvolutionParameters)}
+    return EvolutionParameters(**{k: v for k, v in result.parameters.items() if k in names})
 
 
 class RunEvolutionUseCase:
     """Use case for running evolution"""
     
-    def __init__(self, repository: Optional[EvolutionRepository] = None):
+    def __init__(
+        self,
+        repository: Optional[EvolutionRepository] = None,
+        cache: Optional[EvolutionResultCache] = None,
+        profile_sample_rate: float = 0.0,
+        fitness_executor: Optional[Executor] = None,
+        checkpoint_interval: int = 0,
+        island_executor: Optional[Executor] = None
+    ):
         self.repository = repository
+        self.cache = cache
+        # Fraction of runs profiled for phase metrics even when not requested
+        self.profile_sample_rate = profile_sample_rate
+        # Worker pool for expensive fitness functions (None: evaluate in-process)
+        self.fitness_executor = fitness_executor
+        # Generations between persisted checkpoints (0: only when a run finishes)
+        self.checkpoint_interval = checkpoint_interval
+        # Worker pool for island-model runs (None: a pool per run)
+        self.island_executor = island_executor
+    
+    async def cached(self, params: EvolutionParameters) -> Optional[CachedResult]:
+        """Previously computed result for identical seeded parameters
+        
+        An entry whose result the repository no longer holds (e.g. evicted
+        from the in-memory store) is discarded and counts as a miss.
+        """
+        key = result_cache_key(params)
+        if key is None or self.cache is None or self.repository is None:
+            return None
+        entry = await self.cache.get(key)
+        if entry is None:
+            return None
+        if await self.repository.get_by_id(entry.result_id, include_generations=False) is None:
+            await self.cache.discard(key)
+            return None
+        return entry
     
-    async def execute(self, params: EvolutionParameters) -> EvolutionResult:
-        """Execute evolution run"""
+    async def execute(self, params: EvolutionParameters, profile: bool = False) -> EvolutionResult:
+        """Execute evolution run
+        
+        With profile=True the result carries per-phase timings; a cached
+        result would have none, so profiled runs always compute.
+        """
         # Validate parameters
-        errors = params.validate()
+        errors = parameter_errors(params)
+        if errors:
+            raise ValidationError("Invalid evolution parameters", errors)
+        
+        if not profile:
+            cached = await self.cached(params)
+            if cached is not None:
+                stored = await self.repository.get_by_id(cached.result_id)
+                if stored is not None:
+                    # Timings belong to the request that computed the result
+                    return replace(stored, profile=None)
+        
+        profiler = PhaseProfile() if should_profile(profile, self.profile_sample_rate) else None
+        if self.repository is None:
+            result = self.run(params, profiler=profiler)
+        else:
+            async def segment(result, checkpoint, stop_after):
+                return self.run_segment(params, result, checkpoint, stop_after, profiler)
+            
+            result, checkpoint = await run_in_segments(
+                params, segment, self.repository, self.checkpoint_interval
+            )
+        
+        # Save to repository if available
+        if self.repository:
+            if profiler is not None:
+                mark = profiler.clock()
+            await self.repository.save(result)
+            if checkpoint is not None:
+                await self.repository.save_checkpoint(checkpoint)
+            if profiler is not None:
+                profiler.lap("persistence", mark)
+            # Only persisted results are cached, so a hit can be fetched by id
+            key = result_cache_key(params)
+            if key is not None and self.cache is not None:
+                await self.cache.put(key, cache_entry(result))
+        
+        if profiler is not None:
+            report = profiler.to_dict()
+            phase_metrics.observe(report)
+            result.profile = report if profile else None
+        
+        return result
+    
+    async def stream(
+        self, params: EvolutionParameters
+    ) -> AsyncIterator[Union[GenerationStats, EvolutionResult]]:
+        """Execute evolution run, yielding each GenerationStats as it is produced
+        
+        The run executes in a worker thread; the final item is the completed
+        (and persisted) EvolutionResult. Closing the iterator early stops the run.
+        """
+        errors = parameter_errors(params)
+        if errors:
+            raise ValidationError("Invalid evolution parameters", errors)
+        
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[GenerationStats]" = asyncio.Queue()
+        cancelled = threading.Event()
+        
+        def on_generation(stats: GenerationStats) -> None:
+            if cancelled.is_set():
+                raise _StreamClosed("Evolution stream closed by client")
+            loop.call_soon_threadsafe(queue.put_nowait, stats)
+        
+        checkpoints: List[EvolutionCheckpoint] = []
+        future = loop.run_in_executor(None, lambda: self.run(
+            params,
+            on_generation=on_generation,
+            on_checkpoint=checkpoints.append if self.repository else None
+        ))
+        get_next = None
+        try:
+            while True:
+                get_next = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({get_next, future}, return_when=asyncio.FIRST_COMPLETED)
+                if get_next in done:
+                    yield get_next.result()
+                    continue
+                get_next.cancel()
+                # Run finished: drain stats queued before completion, then the result
+                while not queue.empty():
+                    yield queue.get_nowait()
+                result = future.result()
+                if self.repository:
+                    await self.repository.save(result)
+                    if checkpoints:
+                        await self.repository.save_checkpoint(checkpoints[-1])
+                yield result
+                return
+        finally:
+            cancelled.set()
+            if get_next is not None:
+                get_next.cancel()
+            # On an early close the run stops at its next generation, unawaited
+            future.add_done_callback(_retrieve_abandoned_run)
+    
+    async def resume(self, result_id: str, generations: int) -> EvolutionResult:
+        """Evolve a stored run `generations` further, from its latest checkpoint
+        
+        The continuation is saved as a new result whose parameters and
+        history are those of a single run of the combined length, so the
+        original stays untouched and seeded continuations are cacheable.
+        """
+        if self.repository is None:
+            raise EvolutionError("Resuming a run requires a repository")
+        previous = await self.repository.get_by_id(result_id)
+        if previous is None:
+            raise NotFoundError(f"Evolution result '{result_id}' not found")
+        if previous.status not in (EvolutionStatus.COMPLETED, EvolutionStatus.FAILED):
+            raise ConflictError(f"Evolution result '{result_id}' is still {previous.status.value}")
+        checkpoint = await self.repository.get_checkpoint(result_id)
+        if checkpoint is None:
+            raise ValidationError("Run cannot be continued", ["no checkpoint stored for this result"])
+        
+        if generations < 1:
+            raise ValidationError("Invalid evolution parameters", ["generations must be at least 1"])
+        params = replace(stored_parameters(previous), generations=checkpoint.generation + generations)
+        errors = parameter_errors(params)
         if errors:
             raise ValidationError("Invalid evolution parameters", errors)
         
-        # Create result
         result = EvolutionResult(
             id="",
             status=EvolutionStatus.RUNNING,
-            parameters=params.__dict__,
-            generations=[],
-            best_agent=None
+            parameters=dict(params.__dict__),
+            generations=previous.generations[:checkpoint.generation],
+            # A best agent from generations past the checkpoint is rediscovered or replaced
+            best_agent=previous.best_agent if previous.total_generations <= checkpoint.generation else None
+        )
+        
+        async def segment(result, checkpoint, stop_after):
+            return self.run_segment(params, result, checkpoint, stop_after)
+        
+        result, final = await run_in_segments(
+            params, segment, self.repository, self.checkpoint_interval, result, checkpoint
+        )
+        await self.repository.save(result)
+        if final is not None:
+            await self.repository.save_checkpoint(final)
+        key = result_cache_key(params)
+        if key is not None and self.cache is not None:
+            await self.cache.put(key, cache_entry(result))
+        return result
+    
+    def run_segment(
+        self,
+        params: EvolutionParameters,
+        result: Optional[EvolutionResult],
+        checkpoint: Optional[EvolutionCheckpoint],
+        stop_after: int,
+        profiler: Optional[PhaseProfile] = None
+    ) -> Tuple[EvolutionResult, Optional[EvolutionCheckpoint]]:
+        """run() from `checkpoint` up to generation `stop_after`, returning the new checkpoint"""
+        checkpoints: List[EvolutionCheckpoint] = []
+        result = self.run(
+            params,
+            result,
+            profiler=profiler,
+            checkpoint=checkpoint,
+            on_checkpoint=checkpoints.append,
+            stop_after=stop_after
         )
+        return result, checkpoints[-1] if checkpoints else None
+    
+    def run(
+        self,
+        params: EvolutionParameters,
+        result: Optional[EvolutionResult] = None,
+        on_generation: Optional[Callable[[GenerationStats], None]] = None,
+        profiler: Optional[PhaseProfile] = None,
+        checkpoint: Optional[EvolutionCheckpoint] = None,
+        on_checkpoint: Optional[Callable[[EvolutionCheckpoint], None]] = None,
+        stop_after: Optional[int] = None
+    ) -> EvolutionResult:
+        """Run the genetic algorithm synchronously
+        
+        CPU-bound and free of I/O, so it can be shipped to a worker process.
+        Fills in `result` when given (e.g. a PENDING job record) and calls
+        `on_generation` with each GenerationStats as soon as it is computed.
+        With a `profiler`, phase timings are recorded and set on result.profile.
+        
+        Starts from `checkpoint` instead of a random population when given.
+        With `stop_after`, stops after that generation and leaves the result
+        RUNNING; `on_checkpoint` receives the state at the point run() stops.
+        Island runs ignore all three and always run to completion.
+        """
+        if result is None:
+            result = EvolutionResult(
+                id="",
+                status=EvolutionStatus.RUNNING,
+                parameters=params.__dict__,
+                generations=[],
+                best_agent=None
+            )
+        result.status = EvolutionStatus.RUNNING
         
         start_time = time.time()
+        # Time already spent by earlier segments of this run
+        elapsed_ms = result.execution_time_ms or 0
         
         try:
-            # Initialize engine
-            engine = EvolutionEngine(params)
+            if params.islands > 1:
+                return self._run_islands(params, result, on_generation, start_time, profiler)
             
-            # Create initial population
-            population = [
-                Agent(
-                    id="",
-                    genome=engine.create_random_genome(),
-                    generation=0
-                )
-                for _ in range(params.population_size)
-            ]
+            # Initialize engine, with the checkpointed RNG when resuming
+            arrays, rng = decode_checkpoint(checkpoint) if checkpoint is not None else (None, None)
+            engine = create_engine(params, rng)
+            engine.profiler = profiler
+            engine.fitness_evaluator.executor = self.fitness_executor
+            
+            last = params.generations if stop_after is None else min(stop_after, params.generations)
+            if checkpoint is None:
+                # Create initial population
+                population = engine.initial_population()
+                first = 0
+            else:
+                # Restore the evaluated population; its successor is bred below
+                population = engine.from_arrays(arrays)
+                first = checkpoint.generation
+                if result.best_agent is None:
+                    result.best_agent = engine.best_agent(population)
             
             # Evolution loop
-            for gen in range(params.generations):
-                # Calculate fitness for all agents
-                for agent in population:
-                    agent.fitness = engine.calculate_fitness(agent.genome)
+            for gen in range(first, last):
+                if profiler is not None:
+                    profiler.begin_generation()
+                if checkpoint is not None and gen == first:
+                    # Breeding the restored population belongs to this generation
+                    population = engine.next_generation(population)
+                if profiler is not None:
+                    mark = profiler.clock()
+                
+                # Calculate fitness for new agents (survivors keep theirs)
+                evaluated = engine.evaluate(population)
+                if profiler is not None:
+                    mark = profiler.lap("fitness", mark, calls=evaluated)
                 
                 # Calculate generation stats
-                fitnesses = [a.fitness for a in population]
-                stats = GenerationStats(
-                    generation_number=gen + 1,
-                    avg_fitness=sum(fitnesses) / len(fitnesses),
-                    max_fitness=max(fitnesses),
-                    min_fitness=min(fitnesses),
-                    diversity_score=engine.calculate_diversity(population),
-                    population_size=len(population)
-                )
-                result.generations.append(stats)
+                stats = engine.generation_stats(population, gen + 1)
                 
                 # Track best agent
-                current_best = max(population, key=lambda a: a.fitness)
+                current_best = engine.best_agent(population)
                 if result.best_agent is None or current_best.fitness > result.best_agent.fitness:
-                    result.best_agent = Agent(
-                        id=current_best.id,
-                        genome=Genome(
-                            speed=current_best.genome.speed,
-                            strength=current_best.genome.strength,
-                            intelligence=current_best.genome.intelligence,
-                            cooperation=current_best.genome.cooperation,
-                            adaptability=current_best.genome.adaptability
-                        ),
-                        fitness=current_best.fitness,
-                        generation=current_best.generation
-                    )
+                    result.best_agent = current_best
+                if profiler is not None:
+                    profiler.lap("statistics", mark)
                 
-                # Evolve (skip on last generation)
-                if gen < params.generations - 1:
-                    survivors = engine.natural_selection(population)
-                    
-                    # Create offspring
-                    offspring = []
-                    while len(offspring) < params.population_size - len(survivors):
-                        parent1 = engine.tournament_select(survivors)
-                        parent2 = engine.tournament_select(survivors)
-                        child_genome = engine.crossover(parent1, parent2)
-                        child_genome = engine.mutate(child_genome)
-                        
-                        child = Agent(
-                            id="",
-                            genome=child_genome,
-                            generation=max(parent1.generation, parent2.generation) + 1
-                        )
-                        offspring.append(child)
-                    
-                    population = survivors + offspring
+                result.generations.append(stats)
+                if on_generation is not None:
+                    on_generation(stats)
+                
+                # Evolve (skip on the last generation of this call)
+                if gen < last - 1:
+                    population = engine.next_generation(population)
             
-            # Final fitness calculation
-            for agent in population:
-                agent.fitness = engine.calculate_fitness(agent.genome)
+            # The final population was evaluated in the last generation
+            fitness_cache_metrics.observe(engine.fitness_evaluator)
+            if profiler is not None:
+                profiler.end_generation()
+                result.profile = profiler.to_dict()
+            if on_checkpoint is not None:
+                on_checkpoint(encode_checkpoint(result.id, last, engine.to_arrays(population), engine.rng))
             
-            result.final_population = population
+            result.execution_time_ms = elapsed_ms + int((time.time() - start_time) * 1000)
+            if last < params.generations:
+                return result
+            
+            result.final_population = engine.to_agents(population)
             result.status = EvolutionStatus.COMPLETED
             result.completed_at = datetime.utcnow()
-            result.execution_time_ms = int((time.time() - start_time) * 1000)
-            
-            # Save to repository if available
-            if self.repository:
-                await self.repository.save(result)
             
             return result
-            
+        
         except Exception as e:
             result.status = EvolutionStatus.FAILED
             result.error_message = str(e)
             result.completed_at = datetime.utcnow()
-            result.execution_time_ms = int((time.time() - start_time) * 1000)
+            result.execution_time_ms = elapsed_ms + int((time.time() - start_time) * 1000)
             raise EvolutionError(f"Evolution failed: {str(e)}") from e
+    
+    def _run_islands(
+        self,
+        params: EvolutionParameters,
+        result: EvolutionResult,
+        on_generation: Optional[Callable[[GenerationStats], None]],
+        start_time: float,
+        profiler: Optional[PhaseProfile]
+    ) -> EvolutionResult:
+        """Island-model run: sub-populations in worker processes, merged stats"""
+        from src.application.island_model import IslandModel
+        
+        generations, best_agent, final_population = IslandModel(params, self.island_executor).run(
+            on_generation, profiler
+        )
+        if profiler is not None:
+            result.profile = profiler.to_dict()
+        result.generations.extend(generations)
+        result.best_agent = best_agent
+        result.final_population = final_population
+        result.status = EvolutionStatus.COMPLETED
+        result.completed_at = datetime.utcnow()
+        result.execution_time_ms = int((time.time() - start_time) * 1000)
+        return result
 
 
 class GetEvolutionResultUseCase:
@@ -222,9 +752,24 @@ class GetEvolutionResultUseCase:
     def __init__(self, repository: EvolutionRepository):
         self.repository = repository
     
-    async def execute(self, result_id: str) -> Optional[EvolutionResult]:
+    async def execute(
+        self, result_id: str, include_generations: bool = True
+    ) -> Optional[EvolutionResult]:
         """Get evolution result by ID"""
-        return await self.repository.get_by_id(result_id)
+        return await self.repository.get_by_id(result_id, include_generations)
+
+
+class GetPopulationUseCase:
+    """Use case for paging a result's final population"""
+    
+    def __init__(self, repository: EvolutionRepository):
+        self.repository = repository
+    
+    async def execute(
+        self, result_id: str, limit: int = 100, offset: int = 0, by_fitness: bool = False
+    ) -> Optional[PopulationPage]:
+        """Page of agents in stored order, or the fittest first (top-k)"""
+        return await self.repository.get_population(result_id, limit, offset, by_fitness)
 
 
 class ListEvolutionResultsUseCase:
@@ -233,6 +778,19 @@ class ListEvolutionResultsUseCase:
     def __init__(self, repository: EvolutionRepository):
         self.repository = repository
     
-    async def execute(self, limit: int = 100, offset: int = 0) -> List[EvolutionResult]:
+    async def execute(
+        self, limit: int = 100, offset: int = 0, include_generations: bool = True
+    ) -> List[EvolutionResult]:
         """List evolution results with pagination"""
-        return await self.repository.list_all(limit, offset)
+        return await self.repository.list_all(limit, offset, include_generations)
+
+
+class GetEvolutionStatsUseCase:
+    """Use case for dashboard statistics"""
+    
+    def __init__(self, repository: EvolutionRepository):
+        self.repository = repository
+    
+    async def execute(self, recent: int = 10) -> EvolutionAggregates:
+        """Read the repository's running aggregates"""
+        return await self.repository.get_aggregates(recent)
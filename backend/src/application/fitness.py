@@ -0,0 +1,259 @@
+"""
+Fitness evaluation
+Application layer - Registered, memoized and batched fitness functions
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+# Batch fitness: (N x traits) genome array -> (N,) fitness array
+FitnessFunction = Callable[[np.ndarray], np.ndarray]
+
+# Default bound on memoized genomes per engine
+FITNESS_CACHE_SIZE = 10_000
+
+# Genomes per task when a batch is spread over worker processes
+FITNESS_CHUNK_SIZE = 64
+
+
+@dataclass(frozen=True)
+class FitnessSpec:
+    """A registered fitness function and how it should be evaluated"""
+    name: str
+    function: FitnessFunction
+    # Memoize by genome (worth it when a call costs more than a dict lookup)
+    memoize: bool = True
+    # Spread large batches over the fitness worker pool
+    parallel: bool = True
+
+
+_FITNESS_FUNCTIONS: Dict[str, FitnessSpec] = {}
+
+
+def register_fitness(
+    name: str, memoize: bool = True, parallel: bool = True
+) -> Callable[[FitnessFunction], FitnessFunction]:
+    """Decorator registering a batch fitness function under `name`
+    
+    Register at import time of a module, so worker processes (which look
+    functions up by name) see the same registry.
+    """
+    def decorator(function: FitnessFunction) -> FitnessFunction:
+        _FITNESS_FUNCTIONS[name] = FitnessSpec(name, function, memoize, parallel)
+        return function
+    return decorator
+
+
+def get_fitness(name: str) -> FitnessSpec:
+    """Registered fitness function by name"""
+    try:
+        return _FITNESS_FUNCTIONS[name]
+    except KeyError:
+        raise ValueError(f"Unknown fitness function: {name}") from None
+
+
+def fitness_names() -> List[str]:
+    """Names of all registered fitness functions"""
+    return sorted(_FITNESS_FUNCTIONS)
+
+
+def evaluate_chunk(name: str, genomes: np.ndarray) -> np.ndarray:
+    """Worker-process entry point: score one chunk with a registered function"""
+    return np.asarray(get_fitness(name).function(genomes), dtype=np.float64)
+
+
+@register_fitness("trait_sum", memoize=False, parallel=False)
+def trait_sum(genomes: np.ndarray) -> np.ndarray:
+    """Sum of all traits (Genome.fitness_score, batched); the default"""
+    return genomes.sum(axis=1)
+
+
+# Trait order follows TRAIT_NAMES; weights sum to 5 like trait_sum's range
+TRAIT_WEIGHTS = np.array([0.75, 0.75, 1.5, 0.75, 1.25])
+
+
+@register_fitness("weighted_traits", memoize=False, parallel=False)
+def weighted_traits(genomes: np.ndarray) -> np.ndarray:
+    """Weighted trait sum favouring intelligence and adaptability"""
+    return genomes @ TRAIT_WEIGHTS
+
+
+@register_fitness("balanced", memoize=False, parallel=False)
+def balanced(genomes: np.ndarray) -> np.ndarray:
+    """Multi-objective score: 5 x geometric mean of physical, mental and social objectives
+    
+    Rewards genomes that do well on all three rather than excelling at one.
+    """
+    physical = (genomes[:, 0] + genomes[:, 1]) / 2
+    mental = (genomes[:, 2] + genomes[:, 4]) / 2
+    social = genomes[:, 3]
+    return 5.0 * np.cbrt(physical * mental * social)
+
+
+# Fixed opponents, so arena fitness is a pure function of the genome
+ARENA_OPPONENTS = np.random.default_rng(20260204).random((256, 5))
+ARENA_ROUNDS = 16
+
+
+@register_fitness("arena")
+def arena(genomes: np.ndarray) -> np.ndarray:
+    """Simulated duels against a fixed field of opponents, scaled to [0, 5]
+    
+    Each round, attack (speed, strength) meets defence (intelligence,
+    adaptability) and cooperation recovers part of the damage taken; the
+    score is the expected share of duels won.
+    """
+    attack = (genomes[:, 0:1] + genomes[:, 1:2]) / 2
+    defence = (genomes[:, 2:3] + genomes[:, 4:5]) / 2
+    recovery = genomes[:, 3:4] * 0.1
+    opponent_attack = (ARENA_OPPONENTS[:, 0] + ARENA_OPPONENTS[:, 1]) / 2
+    opponent_defence = (ARENA_OPPONENTS[:, 2] + ARENA_OPPONENTS[:, 4]) / 2
+    opponent_recovery = ARENA_OPPONENTS[:, 3] * 0.1
+    
+    health = np.ones((genomes.shape[0], ARENA_OPPONENTS.shape[0]))
+    opponent_health = np.ones_like(health)
+    for _ in range(ARENA_ROUNDS):
+        dealt = np.maximum(attack - opponent_defence * 0.5, 0.02)
+        taken = np.maximum(opponent_attack - defence * 0.5, 0.02)
+        opponent_health = np.minimum(opponent_health - dealt + opponent_recovery, 1.0)
+        health = np.minimum(health - taken + recovery, 1.0)
+    won = 1.0 / (1.0 + np.exp(-8.0 * (health - opponent_health)))
+    return 5.0 * won.mean(axis=1)
+
+
+class FitnessCache:
+    """Least-recently-used fitness values keyed by genome bytes"""
+    
+    def __init__(self, max_entries: int = FITNESS_CACHE_SIZE):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: bytes) -> Optional[float]:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: bytes, value: float) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class FitnessEvaluator:
+    """Evaluates genome rows, computing only those not seen before
+    
+    Genomes are keyed by their raw float64 bytes, so a row is a hit only if
+    every trait is bit-for-bit identical. All misses of a call are scored as
+    one batch; with an `executor`, batches of functions registered as
+    parallel are split into `chunk_size` chunks scored in worker processes.
+    cache_size=0 disables memoization; by default it follows the spec.
+    """
+    
+    def __init__(
+        self,
+        fitness: Union[str, FitnessFunction] = "trait_sum",
+        cache_size: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = FITNESS_CHUNK_SIZE
+    ):
+        if isinstance(fitness, str):
+            self.spec: Optional[FitnessSpec] = get_fitness(fitness)
+        else:
+            # Unregistered callables are memoized and evaluated in-process only
+            self.spec = next(
+                (spec for spec in _FITNESS_FUNCTIONS.values() if spec.function is fitness), None
+            )
+        self.function = fitness if self.spec is None else self.spec.function
+        memoize = self.spec.memoize if self.spec is not None else True
+        if cache_size is None:
+            cache_size = FITNESS_CACHE_SIZE if memoize else 0
+        self.cache = FitnessCache(cache_size) if cache_size > 0 else None
+        self.executor = executor
+        self.chunk_size = chunk_size
+    
+    @property
+    def hits(self) -> int:
+        return self.cache.hits if self.cache is not None else 0
+    
+    @property
+    def misses(self) -> int:
+        return self.cache.misses if self.cache is not None else 0
+    
+    def evaluate(self, genomes: np.ndarray) -> np.ndarray:
+        """Fitness of every row of a (N x traits) array"""
+        cache = self.cache
+        if cache is None or genomes.shape[0] == 0:
+            return self._compute(genomes)
+        
+        genomes = np.ascontiguousarray(genomes, dtype=np.float64)
+        fitness = np.empty(genomes.shape[0])
+        keys = [row.tobytes() for row in genomes]
+        missing: List[int] = []
+        # First occurrence of each uncached genome, so duplicates compute once
+        pending: Dict[bytes, int] = {}
+        for i, key in enumerate(keys):
+            if key in pending:
+                continue
+            value = cache.get(key)
+            if value is None:
+                pending[key] = len(missing)
+                missing.append(i)
+            else:
+                fitness[i] = value
+        if missing:
+            computed = self._compute(genomes[missing])
+            for key, position in pending.items():
+                cache.put(key, float(computed[position]))
+            for i, key in enumerate(keys):
+                position = pending.get(key)
+                if position is not None:
+                    fitness[i] = computed[position]
+        return fitness
+    
+    def _compute(self, genomes: np.ndarray) -> np.ndarray:
+        """Score a batch, chunked across the executor when worthwhile"""
+        spec = self.spec
+        size = genomes.shape[0]
+        if self.executor is None or spec is None or not spec.parallel or size <= self.chunk_size:
+            return np.asarray(self.function(genomes), dtype=np.float64)
+        chunks = [genomes[i:i + self.chunk_size] for i in range(0, size, self.chunk_size)]
+        return np.concatenate(list(self.executor.map(evaluate_chunk, repeat(spec.name), chunks)))
+
+
+class FitnessCacheMetrics:
+    """Process-wide fitness cache hits and misses, for export as metrics"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def observe(self, evaluator: FitnessEvaluator) -> None:
+        """Add a finished run's evaluator counts"""
+        with self._lock:
+            self.hits += evaluator.hits
+            self.misses += evaluator.misses
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+fitness_cache_metrics = FitnessCacheMetrics()
@@ -0,0 +1,243 @@
+"""
+Island-model evolution
+Application layer - Sub-populations evolved in parallel with periodic migration
+"""
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, List, Optional, Tuple
+
+from src.domain.entities import Agent, EvolutionParameters, GenerationStats, TRAIT_NAMES
+from src.application.evolution_use_cases import create_engine
+from src.application.diversity import pairwise_distance
+from src.application.profiling import PhaseProfile
+from src.application.rng import EvolutionRandom
+
+
+@dataclass
+class IslandGeneration:
+    """One island's statistics for one generation, in mergeable form"""
+    stats: GenerationStats
+    trait_sums: List[float]
+    trait_squares: List[float]
+
+
+@dataclass
+class IslandEpoch:
+    """What a worker sends back after evolving an island between migrations"""
+    population: Any
+    generations: List[IslandGeneration]
+    best_agent: Agent
+    rng: EvolutionRandom
+    profile: Optional[PhaseProfile] = None
+
+
+class InlineExecutor(Executor):
+    """Runs each submitted call immediately, in the calling thread
+    
+    For island runs that already execute inside a worker process, where
+    another pool would only oversubscribe the CPU.
+    """
+    
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def island_sizes(population_size: int, islands: int) -> List[int]:
+    """Split the population as evenly as possible across islands"""
+    base, extra = divmod(population_size, islands)
+    return [base + (1 if i < extra else 0) for i in range(islands)]
+
+
+def island_parameters(params: EvolutionParameters, size: int) -> EvolutionParameters:
+    """Single-population parameters for one island"""
+    return replace(params, population_size=size, islands=1)
+
+
+def evolve_island(
+    params: EvolutionParameters,
+    rng: EvolutionRandom,
+    population: Any,
+    first_generation: int,
+    generations: int,
+    profile: bool = False
+) -> IslandEpoch:
+    """Worker-process entry point: evolve one island for `generations` steps
+    
+    Starts from a fresh population when `population` is None, otherwise
+    breeds the next generation from the (evaluated, post-migration) one.
+    The island's RNG travels with it, so its stream continues across epochs.
+    """
+    engine = create_engine(params, rng)
+    profiler = PhaseProfile() if profile else None
+    engine.profiler = profiler
+    
+    fresh = population is None
+    if fresh:
+        population = engine.initial_population()
+    
+    records: List[IslandGeneration] = []
+    best: Optional[Agent] = None
+    for offset in range(generations):
+        if profiler is not None:
+            profiler.begin_generation()
+        if offset > 0 or not fresh:
+            population = engine.next_generation(population)
+        if profiler is not None:
+            mark = profiler.clock()
+        
+        evaluated = engine.evaluate(population)
+        if profiler is not None:
+            mark = profiler.lap("fitness", mark, calls=evaluated)
+        
+        sums, squares = engine.trait_moments(population)
+        records.append(IslandGeneration(
+            stats=engine.generation_stats(population, first_generation + offset),
+            trait_sums=sums,
+            trait_squares=squares
+        ))
+        current_best = engine.best_agent(population)
+        if best is None or current_best.fitness > best.fitness:
+            best = current_best
+        if profiler is not None:
+            profiler.lap("statistics", mark)
+    
+    return IslandEpoch(
+        population=population,
+        generations=records,
+        best_agent=best,
+        rng=rng,
+        profile=profiler
+    )
+
+
+def merge_generation(records: List[IslandGeneration]) -> GenerationStats:
+    """Combine per-island statistics into whole-population statistics"""
+    total = sum(r.stats.population_size for r in records)
+    fitness_sum = sum(r.stats.avg_fitness * r.stats.population_size for r in records)
+    
+    variance = 0.0
+    for trait in range(len(TRAIT_NAMES)):
+        mean = sum(r.trait_sums[trait] for r in records) / total
+        square_mean = sum(r.trait_squares[trait] for r in records) / total
+        variance += max(0.0, square_mean - mean * mean)
+    
+    return GenerationStats(
+        generation_number=records[0].stats.generation_number,
+        avg_fitness=fitness_sum / total,
+        max_fitness=max(r.stats.max_fitness for r in records),
+        min_fitness=min(r.stats.min_fitness for r in records),
+        diversity_score=variance / len(TRAIT_NAMES) if total > 1 else 0.0,
+        population_size=total,
+        pairwise_distance=pairwise_distance(total, variance)
+    )
+
+
+class IslandModel:
+    """Evolves `params.islands` sub-populations concurrently
+    
+    Each island runs the regular engine in a worker process for
+    `migration_interval` generations; the parent then copies every island's
+    `migration_size` elites over the worst agents of the next island (ring
+    topology) and starts the next epoch. Per-generation statistics from all
+    islands are merged, so callers see a single population.
+    """
+    
+    def __init__(self, params: EvolutionParameters, executor: Optional[Executor] = None):
+        self.params = params
+        self._executor = executor
+    
+    def run(
+        self,
+        on_generation: Optional[Callable[[GenerationStats], None]] = None,
+        profiler: Optional[PhaseProfile] = None
+    ) -> Tuple[List[GenerationStats], Agent, List[Agent]]:
+        """Return merged generation stats, the best agent and the final population
+        
+        With a `profiler`, each generation's phases are summed across islands
+        (worker CPU time, not wall time) and migrations are timed separately.
+        """
+        params = self.params
+        island_params = [
+            island_parameters(params, size)
+            for size in island_sizes(params.population_size, params.islands)
+        ]
+        # One independent stream per island, all derived from the run's seed
+        rngs = EvolutionRandom(params.random_seed).spawn(params.islands)
+        engines = [create_engine(p, rng) for p, rng in zip(island_params, rngs)]
+        
+        executor = self._executor
+        owns_executor = executor is None
+        if owns_executor:
+            executor = ProcessPoolExecutor(max_workers=min(params.islands, os.cpu_count() or 1))
+        
+        populations: List[Any] = [None] * params.islands
+        merged: List[GenerationStats] = []
+        best: Optional[Agent] = None
+        try:
+            epoch = 0
+            while len(merged) < params.generations:
+                if epoch > 0:
+                    if profiler is not None:
+                        mark = profiler.clock()
+                    populations = self._migrate(engines, populations)
+                    if profiler is not None:
+                        profiler.lap("migration", mark, calls=params.islands)
+                
+                first = len(merged) + 1
+                count = min(params.migration_interval, params.generations - len(merged))
+                futures = [
+                    executor.submit(
+                        evolve_island,
+                        island_params[i],
+                        rngs[i],
+                        populations[i],
+                        first,
+                        count,
+                        profiler is not None
+                    )
+                    for i in range(params.islands)
+                ]
+                epochs = [future.result() for future in futures]
+                
+                populations = [e.population for e in epochs]
+                rngs = [e.rng for e in epochs]
+                for e in epochs:
+                    if best is None or e.best_agent.fitness > best.fitness:
+                        best = e.best_agent
+                for offset in range(count):
+                    if profiler is not None:
+                        profiler.begin_generation()
+                        for e in epochs:
+                            profiler.absorb(e.profile.generations[offset])
+                        profiler.end_generation()
+                    stats = merge_generation([e.generations[offset] for e in epochs])
+                    merged.append(stats)
+                    if on_generation is not None:
+                        on_generation(stats)
+                epoch += 1
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+        
+        final_population: List[Agent] = []
+        for engine, population in zip(engines, populations):
+            final_population.extend(engine.to_agents(population))
+        return merged, best, final_population
+    
+    def _migrate(self, engines: List[Any], populations: List[Any]) -> List[Any]:
+        """Ring migration: island i's elites replace island i+1's worst"""
+        size = self.params.migration_size
+        elites = [
+            engine.select_elites(population, size)
+            for engine, population in zip(engines, populations)
+        ]
+        return [
+            engine.replace_worst(population, elites[i - 1])
+            for i, (engine, population) in enumerate(zip(engines, populations))
+        ]
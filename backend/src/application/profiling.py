@@ -0,0 +1,139 @@
+"""
+Per-phase profiling
+Application layer - Optional timing of evolution hot paths
+"""
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Phases timed by the engines and RunEvolutionUseCase
+PHASES = ("fitness", "selection", "variation", "statistics", "migration", "persistence")
+
+
+def should_profile(requested: bool, sample_rate: float = 0.0) -> bool:
+    """Profile when asked to, or for a sample_rate fraction of other runs"""
+    return requested or (sample_rate > 0 and random.random() < sample_rate)
+
+
+class PhaseProfile:
+    """Cumulative time and call counts per phase, per generation
+    
+    Instrumented code holds an Optional[PhaseProfile] and only touches the
+    clock when one is set, so runs without profiling pay a None check per
+    phase boundary and nothing else.
+    """
+    
+    clock = staticmethod(time.perf_counter)
+    
+    def __init__(self):
+        # Per generation: phase -> [seconds, calls]
+        self.generations: List[Dict[str, List[float]]] = []
+        self.totals: Dict[str, List[float]] = {}
+        self._current: Optional[Dict[str, List[float]]] = None
+    
+    def begin_generation(self) -> None:
+        """Attribute subsequent phases to a new generation"""
+        self._current = {}
+        self.generations.append(self._current)
+    
+    def end_generation(self) -> None:
+        """Attribute subsequent phases to the run as a whole"""
+        self._current = None
+    
+    def add(self, phase: str, seconds: float, calls: int = 1) -> None:
+        """Record time spent in a phase"""
+        for bucket in (self._current, self.totals):
+            if bucket is None:
+                continue
+            entry = bucket.get(phase)
+            if entry is None:
+                bucket[phase] = [seconds, calls]
+            else:
+                entry[0] += seconds
+                entry[1] += calls
+    
+    def lap(self, phase: str, since: float, calls: int = 1) -> float:
+        """Record time since `since` against a phase and return the current clock"""
+        now = self.clock()
+        self.add(phase, now - since, calls)
+        return now
+    
+    def absorb(self, generation: Dict[str, List[float]]) -> None:
+        """Add another profile's generation into the current one"""
+        for phase, (seconds, calls) in generation.items():
+            self.add(phase, seconds, int(calls))
+    
+    @classmethod
+    def merge(cls, profiles: List["PhaseProfile"]) -> "PhaseProfile":
+        """One profile for consecutive segments of a run"""
+        merged = cls()
+        for profile in profiles:
+            merged.generations.extend(profile.generations)
+            for phase, (seconds, calls) in profile.totals.items():
+                merged.add(phase, seconds, int(calls))
+        return merged
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "totals": self._phases_to_dict(self.totals),
+            "generations": [
+                {"generation_number": number, "phases": self._phases_to_dict(phases)}
+                for number, phases in enumerate(self.generations, start=1)
+            ]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PhaseProfile":
+        """Rebuild a profile reported by another process"""
+        profile = cls()
+        profile.totals = cls._phases_from_dict(data.get("totals", {}))
+        profile.generations = [
+            cls._phases_from_dict(generation["phases"])
+            for generation in data.get("generations", [])
+        ]
+        return profile
+    
+    @staticmethod
+    def _phases_to_dict(phases: Dict[str, List[float]]) -> Dict[str, Dict[str, Any]]:
+        return {
+            phase: {"time_ms": round(seconds * 1000, 3), "calls": int(calls)}
+            for phase, (seconds, calls) in phases.items()
+        }
+    
+    @staticmethod
+    def _phases_from_dict(phases: Dict[str, Dict[str, Any]]) -> Dict[str, List[float]]:
+        return {
+            phase: [entry["time_ms"] / 1000, entry["calls"]]
+            for phase, entry in phases.items()
+        }
+
+
+class PhaseMetrics:
+    """Process-wide phase totals across all profiled runs, for export as metrics"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seconds: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+        self._calls: Dict[str, int] = {phase: 0 for phase in PHASES}
+        self.runs = 0
+    
+    def observe(self, profile: Dict[str, Any]) -> None:
+        """Fold a finished run's reported profile (PhaseProfile.to_dict()) into the counters"""
+        with self._lock:
+            self.runs += 1
+            for phase, entry in profile.get("totals", {}).items():
+                self._seconds[phase] = self._seconds.get(phase, 0.0) + entry["time_ms"] / 1000
+                self._calls[phase] = self._calls.get(phase, 0) + entry["calls"]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the counters: runs, seconds and calls per phase"""
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "seconds": dict(self._seconds),
+                "calls": dict(self._calls)
+            }
+
+
+phase_metrics = PhaseMetrics()
@@ -0,0 +1,113 @@
+"""
+Selection strategies
+Application layer - Survivor and parent selection over fitness arrays
+
+Every function works on a float64 fitness array and returns indices into it,
+so both engines share one implementation: the vectorized engine passes its
+fitness column, the standard engine builds the array once per generation.
+"""
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+ParentSelector = Callable[[np.ndarray, int, np.random.Generator, int], np.ndarray]
+
+
+def top_k(fitness: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k fittest, best first, in O(n + k log k)
+    
+    Introselect (argpartition) finds the k best without sorting the rest;
+    only those k are ordered. Ties keep their original order.
+    """
+    n = len(fitness)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        candidates = np.sort(np.argpartition(-fitness, k - 1)[:k])
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-fitness[candidates], kind="stable")]
+
+
+def tournament(
+    fitness: np.ndarray, count: int, generator: np.random.Generator, tournament_size: int
+) -> np.ndarray:
+    """Winners of `count` tournaments of distinct contestants, run at once"""
+    size = len(fitness)
+    tournament_size = min(tournament_size, size)
+    if tournament_size < size:
+        # Floyd's sampling, one column at a time for all tournaments:
+        # distinct contestants in O(count * tournament_size^2), not O(count * size)
+        contestants = np.empty((count, tournament_size), dtype=np.intp)
+        for j in range(tournament_size):
+            upper = size - tournament_size + j
+            draw = generator.integers(0, upper + 1, size=count)
+            clash = (contestants[:, :j] == draw[:, None]).any(axis=1)
+            contestants[:, j] = np.where(clash, upper, draw)
+    else:
+        contestants = np.broadcast_to(np.arange(size), (count, size))
+    winners = np.argmax(fitness[contestants], axis=1)
+    return contestants[np.arange(count), winners]
+
+
+def _roulette(weights: np.ndarray, pointers: np.ndarray) -> np.ndarray:
+    """Indices whose cumulative weight interval contains each pointer in [0, 1)"""
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    if total <= 0:
+        return np.minimum((pointers * len(weights)).astype(np.intp), len(weights) - 1)
+    return np.minimum(
+        np.searchsorted(cumulative, pointers * total, side="right"), len(weights) - 1
+    )
+
+
+def rank(
+    fitness: np.ndarray, count: int, generator: np.random.Generator, tournament_size: int = 0
+) -> np.ndarray:
+    """Linear ranking: the i-th worst is drawn with weight i"""
+    weights = np.empty(len(fitness))
+    weights[np.argsort(fitness, kind="stable")] = np.arange(1, len(fitness) + 1)
+    return _roulette(weights, generator.random(count))
+
+
+def stochastic_universal(
+    fitness: np.ndarray, count: int, generator: np.random.Generator, tournament_size: int = 0
+) -> np.ndarray:
+    """Fitness-proportionate sampling with evenly spaced pointers (SUS)
+    
+    One random offset places all `count` pointers, so each agent is drawn
+    within one of its expected number of times. Negative fitness is shifted
+    to zero. The picks come out in population order and are shuffled before
+    being paired.
+    """
+    weights = fitness - min(0.0, float(fitness.min()))
+    pointers = (generator.random() + np.arange(count)) / count
+    return generator.permutation(_roulette(weights, pointers))
+
+
+def truncation(
+    fitness: np.ndarray, count: int, generator: np.random.Generator, tournament_size: int = 0
+) -> np.ndarray:
+    """Uniform draws from the pool (which natural selection already truncated)"""
+    return generator.integers(0, len(fitness), size=count)
+
+
+PARENT_SELECTORS: Dict[str, ParentSelector] = {
+    "tournament": tournament,
+    "rank": rank,
+    "sus": stochastic_universal,
+    "truncation": truncation,
+}
+
+
+def select_parent_pairs(
+    strategy: str,
+    fitness: np.ndarray,
+    count: int,
+    generator: np.random.Generator,
+    tournament_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Both parents for `count` offspring, drawn in a single batch"""
+    chosen = PARENT_SELECTORS[strategy](fitness, 2 * count, generator, tournament_size)
+    return chosen[:count], chosen[count:]
@@ -0,0 +1,276 @@
+"""
+Vectorized evolution engine
+Application layer - NumPy-backed genetic algorithm over the whole population
+"""
+import os
+import uuid
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.entities import (
+    Agent, EvolutionParameters, GenerationStats, Genome, TRAIT_NAMES
+)
+from src.application.diversity import TraitMoments
+from src.application.fitness import FitnessEvaluator
+from src.application.profiling import PhaseProfile
+from src.application.rng import EvolutionRandom
+from src.application.selection import select_parent_pairs, top_k, tournament
+
+
+def new_ids(count: int) -> np.ndarray:
+    """`count` random (version 4) UUIDs as a (count x 16) byte array
+    
+    Drawn from the OS, not the run's RNG, so ids never shift a seeded run.
+    """
+    ids = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    ids[:, 6] = (ids[:, 6] & 0x0F) | 0x40
+    ids[:, 8] = (ids[:, 8] & 0x3F) | 0x80
+    return ids
+
+
+@dataclass
+class PopulationArray:
+    """Whole population held as contiguous arrays (one row per agent)"""
+    genomes: np.ndarray      # (N, len(TRAIT_NAMES)) float64
+    fitness: np.ndarray      # (N,) float64
+    generation: np.ndarray   # (N,) int64
+    # (N, 16) uint8 agent UUIDs, assigned once when each agent is created
+    ids: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        return self.genomes.shape[0]
+    
+    def take(self, indices: np.ndarray) -> "PopulationArray":
+        """Subset of rows in the given order"""
+        return PopulationArray(
+            genomes=self.genomes[indices],
+            fitness=self.fitness[indices],
+            generation=self.generation[indices],
+            ids=self.ids[indices] if self.ids is not None else None
+        )
+    
+    @classmethod
+    def concat(cls, first: "PopulationArray", second: "PopulationArray") -> "PopulationArray":
+        both = first.ids is not None and second.ids is not None
+        return cls(
+            genomes=np.concatenate((first.genomes, second.genomes)),
+            fitness=np.concatenate((first.fitness, second.fitness)),
+            generation=np.concatenate((first.generation, second.generation)),
+            ids=np.concatenate((first.ids, second.ids)) if both else None
+        )
+    
+    def agent_id(self, index: int) -> str:
+        """The row's agent id as a UUID string"""
+        return str(uuid.UUID(bytes=self.ids[index].tobytes()))
+
+
+class VectorizedEvolutionEngine:
+    """Evolution engine operating on an (N x traits) float array
+    
+    Mirrors EvolutionEngine step for step, but every operation is a batched
+    array operation instead of a per-agent loop over Genome dataclasses.
+    """
+    
+    MUTATION_STEP = 0.2
+    
+    def __init__(self, params: EvolutionParameters, rng: Optional[EvolutionRandom] = None):
+        self.params = params
+        self.rng = rng if rng is not None else EvolutionRandom(params.random_seed)
+        self.trait_count = len(TRAIT_NAMES)
+        self.profiler: Optional[PhaseProfile] = None
+        self.fitness_evaluator = FitnessEvaluator(params.fitness_function)
+        # Running trait moments of the last population next_generation returned
+        self._moments: Optional[TraitMoments] = None
+        self._tracked: Optional[PopulationArray] = None
+        # A population and how many of its leading rows already have fitness
+        self._evaluated: Tuple[Optional[PopulationArray], int] = (None, 0)
+    
+    def create_random_genomes(self, count: int) -> np.ndarray:
+        """Create a (count x traits) array of random genomes"""
+        return self.rng.generator.uniform(0.0, 1.0, size=(count, self.trait_count))
+    
+    def calculate_fitness(self, genomes: np.ndarray) -> np.ndarray:
+        """Calculate fitness for every row"""
+        return self.fitness_evaluator.function(genomes)
+    
+    def mutate(self, genomes: np.ndarray) -> np.ndarray:
+        """Mutate genomes with a per-trait mutation mask, clamped to [0, 1]"""
+        mask = self.rng.generator.random(genomes.shape) < self.params.mutation_rate
+        change = self.rng.generator.uniform(-self.MUTATION_STEP, self.MUTATION_STEP, size=genomes.shape)
+        return np.clip(genomes + mask * change, 0.0, 1.0)
+    
+    def crossover(self, parents1: np.ndarray, parents2: np.ndarray) -> np.ndarray:
+        """Uniform crossover of row-aligned parent genomes"""
+        mask = self.rng.generator.random(parents1.shape) < 0.5
+        return np.where(mask, parents1, parents2)
+    
+    def tournament_select(self, fitness: np.ndarray, count: int) -> np.ndarray:
+        """Run `count` tournaments at once and return the winning indices"""
+        return tournament(fitness, count, self.rng.generator, self.params.tournament_size)
+    
+    def natural_selection(self, population: PopulationArray) -> PopulationArray:
+        """Keep the fittest survival_rate fraction, best first"""
+        return population.take(self._survivor_indices(population))
+    
+    def _survivor_indices(self, population: PopulationArray) -> np.ndarray:
+        survivors_count = max(1, int(len(population) * self.params.survival_rate))
+        return top_k(population.fitness, survivors_count)
+    
+    def calculate_diversity(self, genomes: np.ndarray) -> float:
+        """Average per-trait variance"""
+        if genomes.shape[0] < 2:
+            return 0.0
+        return float(genomes.var(axis=0).mean())
+    
+    def _moments_for(self, population: PopulationArray) -> TraitMoments:
+        """Trait moments of the population, rebuilt unless it is the tracked one"""
+        if population is not self._tracked:
+            self._moments = TraitMoments.of(population.genomes)
+            self._tracked = population
+        return self._moments
+    
+    def _track(
+        self,
+        population: PopulationArray,
+        kept: np.ndarray,
+        added: np.ndarray,
+        result: PopulationArray
+    ) -> None:
+        """Carry the running moments from population over to result
+        
+        The delta is only applied when it touches fewer rows than a rebuild;
+        otherwise the moments are rebuilt from result when next needed.
+        """
+        if population is not self._tracked:
+            return
+        if len(population) - len(kept) + len(added) >= len(result):
+            self._tracked = None
+            return
+        culled_mask = np.ones(len(population), dtype=bool)
+        culled_mask[kept] = False
+        self._moments.remove(population.genomes[culled_mask])
+        self._moments.add(added)
+        self._tracked = result
+    
+    def initial_population(self) -> PopulationArray:
+        """Create the generation-zero population"""
+        size = self.params.population_size
+        return PopulationArray(
+            genomes=self.create_random_genomes(size),
+            fitness=np.zeros(size),
+            generation=np.zeros(size, dtype=np.int64),
+            ids=new_ids(size)
+        )
+    
+    def evaluate(self, population: PopulationArray) -> int:
+        """Calculate fitness for rows that need it; returns how many were evaluated"""
+        tracked, done = self._evaluated
+        start = done if population is tracked else 0
+        if start < len(population):
+            fitness = population.fitness.copy()
+            fitness[start:] = self.fitness_evaluator.evaluate(population.genomes[start:])
+            population.fitness = fitness
+        self._evaluated = (population, len(population))
+        return len(population) - start
+    
+    def generation_stats(self, population: PopulationArray, generation_number: int) -> GenerationStats:
+        """Summarize an evaluated population"""
+        fitness = population.fitness
+        moments = self._moments_for(population)
+        return GenerationStats(
+            generation_number=generation_number,
+            avg_fitness=float(fitness.mean()),
+            max_fitness=float(fitness.max()),
+            min_fitness=float(fitness.min()),
+            diversity_score=moments.diversity(),
+            population_size=len(population),
+            pairwise_distance=moments.pairwise_distance()
+        )
+    
+    def best_agent(self, population: PopulationArray) -> Agent:
+        """Detached copy of the fittest agent"""
+        return self._agent_at(population, int(np.argmax(population.fitness)))
+    
+    def next_generation(self, population: PopulationArray) -> PopulationArray:
+        """Select survivors and fill the population with offspring"""
+        profiler = self.profiler
+        if profiler is not None:
+            mark = profiler.clock()
+        
+        kept = self._survivor_indices(population)
+        survivors = population.take(kept)
+        offspring_count = self.params.population_size - len(survivors)
+        if offspring_count <= 0:
+            self._track(population, kept, population.genomes[:0], survivors)
+            self._evaluated = (survivors, len(survivors))
+            if profiler is not None:
+                profiler.lap("selection", mark)
+            return survivors
+        
+        parents1, parents2 = select_parent_pairs(
+            self.params.selection_strategy,
+            survivors.fitness,
+            offspring_count,
+            self.rng.generator,
+            self.params.tournament_size
+        )
+        if profiler is not None:
+            mark = profiler.lap("selection", mark, calls=2 * offspring_count + 1)
+        
+        genomes = self.crossover(survivors.genomes[parents1], survivors.genomes[parents2])
+        offspring = PopulationArray(
+            genomes=self.mutate(genomes),
+            fitness=np.zeros(offspring_count),
+            generation=np.maximum(
+                survivors.generation[parents1], survivors.generation[parents2]
+            ) + 1,
+            ids=new_ids(offspring_count)
+        )
+        next_population = PopulationArray.concat(survivors, offspring)
+        self._track(population, kept, offspring.genomes, next_population)
+        self._evaluated = (next_population, len(survivors))
+        if profiler is not None:
+            profiler.lap("variation", mark, calls=offspring_count)
+        return next_population
+    
+    def select_elites(self, population: PopulationArray, count: int) -> PopulationArray:
+        """The `count` fittest agents, best first"""
+        return population.take(top_k(population.fitness, count))
+    
+    def replace_worst(self, population: PopulationArray, migrants: PopulationArray) -> PopulationArray:
+        """Replace the least fit agents with migrants, keeping the size
+        
+        Migrants get new ids, since their originals live on in the source island.
+        """
+        kept = population.take(top_k(population.fitness, len(population) - len(migrants)))
+        return PopulationArray.concat(kept, replace(migrants, ids=new_ids(len(migrants))))
+    
+    def trait_moments(self, population: PopulationArray) -> Tuple[List[float], List[float]]:
+        """Per-trait sums and sums of squares, for merging statistics"""
+        return self._moments_for(population).sums()
+    
+    def to_arrays(self, population: PopulationArray) -> PopulationArray:
+        """The population in array form, for checkpoints"""
+        return population
+    
+    def from_arrays(self, arrays: PopulationArray) -> PopulationArray:
+        """Restore an evaluated population from a checkpoint"""
+        if arrays.ids is None:
+            # Checkpoints from before ids were stored
+            arrays = replace(arrays, ids=new_ids(len(arrays)))
+        self._evaluated = (arrays, len(arrays))
+        return arrays
+    
+    def to_agents(self, population: PopulationArray) -> List[Agent]:
+        """Materialize the population as Agent entities"""
+        return [self._agent_at(population, i) for i in range(len(population))]
+    
+    def _agent_at(self, population: PopulationArray, index: int) -> Agent:
+        return Agent(
+            id=population.agent_id(index) if population.ids is not None else "",
+            genome=Genome(*population.genomes[index].tolist()),
+            fitness=float(population.fitness[index]),
+            generation=int(population.generation[index])
+        )
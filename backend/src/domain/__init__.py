@@ -3,25 +3,42 @@ Domain layer - Enterprise business rules
 """
 from .entities import (
     Agent,
+    CachedResult,
+    EvolutionAggregates,
+    EvolutionCheckpoint,
     EvolutionParameters,
     EvolutionResult,
     EvolutionStatus,
+    EvolutionSummary,
     GenerationStats,
-    Genome
+    Genome,
+    PopulationPage,
+    User
 )
-from .exceptions import DomainError, EvolutionError, NotFoundError, ValidationError
-from .repositories import EvolutionRepository
+from .exceptions import (
+    ConflictError, DomainError, EvolutionError, NotFoundError, ValidationError
+)
+from .repositories import EvolutionRepository, EvolutionResultCache, UserRepository
 
 __all__ = [
     "Agent",
+    "CachedResult",
+    "EvolutionAggregates",
+    "EvolutionCheckpoint",
     "EvolutionParameters",
     "EvolutionResult",
     "EvolutionStatus",
+    "EvolutionSummary",
     "GenerationStats",
     "Genome",
+    "PopulationPage",
+    "User",
+    "ConflictError",
     "DomainError",
     "EvolutionError",
     "NotFoundError",
     "ValidationError",
-    "EvolutionRepository"
+    "EvolutionRepository",
+    "EvolutionResultCache",
+    "UserRepository"
 ]
@@ -4,11 +4,21 @@ Clean Architecture - Enterprise business rules
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 import uuid
 
 
+# Order in which genome traits are laid out in array-backed populations
+TRAIT_NAMES = ("speed", "strength", "intelligence", "cooperation", "adaptability")
+
+# Available evolution engine implementations
+ENGINE_TYPES = ("standard", "vectorized")
+
+# Available parent selection schemes
+SELECTION_STRATEGIES = ("tournament", "rank", "sus", "truncation")
+
+
 class EvolutionStatus(str, Enum):
     """Status of an evolution run"""
     PENDING = "pending"
@@ -17,9 +27,12 @@ class EvolutionStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Genome:
-    """Genome entity representing agent traits"""
+    """Genome entity representing agent traits
+    
+    Slotted: no per-instance __dict__, since runs create one per offspring.
+    """
     speed: float
     strength: float
     intelligence: float
@@ -35,6 +48,16 @@ class Genome:
             "adaptability": self.adaptability
         }
     
+    def to_tuple(self) -> Tuple[float, ...]:
+        """Trait values in TRAIT_NAMES order"""
+        return (
+            self.speed,
+            self.strength,
+            self.intelligence,
+            self.cooperation,
+            self.adaptability
+        )
+    
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> "Genome":
         return cls(
@@ -48,10 +71,10 @@ class Genome:
     @property
     def fitness_score(self) -> float:
         """Calculate base fitness score"""
-        return sum(self.to_dict().values())
+        return sum(self.to_tuple())
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """Agent entity"""
     id: str
@@ -75,6 +98,8 @@ class GenerationStats:
     diversity_score: float
     population_size: int
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Mean squared genome distance between distinct pairs (None on older records)
+    pairwise_distance: Optional[float] = None
     
     def to_dict(self) -> Dict:
         return {
@@ -83,6 +108,9 @@ class GenerationStats:
             "max_fitness": round(self.max_fitness, 4),
             "min_fitness": round(self.min_fitness, 4),
             "diversity_score": round(self.diversity_score, 4),
+            "pairwise_distance": (
+                round(self.pairwise_distance, 4) if self.pairwise_distance is not None else None
+            ),
             "population_size": self.population_size,
             "timestamp": self.timestamp.isoformat()
         }
@@ -101,11 +129,22 @@ class EvolutionResult:
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     execution_time_ms: Optional[int] = None
+    # Set on summary views loaded without their generation history
+    generation_count: Optional[int] = None
+    # Per-phase timings, only when profiling was requested (not persisted)
+    profile: Optional[Dict] = None
     
     def __post_init__(self):
         if not self.id:
             self.id = str(uuid.uuid4())
     
+    @property
+    def total_generations(self) -> int:
+        """Number of generations, also available on summary views"""
+        if self.generations or self.generation_count is None:
+            return len(self.generations)
+        return self.generation_count
+    
     def to_dict(self) -> Dict:
         return {
             "id": self.id,
@@ -119,12 +158,72 @@ class EvolutionResult:
                 "generation": self.best_agent.generation if self.best_agent else None
             } if self.best_agent else None,
             "fitness_history": [g.to_dict() for g in self.generations],
+            "generation_count": self.total_generations,
             "created_at": self.created_at.isoformat(),
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "execution_time_ms": self.execution_time_ms
+            "execution_time_ms": self.execution_time_ms,
+            "error_message": self.error_message,
+            "profile": self.profile
         }
 
 
+@dataclass
+class PopulationPage:
+    """One page of a stored final population"""
+    total: int
+    agents: List[Agent] = field(default_factory=list)
+
+
+@dataclass
+class EvolutionCheckpoint:
+    """Resumable state of a run after `generation` completed generations
+    
+    `state` is an opaque binary snapshot of the evaluated population and the
+    run's RNG, packed and unpacked by the application layer.
+    """
+    result_id: str
+    generation: int
+    state: bytes
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@dataclass(frozen=True)
+class CachedResult:
+    """A cached result, pre-serialized once so hits are served as stored
+    
+    `payload` is the JSON-encoded `EvolutionResult.to_dict()` of the
+    persisted result `result_id`.
+    """
+    result_id: str
+    payload: bytes
+
+
+@dataclass
+class EvolutionSummary:
+    """Lightweight listing entry for an evolution result"""
+    id: str
+    generation_count: int
+    best_fitness: Optional[float]
+    created_at: datetime
+
+
+@dataclass
+class EvolutionAggregates:
+    """Running statistics over all stored evolution results"""
+    total_count: int = 0
+    fitness_sum: float = 0.0
+    fitness_count: int = 0
+    best_fitness: Optional[float] = None
+    recent: List[EvolutionSummary] = field(default_factory=list)
+    
+    @property
+    def avg_fitness(self) -> float:
+        """Mean best-agent fitness over results that have one"""
+        if self.fitness_count == 0:
+            return 0.0
+        return self.fitness_sum / self.fitness_count
+
+
 @dataclass
 class EvolutionParameters:
     """Parameters for evolution run"""
@@ -134,6 +233,12 @@ class EvolutionParameters:
     survival_rate: float = 0.4
     tournament_size: int = 3
     random_seed: Optional[int] = None
+    engine: str = "standard"
+    selection_strategy: str = "tournament"
+    fitness_function: str = "trait_sum"
+    islands: int = 1
+    migration_interval: int = 10
+    migration_size: int = 2
     
     def validate(self) -> List[str]:
         """Validate parameters and return list of errors"""
@@ -143,21 +248,60 @@ class EvolutionParameters:
             errors.append("population_size must be at least 2")
         if self.population_size > 1000:
             errors.append("population_size cannot exceed 1000")
-            
+        
         if self.generations < 1:
             errors.append("generations must be at least 1")
         if self.generations > 1000:
             errors.append("generations cannot exceed 1000")
-            
+        
         if not 0 <= self.mutation_rate <= 1:
             errors.append("mutation_rate must be between 0 and 1")
-            
+        
         if not 0 < self.survival_rate <= 1:
             errors.append("survival_rate must be between 0 and 1")
-            
+        
         if self.tournament_size < 2:
             errors.append("tournament_size must be at least 2")
         if self.tournament_size > self.population_size:
             errors.append("tournament_size cannot exceed population_size")
-            
+        
+        if self.engine not in ENGINE_TYPES:
+            errors.append(f"engine must be one of: {', '.join(ENGINE_TYPES)}")
+        
+        if self.selection_strategy not in SELECTION_STRATEGIES:
+            errors.append(
+                f"selection_strategy must be one of: {', '.join(SELECTION_STRATEGIES)}"
+            )
+        
+        if not 1 <= self.islands <= 64:
+            errors.append("islands must be between 1 and 64")
+        elif self.islands > 1:
+            island_size = self.population_size // self.islands
+            if island_size < max(2, self.tournament_size):
+                errors.append("population_size / islands must be at least 2 and at least tournament_size")
+            if not 1 <= self.migration_size < island_size:
+                errors.append("migration_size must be at least 1 and smaller than each island")
+            if self.migration_interval < 1:
+                errors.append("migration_interval must be at least 1")
+        
         return errors
+
+
+@dataclass
+class User:
+    """Registered API user; emails are unique
+    
+    Tokens carry the token_version they were issued under; bumping it
+    revokes every earlier token (logout, refresh).
+    """
+    id: str
+    email: str
+    name: str
+    hashed_password: str
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    is_active: bool = True
+    token_version: int = 0
+    
+    def __post_init__(self):
+        if not self.id:
+            self.id = str(uuid.uuid4())
@@ -24,3 +24,8 @@ class EvolutionError(DomainError):
 class NotFoundError(DomainError):
     """Resource not found"""
     pass
+
+
+class ConflictError(DomainError):
+    """Resource already exists"""
+    pass
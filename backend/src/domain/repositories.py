@@ -4,7 +4,9 @@ Clean Architecture - Define contracts for data access
 """
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from .entities import EvolutionResult
+from .entities import (
+    CachedResult, EvolutionAggregates, EvolutionCheckpoint, EvolutionResult, PopulationPage, User
+)
 
 
 class EvolutionRepository(ABC):
@@ -16,12 +18,21 @@ class EvolutionRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_id(self, result_id: str) -> Optional[EvolutionResult]:
-        """Get evolution result by ID"""
+    async def get_by_id(
+        self, result_id: str, include_generations: bool = True
+    ) -> Optional[EvolutionResult]:
+        """Get evolution result by ID
+        
+        With include_generations=False only the summary is loaded
+        (generations empty, generation_count set). final_population is
+        never loaded; page it with get_population().
+        """
         pass
     
     @abstractmethod
-    async def list_all(self, limit: int = 100, offset: int = 0) -> List[EvolutionResult]:
+    async def list_all(
+        self, limit: int = 100, offset: int = 0, include_generations: bool = True
+    ) -> List[EvolutionResult]:
         """List all evolution results with pagination"""
         pass
     
@@ -29,3 +40,72 @@ class EvolutionRepository(ABC):
     async def delete(self, result_id: str) -> bool:
         """Delete an evolution result"""
         pass
+    
+    @abstractmethod
+    async def get_aggregates(self, recent: int = 10) -> EvolutionAggregates:
+        """Running totals maintained by save/delete, plus the newest results"""
+        pass
+    
+    @abstractmethod
+    async def get_population(
+        self, result_id: str, limit: int = 100, offset: int = 0, by_fitness: bool = False
+    ) -> Optional[PopulationPage]:
+        """A page of the result's final population, in stored order or fittest first
+        
+        None if the result does not exist; an empty page if it has no stored
+        population (still running, or saved before populations were kept).
+        """
+        pass
+    
+    @abstractmethod
+    async def save_checkpoint(self, checkpoint: EvolutionCheckpoint) -> None:
+        """Store a checkpoint of a saved result, replacing any earlier one"""
+        pass
+    
+    @abstractmethod
+    async def get_checkpoint(self, result_id: str) -> Optional[EvolutionCheckpoint]:
+        """Latest checkpoint of a result, if any (deleted along with the result)"""
+        pass
+
+
+class EvolutionResultCache(ABC):
+    """Abstract cache of completed results keyed by a parameter fingerprint"""
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedResult]:
+        """Cached result for the key, if any"""
+        pass
+    
+    @abstractmethod
+    async def put(self, key: str, entry: CachedResult) -> None:
+        """Store a completed result under the key"""
+        pass
+    
+    @abstractmethod
+    async def discard(self, key: str) -> None:
+        """Forget the key, e.g. once its result is no longer stored"""
+        pass
+
+
+class UserRepository(ABC):
+    """Abstract repository for API users, looked up by id or email"""
+    
+    @abstractmethod
+    async def add(self, user: User) -> None:
+        """Store a new user; raises ConflictError if the email is taken"""
+        pass
+    
+    @abstractmethod
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID"""
+        pass
+    
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email (exact match)"""
+        pass
+    
+    @abstractmethod
+    async def increment_token_version(self, user_id: str) -> Optional[int]:
+        """Revoke the user's tokens; the new token_version, or None if no such user"""
+        pass
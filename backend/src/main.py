@@ -2,30 +2,60 @@
 ClawDNA Backend API
 Production-grade FastAPI application with Clean Architecture
 """
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 import structlog
 
 from src.adapters.api import router, limiter, auth_router
+from src.adapters.api.auth import close_user_repository, shutdown_password_hasher
+from src.adapters.api.routes import (
+    close_repository, shutdown_fitness_executor, shutdown_island_executor, shutdown_job_runner
+)
+from src.adapters.metrics import (
+    CONTENT_TYPE, MetricsMiddleware, monitor_event_loop_lag, render_metrics
+)
+from src.adapters.solana_adapter import close_solana_adapter
 
 # Setup structured logging
 logger = structlog.get_logger()
 
 
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip that leaves event streams alone so each event is flushed immediately"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     # Startup
     print("🧬 ClawDNA Backend API starting...")
+    lag_monitor = asyncio.create_task(monitor_event_loop_lag())
     yield
     # Shutdown
+    lag_monitor.cancel()
+    with suppress(asyncio.CancelledError):
+        await lag_monitor
+    shutdown_job_runner()
+    shutdown_fitness_executor()
+    shutdown_island_executor()
+    shutdown_password_hasher()
+    close_repository()
+    close_user_repository()
+    await close_solana_adapter()
     print("👋 ClawDNA Backend API shutting down...")
 
 
@@ -51,9 +81,13 @@ def create_application() -> FastAPI:
         ## Endpoints
         
         * `POST /api/v1/evolution/run` - Run evolution simulation
+        * `POST /api/v1/evolution/run/stream` - Run evolution, streaming progress (SSE)
         * `GET /api/v1/evolution/results/{id}` - Get specific result
+        * `GET /api/v1/evolution/results/{id}/population` - Page a result's final population
+        * `POST /api/v1/evolution/results/{id}/continue` - Continue a run from its latest checkpoint
         * `GET /api/v1/evolution/results` - List all results
         * `GET /api/v1/evolution/health` - Health check
+        * `GET /metrics` - Prometheus metrics
         """,
         version="1.0.0",
         docs_url="/docs",
@@ -76,7 +110,10 @@ def create_application() -> FastAPI:
     )
     
     # Gzip compression
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1000)
+    
+    # Request metrics (outermost, so timings include the other middleware)
+    app.add_middleware(MetricsMiddleware)
     
     # Include routers
     app.include_router(router)
@@ -91,12 +128,21 @@ def create_application() -> FastAPI:
             "docs": "/docs",
             "endpoints": {
                 "run_evolution": "POST /api/v1/evolution/run",
+                "run_evolution_stream": "POST /api/v1/evolution/run/stream",
                 "get_result": "GET /api/v1/evolution/results/{id}",
+                "get_population": "GET /api/v1/evolution/results/{id}/population",
+                "continue_evolution": "POST /api/v1/evolution/results/{id}/continue",
                 "list_results": "GET /api/v1/evolution/results",
-                "health": "GET /api/v1/evolution/health"
+                "health": "GET /api/v1/evolution/health",
+                "metrics": "GET /metrics"
             }
         }
     
+    # Prometheus scrape endpoint (not rate limited)
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(render_metrics(), media_type=CONTENT_TYPE)
+    
     # Global exception handler - secure: don't expose internal error details
     @app.exception_handler(Exception)
     async def global_exception_handler(request, exc):
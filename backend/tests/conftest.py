@@ -0,0 +1,63 @@
+"""
+Shared test fixtures
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+
+from src.domain.entities import Agent, EvolutionResult, EvolutionStatus, GenerationStats, Genome
+
+
+class FakeClock:
+    """Monotonic-style clock that only moves when a test sets `now`"""
+    
+    def __init__(self, now: float = 0.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def make_result():
+    """Factory for completed results
+    
+    `fitness` adds a best agent (and is every generation's fitness),
+    `generations` adds that many generation stats and `minutes` shifts
+    created_at, for ordering.
+    """
+    def factory(
+        result_id: str = "",
+        fitness: Optional[float] = None,
+        minutes: int = 0,
+        generations: int = 0
+    ) -> EvolutionResult:
+        value = fitness if fitness is not None else 1.0
+        best = None
+        if fitness is not None:
+            best = Agent(id="", genome=Genome(0.5, 0.5, 0.5, 0.5, 0.5), fitness=fitness)
+        return EvolutionResult(
+            id=result_id,
+            status=EvolutionStatus.COMPLETED,
+            parameters={},
+            generations=[
+                GenerationStats(
+                    generation_number=i + 1,
+                    avg_fitness=value,
+                    max_fitness=value,
+                    min_fitness=value,
+                    diversity_score=0.0,
+                    population_size=1
+                )
+                for i in range(generations)
+            ],
+            best_agent=best,
+            created_at=datetime.utcnow() + timedelta(minutes=minutes)
+        )
+    return factory
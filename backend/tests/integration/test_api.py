@@ -2,10 +2,18 @@
 Integration tests for API endpoints
 Tests the full request/response cycle with FastAPI TestClient
 """
+import asyncio
+import uuid
+
 import pytest
 from fastapi.testclient import TestClient
 
 from src.main import app
+from src.adapters.api import limiter
+from src.adapters.api.auth import get_password_hasher, get_token_cache, pwd_context
+from src.adapters.api.password_hasher import PasswordHasher
+from src.adapters.api.routes import get_repository
+from src.domain.entities import EvolutionCheckpoint
 
 
 @pytest.fixture
@@ -14,6 +22,13 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """Start every test with fresh rate-limit windows"""
+    limiter.reset()
+    yield
+
+
 class TestRootEndpoint:
     """Test root endpoint"""
     
@@ -142,6 +157,125 @@ class TestRunEvolution:
         data = response.json()
         assert data["status"] == "completed"
         assert data["generations"][0]["population_size"] == 100
+        assert data["generations"][0]["pairwise_distance"] > 0
+    
+    def test_run_evolution_vectorized_engine(self, client):
+        payload = {
+            "population_size": 100,
+            "generations": 5,
+            "engine": "vectorized"
+        }
+        response = client.post("/api/v1/evolution/run", json=payload)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["parameters"]["engine"] == "vectorized"
+        assert len(data["generations"]) == 5
+    
+    def test_run_evolution_fitness_function(self, client):
+        payload = {"population_size": 20, "generations": 3, "fitness_function": "weighted_traits"}
+        response = client.post("/api/v1/evolution/run", json=payload)
+        assert response.status_code == 200
+        assert response.json()["parameters"]["fitness_function"] == "weighted_traits"
+        
+        response = client.post("/api/v1/evolution/run", json={"fitness_function": "nope"})
+        assert response.status_code == 422
+
+
+class TestResultCache:
+    """Test seeded runs served from the result cache"""
+    
+    def test_repeated_seeded_run_is_cached(self, client):
+        payload = {"population_size": 10, "generations": 3, "random_seed": 424242}
+        
+        first = client.post("/api/v1/evolution/run", json=payload)
+        assert first.status_code == 200
+        
+        # More repeats than the 10/minute limit allows for computed runs
+        for _ in range(12):
+            response = client.post("/api/v1/evolution/run", json=payload)
+            assert response.status_code == 200
+            assert response.json() == first.json()
+        
+        fetched = client.get(f"/api/v1/evolution/results/{first.json()['id']}")
+        assert fetched.status_code == 200
+    
+    def test_unseeded_runs_are_not_cached(self, client):
+        payload = {"population_size": 10, "generations": 3}
+        first = client.post("/api/v1/evolution/run", json=payload)
+        second = client.post("/api/v1/evolution/run", json=payload)
+        assert first.json()["id"] != second.json()["id"]
+
+
+class TestProfiledRun:
+    """Test POST /api/v1/evolution/run?profile=true"""
+    
+    def test_profile_reported(self, client):
+        payload = {"population_size": 10, "generations": 3}
+        response = client.post("/api/v1/evolution/run?profile=true", json=payload)
+        assert response.status_code == 200
+        
+        profile = response.json()["profile"]
+        assert len(profile["generations"]) == 3
+        assert "fitness" in profile["totals"]
+        assert "persistence" in profile["totals"]
+    
+    def test_profile_absent_by_default(self, client):
+        response = client.post("/api/v1/evolution/run", json={"population_size": 10, "generations": 3})
+        assert response.json()["profile"] is None
+
+
+class TestBackgroundRun:
+    """Test POST /api/v1/evolution/run?background=true"""
+    
+    def test_background_run_completes(self):
+        import time
+        
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/v1/evolution/run?background=true",
+                json={"population_size": 10, "generations": 3}
+            )
+            assert response.status_code == 202
+            
+            data = response.json()
+            assert data["status"] in ("pending", "running")
+            
+            deadline = time.time() + 30
+            status_value = data["status"]
+            while status_value in ("pending", "running") and time.time() < deadline:
+                time.sleep(0.05)
+                status_value = client.get(f"/api/v1/evolution/results/{data['id']}").json()["status"]
+            
+            assert status_value == "completed"
+            assert client.get("/api/v1/evolution/health").status_code == 200
+
+
+class TestRunEvolutionStream:
+    """Test POST /api/v1/evolution/run/stream"""
+    
+    def test_stream_events(self, client):
+        import json
+        
+        payload = {"population_size": 10, "generations": 3}
+        with client.stream("POST", "/api/v1/evolution/run/stream", json=payload) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = "".join(response.iter_text())
+        
+        events = [
+            (block.split("\n")[0][len("event: "):], json.loads(block.split("\n")[1][len("data: "):]))
+            for block in body.strip().split("\n\n")
+        ]
+        assert [name for name, _ in events] == ["generation"] * 3 + ["result"]
+        assert events[0][1]["generation_number"] == 1
+        assert events[-1][1]["status"] == "completed"
+        assert events[-1][1]["generation_count"] == 3
+    
+    def test_stream_invalid_params(self, client):
+        response = client.post("/api/v1/evolution/run/stream", json={"generations": 0})
+        assert response.status_code == 422
 
 
 class TestGetResult:
@@ -174,6 +308,66 @@ class TestGetResult:
         assert "detail" in data
 
 
+class TestPopulation:
+    """Test GET /api/v1/evolution/results/{id}/population"""
+    
+    def test_population_pages_and_top_k(self, client):
+        payload = {"population_size": 30, "generations": 2, "engine": "vectorized"}
+        result = client.post("/api/v1/evolution/run", json=payload).json()
+        url = f"/api/v1/evolution/results/{result['id']}/population"
+        
+        page = client.get(url, params={"limit": 10, "offset": 25}).json()
+        assert page["total"] == 30
+        assert len(page["agents"]) == 5
+        
+        top = client.get(url, params={"limit": 5, "order": "fitness"}).json()
+        fitness = [a["fitness"] for a in top["agents"]]
+        assert fitness == sorted(fitness, reverse=True)
+        assert fitness[0] == result["best_agent"]["fitness"]
+    
+    def test_population_not_found(self, client):
+        response = client.get("/api/v1/evolution/results/non-existent-id/population")
+        assert response.status_code == 404
+
+
+class TestContinueRun:
+    """Test POST /api/v1/evolution/results/{id}/continue"""
+    
+    def test_continue_from_checkpoint(self, client):
+        payload = {"population_size": 10, "generations": 3, "random_seed": 11}
+        first = client.post("/api/v1/evolution/run", json=payload).json()
+        
+        response = client.post(
+            f"/api/v1/evolution/results/{first['id']}/continue", json={"generations": 2}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] != first["id"]
+        assert data["parameters"]["generations"] == 5
+        assert [g["generation_number"] for g in data["generations"]] == [1, 2, 3, 4, 5]
+        assert data["generations"][:3] == first["generations"]
+    
+    def test_continue_not_found(self, client):
+        response = client.post("/api/v1/evolution/results/non-existent-id/continue", json={})
+        assert response.status_code == 404
+    
+    def test_continue_unreadable_checkpoint(self, client):
+        payload = {"population_size": 10, "generations": 3, "random_seed": 12}
+        first = client.post("/api/v1/evolution/run", json=payload).json()
+        checkpoint = EvolutionCheckpoint(first["id"], 3, b"XXXX" + bytes(64))
+        asyncio.run(get_repository().save_checkpoint(checkpoint))
+        
+        response = client.post(
+            f"/api/v1/evolution/results/{first['id']}/continue", json={"generations": 2}
+        )
+        assert response.status_code == 500
+        assert "Unsupported checkpoint format" in response.json()["detail"]["error"]
+    
+    def test_continue_invalid_generations(self, client):
+        response = client.post("/api/v1/evolution/results/any/continue", json={"generations": 0})
+        assert response.status_code == 422
+
+
 class TestListResults:
     """Test GET /api/v1/evolution/results"""
     
@@ -196,11 +390,56 @@ class TestListResults:
         data = response.json()
         assert len(data) <= 2
     
+    def test_list_results_summaries(self, client):
+        client.post("/api/v1/evolution/run?persist=true", json={"generations": 4})
+        
+        response = client.get("/api/v1/evolution/results?limit=1&include_generations=false")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data[0]["generations"] == []
+        assert data[0]["generation_count"] == 4
+    
     def test_list_results_invalid_limit(self, client):
         response = client.get("/api/v1/evolution/results?limit=1001")
         assert response.status_code == 422
 
 
+class TestStats:
+    """Test GET /api/v1/evolution/stats"""
+    
+    def test_stats(self, client):
+        client.post("/api/v1/evolution/run?persist=true", json={"generations": 3})
+        
+        response = client.get("/api/v1/evolution/stats")
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["totalEvolutions"] >= 1
+        assert data["bestFitness"] >= data["avgFitness"] > 0
+        assert len(data["recentEvolutions"]) >= 1
+        assert "generation" in data["recentEvolutions"][0]
+
+
+class TestMetrics:
+    """Test GET /metrics"""
+    
+    def test_metrics_after_run(self, client):
+        client.post("/api/v1/evolution/run", json={"population_size": 10, "generations": 5})
+        client.get("/api/v1/evolution/results/does-not-exist")
+        
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert 'route="/api/v1/evolution/run",status="200"' in text
+        # Labelled by route template, not the raw path
+        assert 'route="/api/v1/evolution/results/{result_id}",status="404"' in text
+        assert 'clawdna_evolution_runs_total{engine="standard",generations="le_10",population_size="le_20",status="completed"}' in text
+        assert 'clawdna_repository_call_duration_seconds_count{operation=' in text
+        assert "/metrics" not in text
+
+
 class TestCORS:
     """Test CORS headers"""
     
@@ -232,3 +471,72 @@ class TestOpenAPIDocs:
     def test_redoc_endpoint(self, client):
         response = client.get("/redoc")
         assert response.status_code == 200
+
+
+class TestAuth:
+    """Test /api/v1/auth against the configured user store"""
+    
+    def test_register_login_me(self, client):
+        email = f"user-{uuid.uuid4().hex[:8]}@example.com"
+        payload = {"email": email, "password": "correct-horse", "name": "Tester"}
+        registered = client.post("/api/v1/auth/register", json=payload)
+        assert registered.status_code == 201
+        
+        duplicate = client.post("/api/v1/auth/register", json=payload)
+        assert duplicate.status_code == 400
+        
+        login = client.post("/api/v1/auth/login", data={"username": email, "password": "correct-horse"})
+        assert login.status_code == 200
+        token = login.json()["token"]["access_token"]
+        
+        me = client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert me.status_code == 200
+        assert me.json()["id"] == registered.json()["user"]["id"]
+        
+        wrong = client.post("/api/v1/auth/login", data={"username": email, "password": "wrong-password"})
+        assert wrong.status_code == 401
+    
+    def register(self, client) -> str:
+        email = f"user-{uuid.uuid4().hex[:8]}@example.com"
+        payload = {"email": email, "password": "correct-horse", "name": "Tester"}
+        return client.post("/api/v1/auth/register", json=payload).json()["token"]["access_token"]
+    
+    def test_repeat_requests_use_token_cache(self, client):
+        token = self.register(client)
+        headers = {"Authorization": f"Bearer {token}"}
+        cache = get_token_cache()
+        client.get("/api/v1/auth/me", headers=headers)
+        hits = cache.hits
+        for _ in range(3):
+            assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+        assert cache.hits == hits + 3
+    
+    def test_refresh_revokes_old_token(self, client):
+        old = {"Authorization": f"Bearer {self.register(client)}"}
+        assert client.get("/api/v1/auth/me", headers=old).status_code == 200
+        
+        refreshed = client.post("/api/v1/auth/refresh", headers=old)
+        assert refreshed.status_code == 200
+        new = {"Authorization": f"Bearer {refreshed.json()['access_token']}"}
+        assert client.get("/api/v1/auth/me", headers=old).status_code == 401
+        assert client.get("/api/v1/auth/me", headers=new).status_code == 200
+    
+    def test_logout_revokes_token(self, client):
+        headers = {"Authorization": f"Bearer {self.register(client)}"}
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+        assert client.post("/api/v1/auth/logout", headers=headers).status_code == 204
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+        assert client.post("/api/v1/auth/logout", headers=headers).status_code == 401
+    
+    def test_saturated_hasher_returns_503(self, client):
+        hasher = PasswordHasher(pwd_context, max_workers=1, max_queue=0)
+        hasher.in_flight = 1  # as if a hash were already running
+        app.dependency_overrides[get_password_hasher] = lambda: hasher
+        try:
+            payload = {"email": "busy@example.com", "password": "correct-horse", "name": "Busy"}
+            response = client.post("/api/v1/auth/register", json=payload)
+            assert response.status_code == 503
+            assert response.headers["retry-after"] == "1"
+        finally:
+            app.dependency_overrides.clear()
+            hasher.shutdown()
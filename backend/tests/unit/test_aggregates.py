@@ -0,0 +1,79 @@
+"""
+Unit tests for repository running aggregates
+"""
+import pytest
+
+from src.domain.entities import Agent, Genome
+from src.adapters.persistence import InMemoryEvolutionRepository, SQLiteEvolutionRepository
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repo(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryEvolutionRepository()
+    else:
+        repository = SQLiteEvolutionRepository(str(tmp_path / "agg.db"))
+        yield repository
+        repository.close()
+
+
+class TestAggregates:
+    """Test get_aggregates on every repository implementation"""
+    
+    @pytest.mark.asyncio
+    async def test_empty(self, repo):
+        stats = await repo.get_aggregates()
+        assert stats.total_count == 0
+        assert stats.avg_fitness == 0.0
+        assert stats.best_fitness is None
+        assert stats.recent == []
+    
+    @pytest.mark.asyncio
+    async def test_save_updates_totals(self, repo, make_result):
+        for fitness in (1.0, 3.0, None):
+            await repo.save(make_result(fitness=fitness))
+        
+        stats = await repo.get_aggregates()
+        assert stats.total_count == 3
+        assert stats.fitness_count == 2
+        assert stats.avg_fitness == pytest.approx(2.0)
+        assert stats.best_fitness == 3.0
+    
+    @pytest.mark.asyncio
+    async def test_resave_replaces_contribution(self, repo, make_result):
+        result = make_result()
+        await repo.save(result)
+        result.best_agent = Agent(id="", genome=Genome(1, 1, 1, 1, 1), fitness=5.0)
+        await repo.save(result)
+        
+        stats = await repo.get_aggregates()
+        assert stats.total_count == 1
+        assert stats.fitness_count == 1
+        assert stats.best_fitness == 5.0
+    
+    @pytest.mark.asyncio
+    async def test_delete_best_recomputes(self, repo, make_result):
+        low = make_result(fitness=1.0)
+        high = make_result(fitness=4.0)
+        await repo.save(low)
+        await repo.save(high)
+        
+        assert await repo.delete(high.id) is True
+        stats = await repo.get_aggregates()
+        assert stats.total_count == 1
+        assert stats.best_fitness == 1.0
+        assert stats.avg_fitness == pytest.approx(1.0)
+        
+        assert await repo.delete(high.id) is False
+        assert (await repo.get_aggregates()).total_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_recent_newest_first(self, repo, make_result):
+        results = [make_result(fitness=float(i)) for i in range(5)]
+        for r in results:
+            await repo.save(r)
+        await repo.delete(results[4].id)
+        
+        stats = await repo.get_aggregates(recent=3)
+        assert [r.id for r in stats.recent] == [results[3].id, results[2].id, results[1].id]
+        assert stats.recent[0].best_fitness == 3.0
@@ -0,0 +1,169 @@
+"""
+Unit tests for run checkpoints and resuming
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.domain.entities import EvolutionParameters, EvolutionStatus
+from src.domain.exceptions import ConflictError, NotFoundError, ValidationError
+from src.application.checkpoint import decode_checkpoint, encode_checkpoint
+from src.application.evolution_jobs import EvolutionJobRunner
+from src.application.evolution_use_cases import RunEvolutionUseCase, create_engine
+from src.adapters.persistence import InMemoryEvolutionRepository, SQLiteEvolutionRepository
+
+
+def fitness_history(result):
+    return [(g.generation_number, g.avg_fitness, g.max_fitness) for g in result.generations]
+
+
+class TestCheckpointCodec:
+    """Test the binary checkpoint format"""
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_round_trip(self, engine):
+        evolution = create_engine(EvolutionParameters(population_size=30, random_seed=1, engine=engine))
+        population = evolution.initial_population()
+        evolution.evaluate(population)
+        evolution.rng.random()  # leave buffered draws behind
+        
+        checkpoint = encode_checkpoint("run-1", 1, evolution.to_arrays(population), evolution.rng)
+        arrays, rng = decode_checkpoint(checkpoint)
+        original = evolution.to_arrays(population)
+        
+        np.testing.assert_array_equal(arrays.genomes, original.genomes)
+        np.testing.assert_array_equal(arrays.fitness, original.fitness)
+        np.testing.assert_array_equal(arrays.generation, original.generation)
+        np.testing.assert_array_equal(arrays.ids, original.ids)
+        restored = evolution.to_agents(evolution.from_arrays(arrays))
+        assert [a.id for a in restored] == [a.id for a in evolution.to_agents(population)]
+        assert [rng.random() for _ in range(5)] == [evolution.rng.random() for _ in range(5)]
+        assert rng.generator.random() == evolution.rng.generator.random()
+    
+    def test_compact(self):
+        evolution = create_engine(EvolutionParameters(population_size=1000, engine="vectorized"))
+        population = evolution.initial_population()
+        checkpoint = encode_checkpoint("run-1", 1, population, evolution.rng)
+        # 5 float64 traits + float64 fitness + int32 generation + 16-byte id per agent
+        assert len(checkpoint.state) < 1000 * 68 + 1024
+    
+    def test_rejects_unknown_format(self):
+        evolution = create_engine(EvolutionParameters(population_size=4, engine="vectorized"))
+        checkpoint = encode_checkpoint("run-1", 1, evolution.initial_population(), evolution.rng)
+        checkpoint.state = b"XXXX" + checkpoint.state[4:]
+        with pytest.raises(ValueError):
+            decode_checkpoint(checkpoint)
+
+
+class TestCheckpointedRuns:
+    """Segmented and resumed runs match uninterrupted ones"""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    async def test_segments_match_single_run(self, engine):
+        params = EvolutionParameters(population_size=30, generations=10, random_seed=3, engine=engine)
+        single = RunEvolutionUseCase().run(params)
+        
+        repo = InMemoryEvolutionRepository()
+        segmented = await RunEvolutionUseCase(repository=repo, checkpoint_interval=3).execute(params)
+        
+        assert segmented.status == EvolutionStatus.COMPLETED
+        assert fitness_history(segmented) == pytest.approx(fitness_history(single))
+        checkpoint = await repo.get_checkpoint(segmented.id)
+        assert checkpoint.generation == 10
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    async def test_segments_keep_agent_ids(self, engine):
+        params = EvolutionParameters(population_size=30, generations=10, random_seed=0, engine=engine)
+        repo = InMemoryEvolutionRepository()
+        segmented = await RunEvolutionUseCase(repository=repo, checkpoint_interval=3).execute(params)
+        
+        assert segmented.best_agent.id in {agent.id for agent in segmented.final_population}
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    async def test_resume_matches_longer_run(self, engine):
+        repo = InMemoryEvolutionRepository()
+        use_case = RunEvolutionUseCase(repository=repo)
+        short = await use_case.execute(
+            EvolutionParameters(population_size=30, generations=6, random_seed=4, engine=engine)
+        )
+        
+        continued = await use_case.resume(short.id, 4)
+        full = RunEvolutionUseCase().run(
+            EvolutionParameters(population_size=30, generations=10, random_seed=4, engine=engine)
+        )
+        
+        assert continued.id != short.id
+        assert continued.parameters["generations"] == 10
+        assert fitness_history(continued) == pytest.approx(fitness_history(full))
+        assert continued.best_agent.fitness == pytest.approx(full.best_agent.fitness)
+        assert len((await repo.get_by_id(short.id)).generations) == 6
+        assert (await repo.get_checkpoint(continued.id)).generation == 10
+    
+    @pytest.mark.asyncio
+    async def test_resume_errors(self):
+        repo = InMemoryEvolutionRepository()
+        use_case = RunEvolutionUseCase(repository=repo)
+        with pytest.raises(NotFoundError):
+            await use_case.resume("missing", 5)
+        
+        result = await use_case.execute(
+            EvolutionParameters(population_size=10, generations=998, engine="vectorized")
+        )
+        with pytest.raises(ValidationError):
+            await use_case.resume(result.id, 5)
+        
+        islands = await use_case.execute(
+            EvolutionParameters(population_size=20, generations=2, islands=2, random_seed=1)
+        )
+        with pytest.raises(ValidationError):
+            await use_case.resume(islands.id, 5)
+        
+        running = await use_case.execute(EvolutionParameters(population_size=10, generations=2))
+        running.status = EvolutionStatus.RUNNING
+        await repo.save(running)
+        with pytest.raises(ConflictError):
+            await use_case.resume(running.id, 5)
+    
+    @pytest.mark.asyncio
+    async def test_job_runner_persists_progress(self):
+        repo = InMemoryEvolutionRepository()
+        runner = EvolutionJobRunner(
+            repo, executor=ThreadPoolExecutor(max_workers=1), checkpoint_interval=2
+        )
+        params = EvolutionParameters(population_size=20, generations=5, random_seed=5)
+        result = await runner.submit(params)
+        await runner.wait()
+        runner.shutdown()
+        
+        saved = await repo.get_by_id(result.id)
+        assert saved.status == EvolutionStatus.COMPLETED
+        assert fitness_history(saved) == pytest.approx(fitness_history(RunEvolutionUseCase().run(params)))
+        assert (await repo.get_checkpoint(result.id)).generation == 5
+
+
+class TestSQLiteCheckpoints:
+    """Checkpoints stored as blobs next to their result"""
+    
+    @pytest.mark.asyncio
+    async def test_save_replace_and_delete(self, tmp_path):
+        repo = SQLiteEvolutionRepository(str(tmp_path / "checkpoints.db"))
+        try:
+            result = await RunEvolutionUseCase(repository=repo, checkpoint_interval=2).execute(
+                EvolutionParameters(population_size=10, generations=3, random_seed=6)
+            )
+            checkpoint = await repo.get_checkpoint(result.id)
+            assert checkpoint.generation == 3
+            arrays, _ = decode_checkpoint(checkpoint)
+            assert arrays.genomes.shape == (10, 5)
+            
+            continued = await RunEvolutionUseCase(repository=repo).resume(result.id, 2)
+            assert len((await repo.get_by_id(continued.id)).generations) == 5
+            
+            assert await repo.delete(result.id)
+            assert await repo.get_checkpoint(result.id) is None
+        finally:
+            repo.close()
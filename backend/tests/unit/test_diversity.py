@@ -0,0 +1,84 @@
+"""
+Unit tests for incremental diversity tracking
+"""
+import numpy as np
+import pytest
+
+from src.domain.entities import EvolutionParameters
+from src.application.diversity import TraitMoments
+from src.application.evolution_use_cases import create_engine
+
+
+class TestTraitMoments:
+    """Test running moments against direct computation"""
+    
+    def test_add_and_remove_match_direct(self):
+        genomes = np.random.default_rng(0).random((200, 5))
+        moments = TraitMoments.of(genomes[:120])
+        moments.add(genomes[120:])
+        moments.remove(genomes[:50])
+        
+        kept = genomes[50:]
+        assert moments.count == 150
+        assert moments.variance() == pytest.approx(kept.var(axis=0))
+        assert moments.diversity() == pytest.approx(kept.var(axis=0).mean())
+    
+    def test_pairwise_distance_matches_brute_force(self):
+        genomes = np.random.default_rng(1).random((40, 5))
+        differences = genomes[:, None, :] - genomes[None, :, :]
+        squared = np.square(differences).sum(axis=2)
+        expected = squared[np.triu_indices(40, k=1)].mean()
+        assert TraitMoments.of(genomes).pairwise_distance() == pytest.approx(expected)
+    
+    def test_sums(self):
+        genomes = np.random.default_rng(2).random((10, 5))
+        sums, squares = TraitMoments.of(genomes).sums()
+        assert sums == pytest.approx(genomes.sum(axis=0).tolist())
+        assert squares == pytest.approx(np.square(genomes).sum(axis=0).tolist())
+    
+    def test_small_populations(self):
+        moments = TraitMoments.of(np.ones((1, 5)))
+        assert moments.diversity() == 0.0
+        assert moments.pairwise_distance() == 0.0
+        moments.remove(np.ones((1, 5)))
+        assert moments.count == 0
+
+
+class TestEngineTracking:
+    """Engines keep diversity in step with the population across generations"""
+    
+    @pytest.mark.parametrize("survival_rate", [0.4, 0.8])
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_incremental_matches_recomputed(self, engine, survival_rate):
+        # 0.4 rebuilds every generation, 0.8 carries the delta
+        params = EvolutionParameters(
+            population_size=50, survival_rate=survival_rate, random_seed=3, engine=engine
+        )
+        evolution = create_engine(params)
+        population = evolution.initial_population()
+        
+        for generation in range(1, 30):
+            if generation > 1:
+                population = evolution.next_generation(population)
+            evolution.evaluate(population)
+            stats = evolution.generation_stats(population, generation)
+            
+            genomes = np.array([a.genome.to_tuple() for a in evolution.to_agents(population)])
+            assert stats.diversity_score == pytest.approx(genomes.var(axis=0).mean(), abs=1e-12)
+            assert stats.pairwise_distance == pytest.approx(
+                TraitMoments.of(genomes).pairwise_distance(), abs=1e-12
+            )
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_delta_only_when_cheaper(self, engine):
+        for survival_rate, carried in ((0.4, False), (0.8, True)):
+            params = EvolutionParameters(
+                population_size=50, survival_rate=survival_rate, random_seed=3, engine=engine
+            )
+            evolution = create_engine(params)
+            population = evolution.initial_population()
+            evolution.evaluate(population)
+            evolution.generation_stats(population, 1)
+            
+            population = evolution.next_generation(population)
+            assert (evolution._tracked is population) == carried
@@ -1,6 +1,8 @@
 """
 Unit tests for domain entities
 """
+import pickle
+
 import pytest
 from src.domain.entities import (
     Agent, EvolutionParameters, EvolutionResult, 
@@ -39,6 +41,12 @@ class TestGenome:
         genome = Genome.from_dict(data)
         assert genome.speed == 0.5
         assert genome.fitness_score == 3.5
+    
+    def test_genome_is_slotted(self):
+        genome = Genome(0.1, 0.2, 0.3, 0.4, 0.5)
+        assert not hasattr(genome, "__dict__")
+        with pytest.raises(AttributeError):
+            genome.charisma = 1.0
 
 
 class TestAgent:
@@ -56,6 +64,11 @@ class TestAgent:
         agent = Agent(id="", genome=genome)
         assert agent.id != ""
         assert len(agent.id) == 36  # UUID length
+    
+    def test_agent_is_slotted(self):
+        agent = Agent(id="", genome=Genome(0.1, 0.2, 0.3, 0.4, 0.5))
+        assert not hasattr(agent, "__dict__")
+        assert pickle.loads(pickle.dumps(agent)) == agent
 
 
 class TestGenerationStats:
@@ -0,0 +1,66 @@
+"""
+Unit tests for background evolution jobs
+"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.domain.entities import EvolutionParameters, EvolutionStatus
+from src.domain.exceptions import ValidationError
+from src.application.evolution_jobs import EvolutionJobRunner
+from src.adapters.persistence import InMemoryEvolutionRepository
+
+
+class TestEvolutionJobRunner:
+    """Test EvolutionJobRunner"""
+    
+    @pytest.mark.asyncio
+    async def test_submit_returns_pending(self):
+        repo = InMemoryEvolutionRepository()
+        runner = EvolutionJobRunner(repo, executor=ThreadPoolExecutor(max_workers=1))
+        
+        result = await runner.submit(EvolutionParameters(population_size=10, generations=3))
+        
+        assert result.status == EvolutionStatus.PENDING
+        saved = await repo.get_by_id(result.id)
+        assert saved is not None
+        
+        await runner.wait()
+        runner.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_job_completes_in_process_pool(self):
+        repo = InMemoryEvolutionRepository()
+        runner = EvolutionJobRunner(repo, max_workers=1)
+        
+        result = await runner.submit(EvolutionParameters(population_size=10, generations=5, random_seed=1))
+        await runner.wait()
+        runner.shutdown()
+        
+        saved = await repo.get_by_id(result.id)
+        assert saved.status == EvolutionStatus.COMPLETED
+        assert len(saved.generations) == 5
+        assert saved.best_agent is not None
+        assert runner.active_jobs == 0
+    
+    @pytest.mark.asyncio
+    async def test_job_failure_is_recorded(self):
+        class BrokenExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                raise RuntimeError("worker crashed")
+        
+        repo = InMemoryEvolutionRepository()
+        runner = EvolutionJobRunner(repo, executor=BrokenExecutor(max_workers=1))
+        
+        result = await runner.submit(EvolutionParameters(population_size=10, generations=2))
+        await runner.wait()
+        
+        saved = await repo.get_by_id(result.id)
+        assert saved.status == EvolutionStatus.FAILED
+        assert "worker crashed" in saved.error_message
+    
+    @pytest.mark.asyncio
+    async def test_submit_validates(self):
+        runner = EvolutionJobRunner(InMemoryEvolutionRepository())
+        
+        with pytest.raises(ValidationError):
+            await runner.submit(EvolutionParameters(population_size=1))
@@ -0,0 +1,163 @@
+"""
+Unit tests for memoized fitness evaluation
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.domain.entities import EvolutionParameters
+from src.application.evolution_use_cases import RunEvolutionUseCase, create_engine, parameter_errors
+from src.application.fitness import (
+    FitnessCache,
+    FitnessEvaluator,
+    arena,
+    fitness_names,
+    get_fitness,
+    trait_sum
+)
+from src.application.profiling import PhaseProfile
+
+
+class CountingFitness:
+    """Trait sum that records how many genomes it was asked to score"""
+    
+    def __init__(self):
+        self.evaluated = 0
+    
+    def __call__(self, genomes: np.ndarray) -> np.ndarray:
+        self.evaluated += genomes.shape[0]
+        return genomes.sum(axis=1)
+
+
+class TestFitnessCache:
+    """Test the bounded LRU"""
+    
+    def test_evicts_least_recently_used(self):
+        cache = FitnessCache(max_entries=2)
+        cache.put(b"a", 1.0)
+        cache.put(b"b", 2.0)
+        assert cache.get(b"a") == 1.0
+        cache.put(b"c", 3.0)
+        
+        assert len(cache) == 2
+        assert cache.get(b"b") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestFitnessEvaluator:
+    """Test memoized batch evaluation"""
+    
+    def test_computes_each_genome_once(self):
+        function = CountingFitness()
+        evaluator = FitnessEvaluator(function)
+        genomes = np.random.default_rng(0).random((10, 5))
+        batch = np.concatenate((genomes, genomes[:3]))
+        
+        fitness = evaluator.evaluate(batch)
+        assert fitness == pytest.approx(batch.sum(axis=1))
+        assert function.evaluated == 10
+        
+        evaluator.evaluate(genomes)
+        assert function.evaluated == 10
+        assert evaluator.hits == 10
+    
+    def test_trait_sum_is_not_memoized(self):
+        assert FitnessEvaluator(trait_sum).cache is None
+        assert FitnessEvaluator(trait_sum, cache_size=16).cache is not None
+    
+    def test_chunks_across_executor(self):
+        genomes = np.random.default_rng(3).random((150, 5))
+        calls = []
+        
+        class RecordingExecutor(ThreadPoolExecutor):
+            def map(self, fn, *iterables):
+                chunks = list(iterables[1])
+                calls.append([len(chunk) for chunk in chunks])
+                return super().map(fn, iterables[0], chunks)
+        
+        with RecordingExecutor(max_workers=2) as executor:
+            evaluator = FitnessEvaluator("arena", executor=executor, chunk_size=64)
+            fitness = evaluator.evaluate(genomes)
+        
+        assert calls == [[64, 64, 22]]
+        assert fitness == pytest.approx(arena(genomes))
+    
+    def test_cheap_functions_stay_in_process(self):
+        genomes = np.random.default_rng(4).random((200, 5))
+        
+        class FailingExecutor(ThreadPoolExecutor):
+            def map(self, *args, **kwargs):
+                raise AssertionError("trait_sum should not be shipped to workers")
+        
+        with FailingExecutor(max_workers=1) as executor:
+            evaluator = FitnessEvaluator("trait_sum", executor=executor, chunk_size=8)
+            assert evaluator.evaluate(genomes) == pytest.approx(genomes.sum(axis=1))
+
+
+class TestFitnessRegistry:
+    """Test registered fitness functions and their selection by name"""
+    
+    def test_builtins_registered(self):
+        assert {"trait_sum", "weighted_traits", "balanced", "arena"} <= set(fitness_names())
+        with pytest.raises(ValueError):
+            get_fitness("nope")
+    
+    @pytest.mark.parametrize("name", ["trait_sum", "weighted_traits", "balanced", "arena"])
+    def test_scores_within_trait_sum_range(self, name):
+        genomes = np.random.default_rng(5).random((40, 5))
+        fitness = get_fitness(name).function(genomes)
+        assert fitness.shape == (40,)
+        assert np.all((fitness >= 0) & (fitness <= 5))
+    
+    def test_unknown_name_is_a_parameter_error(self):
+        errors = parameter_errors(EvolutionParameters(fitness_function="nope"))
+        assert any("fitness_function" in e for e in errors)
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_engine_uses_selected_function(self, engine):
+        params = EvolutionParameters(
+            population_size=20, generations=3, random_seed=6, engine=engine, fitness_function="balanced"
+        )
+        result = RunEvolutionUseCase().run(params)
+        best = result.best_agent.genome
+        physical = (best.speed + best.strength) / 2
+        mental = (best.intelligence + best.adaptability) / 2
+        assert result.best_agent.fitness == pytest.approx(5 * (physical * mental * best.cooperation) ** (1 / 3))
+    
+    def test_process_pool_matches_serial(self):
+        params = EvolutionParameters(population_size=200, generations=2, random_seed=7, fitness_function="arena")
+        serial = RunEvolutionUseCase().run(params)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pooled = RunEvolutionUseCase(fitness_executor=executor).run(params)
+        assert [g.avg_fitness for g in pooled.generations] == pytest.approx(
+            [g.avg_fitness for g in serial.generations]
+        )
+
+
+class TestEngineSkipsSurvivors:
+    """Only offspring are evaluated after the first generation"""
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_evaluates_offspring_only(self, engine):
+        params = EvolutionParameters(population_size=50, survival_rate=0.4, random_seed=1, engine=engine)
+        evolution = create_engine(params)
+        function = CountingFitness()
+        evolution.fitness_evaluator = FitnessEvaluator(function)
+        
+        population = evolution.initial_population()
+        assert evolution.evaluate(population) == 50
+        population = evolution.next_generation(population)
+        assert evolution.evaluate(population) == 30
+        # Already evaluated: nothing to do
+        assert evolution.evaluate(population) == 0
+        assert function.evaluated <= 80
+        
+        agents = evolution.to_agents(population)
+        assert [a.fitness for a in agents] == pytest.approx([a.genome.fitness_score for a in agents])
+    
+    def test_run_profile_counts_new_agents(self):
+        params = EvolutionParameters(population_size=20, generations=3, survival_rate=0.5, random_seed=2)
+        result = RunEvolutionUseCase().run(params, profiler=PhaseProfile())
+        calls = [g["phases"]["fitness"]["calls"] for g in result.profile["generations"]]
+        assert calls == [20, 10, 10]
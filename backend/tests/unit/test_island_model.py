@@ -0,0 +1,172 @@
+"""
+Unit tests for island-model evolution
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.domain.entities import EvolutionParameters, EvolutionStatus
+from src.application.evolution_use_cases import RunEvolutionUseCase, create_engine
+from src.application import island_model
+from src.application.evolution_jobs import run_evolution_job
+from src.application.island_model import (
+    InlineExecutor, IslandGeneration, IslandModel, island_sizes, merge_generation
+)
+
+
+def island_params(**overrides):
+    values = dict(
+        population_size=40,
+        generations=7,
+        random_seed=42,
+        islands=4,
+        migration_interval=3,
+        migration_size=2
+    )
+    values.update(overrides)
+    return EvolutionParameters(**values)
+
+
+class TestIslandHelpers:
+    """Test island sizing, migration and stat merging"""
+    
+    def test_island_sizes_distribute_remainder(self):
+        assert island_sizes(10, 3) == [4, 3, 3]
+        assert sum(island_sizes(1000, 7)) == 1000
+    
+    def test_merge_generation_matches_whole_population(self):
+        engine = create_engine(EvolutionParameters(population_size=30, random_seed=5))
+        population = engine.initial_population()
+        engine.evaluate(population)
+        expected = engine.generation_stats(population, 1)
+        
+        records = []
+        for part in (population[:12], population[12:]):
+            sums, squares = engine.trait_moments(part)
+            records.append(IslandGeneration(
+                stats=engine.generation_stats(part, 1),
+                trait_sums=sums,
+                trait_squares=squares
+            ))
+        merged = merge_generation(records)
+        
+        assert merged.population_size == 30
+        assert merged.avg_fitness == pytest.approx(expected.avg_fitness)
+        assert merged.max_fitness == pytest.approx(expected.max_fitness)
+        assert merged.min_fitness == pytest.approx(expected.min_fitness)
+        assert merged.diversity_score == pytest.approx(expected.diversity_score)
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_replace_worst_keeps_size_and_adds_migrants(self, engine):
+        params = EvolutionParameters(population_size=10, random_seed=3, engine=engine)
+        target_engine = create_engine(params)
+        target = target_engine.initial_population()
+        target_engine.evaluate(target)
+        
+        donor = create_engine(EvolutionParameters(population_size=10, random_seed=4, engine=engine))
+        source = donor.initial_population()
+        donor.evaluate(source)
+        migrants = donor.select_elites(source, 2)
+        
+        merged = target_engine.replace_worst(target, migrants)
+        assert len(merged) == 10
+        best = target_engine.best_agent(merged)
+        assert best.fitness == pytest.approx(
+            max(donor.best_agent(source).fitness, target_engine.best_agent(target).fitness)
+        )
+
+
+class TestIslandModel:
+    """Test IslandModel runs"""
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_run_merges_islands(self, engine):
+        params = island_params(engine=engine)
+        seen = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            generations, best, final_population = IslandModel(params, executor).run(seen.append)
+        
+        assert [s.generation_number for s in generations] == list(range(1, 8))
+        assert seen == generations
+        assert all(s.population_size == 40 for s in generations)
+        assert len(final_population) == 40
+        assert best.fitness == pytest.approx(max(s.max_fitness for s in generations))
+    
+    def test_migrants_get_new_ids(self):
+        params = island_params(migration_interval=1)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            _, _, final_population = IslandModel(params, executor).run()
+        
+        assert len({agent.id for agent in final_population}) == len(final_population)
+    
+    def test_migration_never_loses_best(self):
+        # Migrants only replace the worst agents, so elites survive every epoch
+        params = island_params(engine="vectorized", generations=6, migration_interval=1)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            generations, _, _ = IslandModel(params, executor).run()
+        
+        peaks = [s.max_fitness for s in generations]
+        assert peaks == sorted(peaks)
+    
+    def test_seeded_runs_are_reproducible(self):
+        params = island_params(engine="vectorized")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first, _, _ = IslandModel(params, executor).run()
+            second, _, _ = IslandModel(params, executor).run()
+        
+        assert [s.avg_fitness for s in first] == [s.avg_fitness for s in second]
+    
+    @pytest.mark.asyncio
+    async def test_use_case_runs_islands_in_processes(self):
+        params = island_params(generations=4, migration_interval=2, islands=2)
+        result = await RunEvolutionUseCase().execute(params)
+        
+        assert result.status == EvolutionStatus.COMPLETED
+        assert len(result.generations) == 4
+        assert result.generations[0].population_size == 40
+        assert len(result.final_population) == 40
+        assert result.best_agent is not None
+    
+    @pytest.mark.asyncio
+    async def test_use_case_reuses_island_executor(self):
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+            
+            def submit(self, *args, **kwargs):
+                CountingExecutor.submitted += 1
+                return super().submit(*args, **kwargs)
+        
+        params = island_params(generations=4, migration_interval=2, islands=2)
+        with CountingExecutor(max_workers=2) as executor:
+            use_case = RunEvolutionUseCase(island_executor=executor)
+            await use_case.execute(params)
+            await use_case.execute(params)
+        
+        # Two epochs of two islands per run, all on the shared pool
+        assert CountingExecutor.submitted == 8
+    
+    def test_inline_executor_matches_pool(self):
+        params = island_params(engine="vectorized")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pooled, _, _ = IslandModel(params, executor).run()
+        inline, _, _ = IslandModel(params, InlineExecutor()).run()
+        
+        assert [s.avg_fitness for s in inline] == [s.avg_fitness for s in pooled]
+    
+    def test_job_worker_runs_islands_in_process(self, monkeypatch):
+        def no_pool(*args, **kwargs):
+            raise AssertionError("island pool created inside a job worker")
+        monkeypatch.setattr(island_model, "ProcessPoolExecutor", no_pool)
+        
+        params = island_params(generations=4, migration_interval=2, islands=2)
+        result, _ = run_evolution_job(params, None)
+        
+        assert result.status == EvolutionStatus.COMPLETED
+        assert len(result.generations) == 4
+    
+    def test_invalid_island_parameters(self):
+        assert island_params().validate() == []
+        assert any("islands" in e for e in island_params(islands=0).validate())
+        assert any("islands" in e for e in island_params(islands=30).validate())
+        assert any("migration_size" in e for e in island_params(migration_size=10).validate())
+        assert any("migration_interval" in e for e in island_params(migration_interval=0).validate())
@@ -0,0 +1,103 @@
+"""
+Unit tests for the bounded in-memory repository
+"""
+import pytest
+
+from src.domain.entities import Agent, EvolutionCheckpoint, Genome
+from src.adapters.persistence import InMemoryEvolutionRepository
+from src.adapters.persistence.memory_repository import GENERATION_BYTES, RESULT_BYTES
+
+
+class TestEviction:
+    """Test size, byte and TTL bounds"""
+    
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, make_result):
+        repo = InMemoryEvolutionRepository(max_results=2)
+        await repo.save(make_result("a"))
+        await repo.save(make_result("b"))
+        await repo.get_by_id("a")
+        await repo.save(make_result("c"))
+        
+        assert await repo.get_by_id("b") is None
+        assert await repo.get_by_id("a") is not None
+        assert repo.evictions == 1
+        assert (await repo.get_aggregates()).total_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_byte_budget_covers_blobs(self, make_result):
+        repo = InMemoryEvolutionRepository(max_bytes=3 * RESULT_BYTES + 10 * GENERATION_BYTES)
+        await repo.save(make_result("a", generations=10))
+        await repo.save(make_result("b"))
+        assert repo.bytes_used == 2 * RESULT_BYTES + 10 * GENERATION_BYTES
+        
+        await repo.save_checkpoint(EvolutionCheckpoint("b", 1, b"\0" * (RESULT_BYTES + 1)))
+        assert await repo.get_by_id("a") is None
+        assert repo.bytes_used == 2 * RESULT_BYTES + 1
+        
+        result = make_result("c")
+        result.final_population = [
+            Agent(id="", genome=Genome(0.5, 0.5, 0.5, 0.5, 0.5)) for _ in range(100)
+        ]
+        await repo.save(result)
+        assert await repo.get_by_id("b") is None
+        assert await repo.get_checkpoint("b") is None
+        assert (await repo.get_population("c")).total == 100
+    
+    @pytest.mark.asyncio
+    async def test_keeps_newest_even_if_oversized(self, make_result):
+        repo = InMemoryEvolutionRepository(max_bytes=1)
+        await repo.save(make_result("a"))
+        await repo.save(make_result("b"))
+        assert [r.id for r in await repo.list_all()] == ["b"]
+    
+    @pytest.mark.asyncio
+    async def test_ttl_expires_unused(self, make_result, clock):
+        repo = InMemoryEvolutionRepository(ttl_seconds=60, clock=clock)
+        await repo.save(make_result("a"))
+        await repo.save(make_result("b"))
+        clock.now = 50
+        await repo.get_by_id("b")
+        clock.now = 100
+        
+        assert await repo.get_by_id("a") is None
+        assert await repo.get_by_id("b") is not None
+        assert (await repo.get_aggregates()).total_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_checkpoint_read_counts_as_use(self, make_result):
+        repo = InMemoryEvolutionRepository(max_results=2)
+        await repo.save(make_result("a"))
+        await repo.save_checkpoint(EvolutionCheckpoint("a", 1, b"state"))
+        await repo.save(make_result("b"))
+        await repo.get_checkpoint("a")
+        await repo.list_all()
+        await repo.save(make_result("c"))
+        
+        assert await repo.get_by_id("a") is not None
+        assert await repo.get_by_id("b") is None
+    
+    @pytest.mark.asyncio
+    async def test_orphan_checkpoint_ignored(self):
+        repo = InMemoryEvolutionRepository()
+        await repo.save_checkpoint(EvolutionCheckpoint("missing", 1, b"state"))
+        assert await repo.get_checkpoint("missing") is None
+
+
+class TestCreatedAtIndex:
+    """Test newest-first paging over the created_at index"""
+    
+    @pytest.mark.asyncio
+    async def test_pages_newest_first(self, make_result):
+        repo = InMemoryEvolutionRepository()
+        for minutes in (3, 0, 4, 1, 2):
+            await repo.save(make_result(f"r{minutes}", minutes=minutes))
+        
+        assert [r.id for r in await repo.list_all(limit=2)] == ["r4", "r3"]
+        assert [r.id for r in await repo.list_all(limit=2, offset=2)] == ["r2", "r1"]
+        assert [r.id for r in await repo.list_all(limit=2, offset=4)] == ["r0"]
+        assert await repo.list_all(offset=5) == []
+        
+        await repo.delete("r3")
+        assert [r.id for r in await repo.list_all(limit=3)] == ["r4", "r2", "r1"]
+        assert [r.id for r in (await repo.get_aggregates(recent=2)).recent] == ["r4", "r2"]
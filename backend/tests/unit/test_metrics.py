@@ -0,0 +1,84 @@
+"""
+Unit tests for the Prometheus-style metrics adapter
+"""
+import threading
+
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest
+
+from src.domain.entities import EvolutionResult, EvolutionStatus
+from src.adapters.metrics import (
+    ThreadCellCounter, POPULATION_BUCKETS, registry, size_bucket, record_evolution_run
+)
+from src.adapters.persistence import InMemoryEvolutionRepository, InstrumentedEvolutionRepository
+
+
+class TestThreadCellCounter:
+    """Test per-thread counter cells"""
+    
+    def test_sums_across_threads(self):
+        counter = ThreadCellCounter("test_total", "Test", ("kind",))
+        
+        def work():
+            for _ in range(1000):
+                counter.inc(labels=("a",))
+        
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(2, labels=("b",))
+        
+        assert counter.values() == {("a",): 8000, ("b",): 2}
+    
+    def test_collected_by_prometheus_client(self):
+        counter = ThreadCellCounter("test_total", "A test counter", ("kind",))
+        counter.inc(labels=('say "hi"',))
+        registry = CollectorRegistry()
+        registry.register(counter)
+        
+        text = generate_latest(registry).decode()
+        assert "# TYPE test_total counter" in text
+        assert 'test_total{kind="say \\"hi\\""} 1.0' in text
+        assert registry.get_sample_value("test_total", {"kind": 'say "hi"'}) == 1
+
+
+class TestEvolutionRunMetrics:
+    """Test evolution-run bucketing"""
+    
+    def test_size_bucket(self):
+        assert size_bucket(20, POPULATION_BUCKETS) == "le_20"
+        assert size_bucket(150, POPULATION_BUCKETS) == "le_200"
+        assert size_bucket(5000, POPULATION_BUCKETS) == "gt_1000"
+    
+    def test_record_evolution_run(self):
+        labels = {"status": "completed", "engine": "vectorized", "population_size": "le_500", "generations": "le_50"}
+        before = registry.get_sample_value("clawdna_evolution_runs_total", labels) or 0
+        result = EvolutionResult(
+            id="run",
+            status=EvolutionStatus.COMPLETED,
+            parameters={"population_size": 300, "generations": 40, "engine": "vectorized"},
+            execution_time_ms=120
+        )
+        record_evolution_run(result)
+        assert registry.get_sample_value("clawdna_evolution_runs_total", labels) == before + 1
+
+
+class TestInstrumentedRepository:
+    """Test repository call timing"""
+    
+    @pytest.mark.asyncio
+    async def test_records_calls_and_forwards(self):
+        inner = InMemoryEvolutionRepository()
+        repository = InstrumentedEvolutionRepository(inner)
+        name = "clawdna_repository_call_duration_seconds_count"
+        labels = {"repository": "InMemoryEvolutionRepository", "operation": "get_by_id", "outcome": "ok"}
+        before = registry.get_sample_value(name, labels) or 0
+        
+        assert await repository.get_by_id("missing") is None
+        assert registry.get_sample_value(name, labels) == before + 1
+        
+        # Non-interface methods reach the wrapped repository
+        repository.clear()
+        assert await repository.list_all() == []
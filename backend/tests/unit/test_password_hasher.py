@@ -0,0 +1,75 @@
+"""
+Unit tests for the bounded password hashing pool
+"""
+import asyncio
+import threading
+
+import pytest
+
+from src.adapters.api.auth import pwd_context
+from src.adapters.api.password_hasher import PasswordHasher, PasswordHasherBusy
+
+
+class BlockingContext:
+    """Stands in for a CryptContext whose hashes wait for a release"""
+    
+    def __init__(self):
+        self.release = threading.Event()
+    
+    def hash(self, password: str) -> str:
+        self.release.wait(5)
+        return f"hashed:{password}"
+    
+    def verify(self, password: str, hashed_password: str) -> bool:
+        return self.hash(password) == hashed_password
+
+
+class TestPasswordHasher:
+    """Test bcrypt offloading and backpressure"""
+    
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_with_bcrypt(self):
+        hasher = PasswordHasher(pwd_context, max_workers=1)
+        try:
+            hashed = await hasher.hash("correct-horse")
+            assert await hasher.verify("correct-horse", hashed)
+            assert not await hasher.verify("wrong-password", hashed)
+            assert hasher.in_flight == 0
+        finally:
+            hasher.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated(self):
+        context = BlockingContext()
+        hasher = PasswordHasher(context, max_workers=1, max_queue=1)
+        try:
+            first = asyncio.create_task(hasher.hash("a"))
+            second = asyncio.create_task(hasher.verify("b", "hashed:b"))
+            await asyncio.sleep(0)
+            assert (hasher.running, hasher.queued) == (1, 1)
+            
+            with pytest.raises(PasswordHasherBusy):
+                await hasher.hash("c")
+            assert hasher.rejected == 1
+            
+            context.release.set()
+            assert await first == "hashed:a"
+            assert await second is True
+            assert (hasher.running, hasher.queued) == (0, 0)
+        finally:
+            context.release.set()
+            hasher.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        context = BlockingContext()
+        hasher = PasswordHasher(context, max_workers=1)
+        try:
+            pending = asyncio.create_task(hasher.hash("slow"))
+            # The loop keeps running other work while the hash blocks its thread
+            await asyncio.sleep(0.01)
+            assert not pending.done()
+            context.release.set()
+            assert await pending == "hashed:slow"
+        finally:
+            hasher.shutdown()
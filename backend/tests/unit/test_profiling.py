@@ -0,0 +1,107 @@
+"""
+Unit tests for per-phase profiling
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.domain.entities import EvolutionParameters
+from src.application.evolution_jobs import EvolutionJobRunner
+from src.application.evolution_use_cases import RunEvolutionUseCase
+from src.application.island_model import IslandModel
+from src.application.profiling import PhaseProfile, phase_metrics
+from src.adapters.persistence import InMemoryEvolutionRepository
+
+
+class TestPhaseProfile:
+    """Test PhaseProfile bookkeeping"""
+    
+    def test_add_per_generation_and_totals(self):
+        profile = PhaseProfile()
+        profile.begin_generation()
+        profile.add("fitness", 0.5, calls=10)
+        profile.add("fitness", 0.25, calls=10)
+        profile.end_generation()
+        profile.add("persistence", 0.1)
+        
+        report = profile.to_dict()
+        assert report["totals"]["fitness"] == {"time_ms": 750.0, "calls": 20}
+        assert report["totals"]["persistence"]["calls"] == 1
+        assert report["generations"] == [
+            {"generation_number": 1, "phases": {"fitness": {"time_ms": 750.0, "calls": 20}}}
+        ]
+    
+    def test_dict_round_trip(self):
+        profile = PhaseProfile()
+        profile.begin_generation()
+        profile.add("selection", 0.002, calls=3)
+        assert PhaseProfile.from_dict(profile.to_dict()).to_dict() == profile.to_dict()
+
+
+class TestProfiledRuns:
+    """Test instrumentation of RunEvolutionUseCase"""
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    def test_run_records_every_phase(self, engine):
+        params = EvolutionParameters(population_size=20, generations=4, random_seed=1, engine=engine)
+        result = RunEvolutionUseCase().run(params, profiler=PhaseProfile())
+        
+        assert len(result.profile["generations"]) == 4
+        first = result.profile["generations"][0]["phases"]
+        assert set(first) == {"fitness", "statistics", "selection", "variation"}
+        assert first["fitness"]["calls"] == 20
+        # Last generation does not breed
+        assert "variation" not in result.profile["generations"][-1]["phases"]
+    
+    def test_run_without_profiler_reports_nothing(self):
+        result = RunEvolutionUseCase().run(EvolutionParameters(population_size=10, generations=2))
+        assert result.profile is None
+    
+    @pytest.mark.asyncio
+    async def test_execute_profile_includes_persistence_and_metrics(self):
+        before = phase_metrics.snapshot()
+        use_case = RunEvolutionUseCase(repository=InMemoryEvolutionRepository())
+        result = await use_case.execute(
+            EvolutionParameters(population_size=10, generations=3), profile=True
+        )
+        
+        assert result.profile["totals"]["persistence"]["calls"] == 1
+        after = phase_metrics.snapshot()
+        assert after["runs"] == before["runs"] + 1
+        assert after["calls"]["fitness"] > before["calls"]["fitness"]
+    
+    @pytest.mark.asyncio
+    async def test_sampled_run_feeds_metrics_without_reporting(self):
+        before = phase_metrics.snapshot()["runs"]
+        use_case = RunEvolutionUseCase(profile_sample_rate=1.0)
+        result = await use_case.execute(EvolutionParameters(population_size=10, generations=2))
+        
+        assert result.profile is None
+        assert phase_metrics.snapshot()["runs"] == before + 1
+    
+    def test_island_profile_sums_islands(self):
+        params = EvolutionParameters(
+            population_size=40, generations=4, random_seed=2, islands=2, migration_interval=2
+        )
+        profiler = PhaseProfile()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            IslandModel(params, executor).run(profiler=profiler)
+        
+        report = profiler.to_dict()
+        assert len(report["generations"]) == 4
+        assert report["generations"][0]["phases"]["fitness"]["calls"] == 40
+        assert report["totals"]["migration"]["calls"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_sampled_background_job(self):
+        before = phase_metrics.snapshot()["runs"]
+        repo = InMemoryEvolutionRepository()
+        runner = EvolutionJobRunner(
+            repo, executor=ThreadPoolExecutor(max_workers=1), profile_sample_rate=1.0
+        )
+        result = await runner.submit(EvolutionParameters(population_size=10, generations=3))
+        await runner.wait()
+        runner.shutdown()
+        
+        assert phase_metrics.snapshot()["runs"] == before + 1
+        assert (await repo.get_by_id(result.id)).profile is None
@@ -0,0 +1,144 @@
+"""
+Unit tests for the seeded-run result cache
+"""
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.domain.entities import CachedResult, EvolutionParameters
+from src.application.evolution_use_cases import RunEvolutionUseCase, result_cache_key
+from src.adapters.persistence import (
+    InMemoryEvolutionRepository, LRUResultCache, SQLiteResultCache
+)
+
+
+class TestResultCacheKey:
+    """Test parameter fingerprints"""
+    
+    def test_unseeded_runs_have_no_key(self):
+        assert result_cache_key(EvolutionParameters()) is None
+    
+    def test_identical_parameters_share_key(self):
+        first = EvolutionParameters(random_seed=1, mutation_rate=0.1)
+        second = EvolutionParameters(random_seed=1, mutation_rate=0.10)
+        assert result_cache_key(first) == result_cache_key(second)
+    
+    def test_any_parameter_changes_key(self):
+        base = result_cache_key(EvolutionParameters(random_seed=1))
+        assert result_cache_key(EvolutionParameters(random_seed=2)) != base
+        assert result_cache_key(EvolutionParameters(random_seed=1, engine="vectorized")) != base
+        assert result_cache_key(EvolutionParameters(random_seed=1, generations=11)) != base
+
+
+def entry(result_id: str, size: int = 8) -> CachedResult:
+    return CachedResult(result_id=result_id, payload=b"x" * size)
+
+
+class TestLRUResultCache:
+    """Test LRUResultCache"""
+    
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        cache = LRUResultCache(max_entries=2)
+        await cache.put("a", entry("a"))
+        await cache.put("b", entry("b"))
+        await cache.get("a")
+        await cache.put("c", entry("c"))
+        
+        assert len(cache) == 2
+        assert await cache.get("b") is None
+        assert (await cache.get("a")).result_id == "a"
+        assert cache.hits == 2
+        assert cache.misses == 1
+    
+    @pytest.mark.asyncio
+    async def test_evicts_past_byte_bound(self):
+        cache = LRUResultCache(max_bytes=100)
+        await cache.put("a", entry("a", 40))
+        await cache.put("b", entry("b", 40))
+        await cache.put("c", entry("c", 40))
+        
+        assert await cache.get("a") is None
+        assert cache.bytes_used == 80
+        # Too large to keep at all
+        await cache.put("d", entry("d", 101))
+        assert await cache.get("d") is None
+        assert cache.bytes_used == 80
+    
+    @pytest.mark.asyncio
+    async def test_hits_return_stored_entry(self):
+        cache = LRUResultCache()
+        stored = entry("a")
+        await cache.put("a", stored)
+        
+        assert await cache.get("a") is stored
+        with pytest.raises(FrozenInstanceError):
+            stored.payload = b""
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_second_tier(self, tmp_path):
+        backing = SQLiteResultCache(str(tmp_path / "cache.db"), max_entries=2)
+        cache = LRUResultCache(max_entries=1, backing=backing)
+        try:
+            await cache.put("a", entry("a"))
+            await cache.put("b", entry("b"))
+            # "a" fell out of memory but is promoted back from SQLite
+            assert await cache.get("a") == entry("a")
+            
+            await cache.put("c", entry("c"))
+            assert await backing.get("a") is None
+            await cache.discard("c")
+            assert await backing.get("c") is None
+        finally:
+            cache.close()
+
+
+class TestCachedRunEvolution:
+    """Test RunEvolutionUseCase with a result cache"""
+    
+    @pytest.mark.asyncio
+    async def test_seeded_run_is_served_from_cache(self):
+        repo = InMemoryEvolutionRepository()
+        use_case = RunEvolutionUseCase(repository=repo, cache=LRUResultCache())
+        params = EvolutionParameters(population_size=10, generations=3, random_seed=5)
+        
+        first = await use_case.execute(params)
+        second = await use_case.execute(params)
+        
+        assert second.id == first.id
+        assert second.best_agent == first.best_agent
+        assert len(await repo.list_all()) == 1
+    
+    @pytest.mark.asyncio
+    async def test_profile_is_not_cached(self):
+        use_case = RunEvolutionUseCase(repository=InMemoryEvolutionRepository(), cache=LRUResultCache())
+        params = EvolutionParameters(population_size=10, generations=3, random_seed=5)
+        
+        profiled = await use_case.execute(params, profile=True)
+        assert profiled.profile is not None
+        
+        hit = await use_case.execute(params)
+        assert hit.id == profiled.id
+        assert hit.profile is None
+        assert b'"profile":null' in (await use_case.cached(params)).payload
+    
+    @pytest.mark.asyncio
+    async def test_evicted_result_is_a_miss(self):
+        repo = InMemoryEvolutionRepository(max_results=1)
+        use_case = RunEvolutionUseCase(repository=repo, cache=LRUResultCache())
+        params = EvolutionParameters(population_size=10, generations=3, random_seed=5)
+        
+        first = await use_case.execute(params)
+        await use_case.execute(EvolutionParameters(population_size=10, generations=3, random_seed=6))
+        
+        assert await use_case.cached(params) is None
+        again = await use_case.execute(params)
+        assert again.id != first.id
+        assert (await use_case.cached(params)).result_id == again.id
+    
+    @pytest.mark.asyncio
+    async def test_unpersisted_runs_are_not_cached(self):
+        cache = LRUResultCache()
+        params = EvolutionParameters(population_size=10, generations=3, random_seed=5)
+        await RunEvolutionUseCase(cache=cache).execute(params)
+        assert len(cache) == 0
@@ -0,0 +1,87 @@
+"""
+Unit tests for selection strategies
+"""
+import numpy as np
+import pytest
+
+from src.domain.entities import EvolutionParameters, SELECTION_STRATEGIES
+from src.application.evolution_use_cases import create_engine
+from src.application.selection import (
+    PARENT_SELECTORS, rank, select_parent_pairs, stochastic_universal, top_k, truncation
+)
+
+
+class TestTopK:
+    """Test partial selection"""
+    
+    def test_matches_full_sort(self):
+        fitness = np.random.default_rng(3).random(500)
+        expected = np.argsort(-fitness, kind="stable")[:40]
+        assert top_k(fitness, 40).tolist() == expected.tolist()
+    
+    def test_ties_keep_original_order(self):
+        fitness = np.array([1.0, 3.0, 3.0, 2.0, 3.0])
+        assert top_k(fitness, 3).tolist() == [1, 2, 4]
+    
+    def test_bounds(self):
+        fitness = np.array([1.0, 2.0])
+        assert top_k(fitness, 0).tolist() == []
+        assert top_k(fitness, 5).tolist() == [1, 0]
+
+
+class TestParentSelectors:
+    """Test parent sampling schemes"""
+    
+    def test_every_strategy_registered(self):
+        assert set(PARENT_SELECTORS) == set(SELECTION_STRATEGIES)
+    
+    @pytest.mark.parametrize("strategy", SELECTION_STRATEGIES)
+    def test_pairs_in_range(self, strategy):
+        fitness = np.linspace(0.0, 5.0, 30)
+        parents1, parents2 = select_parent_pairs(
+            strategy, fitness, 100, np.random.default_rng(0), 3
+        )
+        assert parents1.shape == parents2.shape == (100,)
+        assert parents1.min() >= 0 and parents2.max() < 30
+    
+    def test_rank_prefers_fitter(self):
+        fitness = np.array([0.0, 1.0, 2.0, 3.0])
+        picks = rank(fitness, 20_000, np.random.default_rng(1))
+        counts = np.bincount(picks, minlength=4) / 20_000
+        # Linear ranking weights 1:2:3:4
+        assert counts == pytest.approx([0.1, 0.2, 0.3, 0.4], abs=0.02)
+    
+    def test_sus_is_within_one_of_expectation(self):
+        fitness = np.array([1.0, 2.0, 3.0, 4.0])
+        picks = stochastic_universal(fitness, 50, np.random.default_rng(2))
+        counts = np.bincount(picks, minlength=4)
+        expected = fitness / fitness.sum() * 50
+        assert np.all(np.abs(counts - expected) < 1)
+    
+    def test_sus_handles_zero_fitness(self):
+        picks = stochastic_universal(np.zeros(5), 10, np.random.default_rng(0))
+        assert sorted(picks.tolist()) == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    
+    def test_truncation_is_uniform_over_pool(self):
+        picks = truncation(np.arange(5.0), 1000, np.random.default_rng(0))
+        assert set(picks.tolist()) == {0, 1, 2, 3, 4}
+
+
+class TestSelectionStrategyParameter:
+    """Test selection_strategy on EvolutionParameters"""
+    
+    def test_invalid_strategy(self):
+        errors = EvolutionParameters(selection_strategy="roulette").validate()
+        assert any("selection_strategy" in e for e in errors)
+    
+    @pytest.mark.parametrize("engine", ["standard", "vectorized"])
+    @pytest.mark.parametrize("strategy", SELECTION_STRATEGIES)
+    def test_engines_run_every_strategy(self, engine, strategy):
+        params = EvolutionParameters(
+            population_size=30, random_seed=5, engine=engine, selection_strategy=strategy
+        )
+        evolution = create_engine(params)
+        population = evolution.initial_population()
+        evolution.evaluate(population)
+        population = evolution.next_generation(population)
+        assert len(evolution.to_agents(population)) == 30
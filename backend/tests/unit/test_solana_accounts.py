@@ -0,0 +1,77 @@
+"""
+Unit tests for AgentData account decoding
+"""
+import base64
+import struct
+
+import pytest
+
+from src.adapters.solana_accounts import (
+    AGENT_DATA_DISCRIMINATOR, b58encode, decode_agent_account, decode_agent_data
+)
+
+MINT = bytes(range(1, 33))
+PARENT = bytes([7]) * 32
+
+
+def encode_agent(
+    mint: bytes = MINT,
+    genome: bytes = bytes([80, 75, 90, 65, 85, 70, 88, 72]),
+    generation: int = 5,
+    parents: tuple = (PARENT, bytes(32)),
+    created_at: int = 1_767_225_600,
+    name: str = "Clawd",
+    bump: int = 254,
+    space: int = 0,
+    discriminator: bytes = AGENT_DATA_DISCRIMINATOR
+) -> bytes:
+    """Borsh-encode an AgentData account, zero-padded to `space` bytes like on-chain"""
+    raw = name.encode()
+    data = (
+        discriminator + mint + genome + struct.pack("<H", generation) + parents[0] + parents[1]
+        + struct.pack("<qI", created_at, len(raw)) + raw + bytes([bump])
+    )
+    return data.ljust(space, b"\0")
+
+
+class TestBase58:
+    """Test public key text encoding"""
+    
+    def test_known_vectors(self):
+        assert b58encode(b"hello world") == "StV1DL6CwTryKyV"
+        assert b58encode(bytes(32)) == "1" * 32
+        assert b58encode(b"\0\0\x01") == "112"
+
+
+class TestDecodeAgentData:
+    """Test the AgentData Borsh layout"""
+    
+    def test_round_trip(self):
+        agent = decode_agent_data(encode_agent(space=8 + 32 + 8 + 2 + 64 + 8 + 4 + 1 + 50))
+        assert agent.mint == b58encode(MINT)
+        assert agent.genome == (80, 75, 90, 65, 85, 70, 88, 72)
+        assert agent.generation == 5
+        assert agent.parents == (b58encode(PARENT), "1" * 32)
+        assert agent.name == "Clawd"
+        assert agent.bump == 254
+        assert agent.to_dict()["created_at"] == "2026-01-01T00:00:00+00:00"
+    
+    def test_reads_from_memoryview_slices(self):
+        buffer = bytearray(b"xx" + encode_agent(name="Ünï"))
+        agent = decode_agent_data(memoryview(buffer)[2:])
+        assert agent.name == "Ünï"
+    
+    @pytest.mark.parametrize("data", [
+        encode_agent(discriminator=bytes(8)),
+        encode_agent()[:100],
+        encode_agent(name="long name")[:-5],
+    ])
+    def test_rejects_other_or_truncated_accounts(self, data):
+        with pytest.raises(ValueError):
+            decode_agent_data(data)
+    
+    def test_decode_rpc_account(self):
+        account = {"data": [base64.b64encode(encode_agent()).decode(), "base64"]}
+        assert decode_agent_account(account).generation == 5
+        assert decode_agent_account(None) is None
+        assert decode_agent_account({"data": ["bm90IGFuIGFnZW50", "base64"]}) is None
@@ -0,0 +1,192 @@
+"""
+Unit tests for the Solana adapter against a local stub JSON-RPC server
+"""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+import base64
+
+from src.adapters.solana_accounts import b58encode
+from src.adapters.solana_adapter import SolanaAdapter
+from tests.unit.test_solana_accounts import encode_agent
+
+
+class StubRpc:
+    """Minimal JSON-RPC node: answers batches in reverse order to exercise id matching"""
+    
+    RESULTS = {"getHealth": "ok", "getSlot": 4242}
+    
+    def __init__(self):
+        # address -> account data
+        self.accounts = {}
+        self.posts = []
+        self.peer_ports = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def account(self, address):
+        data = self.accounts.get(address)
+        if data is None:
+            return None
+        return {"data": [base64.b64encode(data).decode(), "base64"], "lamports": 1, "owner": "program"}
+    
+    def matches(self, data, filters):
+        # The adapter filters on the 8-byte discriminator and the 32-byte mint
+        for memcmp in (f["memcmp"] for f in filters):
+            size = 8 if memcmp["offset"] == 0 else 32
+            if b58encode(data[memcmp["offset"]:memcmp["offset"] + size]) != memcmp["bytes"]:
+                return False
+        return True
+    
+    def answer(self, request):
+        if request["method"] == "skip":
+            return None
+        if request["method"] == "getMultipleAccounts":
+            value = [self.account(address) for address in request["params"][0]]
+            return {"jsonrpc": "2.0", "id": request["id"], "result": {"context": {}, "value": value}}
+        if request["method"] == "getProgramAccounts":
+            filters = request["params"][1].get("filters", [])
+            result = [
+                {"pubkey": address, "account": self.account(address)}
+                for address, data in self.accounts.items()
+                if self.matches(data, filters)
+            ]
+            return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+        if request["method"] not in self.RESULTS:
+            error = {"code": -32601, "message": "Method not found"}
+            return {"jsonrpc": "2.0", "id": request["id"], "error": error}
+        return {"jsonrpc": "2.0", "id": request["id"], "result": self.RESULTS[request["method"]]}
+    
+    async def handle(self, http_request: web.Request) -> web.Response:
+        body = await http_request.json()
+        self.posts.append(body)
+        self.peer_ports.add(http_request.transport.get_extra_info("peername")[1])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if isinstance(body, list):
+            answers = [self.answer(request) for request in reversed(body)]
+            return web.json_response([a for a in answers if a is not None])
+        return web.json_response(self.answer(body))
+
+
+@pytest.fixture
+async def rpc():
+    stub = StubRpc()
+    app = web.Application()
+    app.router.add_post("/", stub.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    adapter = SolanaAdapter(rpc_url=f"http://127.0.0.1:{port}/")
+    yield stub, adapter
+    await adapter.close()
+    await runner.cleanup()
+
+
+class TestSolanaAdapter:
+    """Test batching, id correlation and connection reuse"""
+    
+    @pytest.mark.asyncio
+    async def test_single_calls_get_unique_ids(self, rpc):
+        stub, adapter = rpc
+        assert (await adapter.get_health())["status"] == "ok"
+        assert await adapter.get_slot() == 4242
+        assert [post["id"] for post in stub.posts] == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_health_and_slot_in_one_round_trip(self, rpc):
+        stub, adapter = rpc
+        health, slot = await adapter.get_health_and_slot()
+        assert health == {"status": "ok", "response": "ok"}
+        assert slot == 4242
+        assert len(stub.posts) == 1
+        assert [r["method"] for r in stub.posts[0]] == ["getHealth", "getSlot"]
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_responses_by_id(self, rpc):
+        stub, adapter = rpc
+        responses = await adapter.rpc_batch(
+            [("getSlot", None), ("nope", []), ("skip", None), ("getHealth", None)]
+        )
+        assert responses[0]["result"] == 4242
+        assert responses[1]["error"]["code"] == -32601
+        assert responses[2] == {"error": "Missing response"}
+        assert responses[3]["result"] == "ok"
+    
+    @pytest.mark.asyncio
+    async def test_large_batches_split_and_sent_concurrently(self, rpc):
+        stub, adapter = rpc
+        adapter.MAX_BATCH_SIZE = 10
+        responses = await adapter.rpc_batch([("getSlot", None)] * 35)
+        assert len(responses) == 35
+        assert all(r["result"] == 4242 for r in responses)
+        assert [len(post) for post in stub.posts] == [10, 10, 10, 5]
+        assert stub.max_in_flight > 1
+        ids = [request["id"] for post in stub.posts for request in post]
+        assert len(set(ids)) == 35
+    
+    @pytest.mark.asyncio
+    async def test_keep_alive_reuses_connection(self, rpc):
+        stub, adapter = rpc
+        for _ in range(5):
+            await adapter.get_slot()
+        assert len(stub.peer_ports) == 1
+    
+    @pytest.mark.asyncio
+    async def test_unreachable_node_reports_errors(self):
+        adapter = SolanaAdapter(rpc_url="http://127.0.0.1:9/")
+        try:
+            health, slot = await adapter.get_health_and_slot()
+            assert health["status"] == "error"
+            assert slot == 0
+        finally:
+            await adapter.close()
+
+
+class TestAgentAccounts:
+    """Test AgentData loading"""
+    
+    @pytest.mark.asyncio
+    async def test_bulk_load_in_chunks(self, rpc):
+        stub, adapter = rpc
+        adapter.MAX_MULTIPLE_ACCOUNTS = 40
+        addresses = [f"agent-{i}" for i in range(100)]
+        for i, address in enumerate(addresses[:90]):
+            stub.accounts[address] = encode_agent(mint=bytes([i + 1]) * 32, generation=i)
+        stub.accounts["agent-95"] = b"not agent data"
+        
+        agents = await adapter.get_agent_accounts(addresses)
+        
+        # Chunks are in flight together, so they may arrive in any order
+        assert sorted(len(post["params"][0]) for post in stub.posts) == [20, 40, 40]
+        assert list(agents) == addresses
+        assert agents["agent-7"].generation == 7
+        assert agents["agent-7"].mint == b58encode(bytes([8]) * 32)
+        assert agents["agent-92"] is None
+        assert agents["agent-95"] is None
+    
+    @pytest.mark.asyncio
+    async def test_genome_data_by_mint(self, rpc):
+        stub, adapter = rpc
+        adapter.program_id = "program"
+        stub.accounts["a"] = encode_agent(mint=bytes([1]) * 32, name="First")
+        stub.accounts["b"] = encode_agent(mint=bytes([2]) * 32, name="Second")
+        stub.accounts["state"] = bytes(100)
+        
+        assert len(await adapter.get_program_agents()) == 2
+        genome = await adapter.get_genome_data(b58encode(bytes([2]) * 32))
+        assert genome["name"] == "Second"
+        assert genome["genome"] == [80, 75, 90, 65, 85, 70, 88, 72]
+        assert await adapter.get_genome_data(b58encode(bytes([3]) * 32)) is None
+        
+        accounts = await adapter.get_program_accounts()
+        decoded = {a["pubkey"]: a["agent"] is not None for a in accounts}
+        assert decoded == {"a": True, "b": True, "state": False}
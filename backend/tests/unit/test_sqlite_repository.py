@@ -0,0 +1,265 @@
+"""
+Unit tests for the SQLite repository and its connection pool
+"""
+import asyncio
+import pytest
+
+from src.domain.entities import Agent, EvolutionStatus, Genome
+from src.adapters.persistence import (
+    InMemoryEvolutionRepository, SQLiteConnectionPool, SQLiteEvolutionRepository
+)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = SQLiteEvolutionRepository(str(tmp_path / "test.db"))
+    yield repository
+    repository.close()
+
+
+class TestSQLiteConnectionPool:
+    """Test SQLiteConnectionPool"""
+    
+    def test_wal_mode(self, tmp_path):
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=2)
+        with pool.connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        pool.close()
+        assert mode == "wal"
+    
+    def test_connections_are_reused(self, tmp_path):
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        pool.close()
+        assert first is second
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_bounded_by_size(self, tmp_path):
+        pool = SQLiteConnectionPool(str(tmp_path / "pool.db"), size=2)
+        
+        results = await asyncio.gather(*[
+            pool.run(lambda conn, n: conn.execute("SELECT ?", (n,)).fetchone()[0], i)
+            for i in range(10)
+        ])
+        
+        assert results == list(range(10))
+        assert len(pool._all) <= 2
+        pool.close()
+    
+    @pytest.mark.asyncio
+    async def test_memory_database_is_shared(self):
+        pool = SQLiteConnectionPool(":memory:", size=2)
+        with pool.connection() as conn, conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.execute("INSERT INTO t VALUES (1)")
+        
+        counts = await asyncio.gather(*[
+            pool.run(lambda conn: conn.execute("SELECT COUNT(*) FROM t").fetchone()[0])
+            for _ in range(4)
+        ])
+        pool.close()
+        assert counts == [1, 1, 1, 1]
+
+
+class TestSQLiteEvolutionRepository:
+    """Test SQLiteEvolutionRepository"""
+    
+    @pytest.mark.asyncio
+    async def test_save_and_get(self, repo, make_result):
+        result = make_result(fitness=2.5, generations=1)
+        await repo.save(result)
+        
+        loaded = await repo.get_by_id(result.id)
+        assert loaded.id == result.id
+        assert loaded.status == EvolutionStatus.COMPLETED
+        assert loaded.best_agent.fitness == 2.5
+        assert len(loaded.generations) == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_missing(self, repo):
+        assert await repo.get_by_id("missing") is None
+    
+    @pytest.mark.asyncio
+    async def test_list_all_newest_first(self, repo, make_result):
+        results = [make_result(fitness=2.5, generations=1) for _ in range(3)]
+        for r in results:
+            await repo.save(r)
+        
+        listed = await repo.list_all(limit=2)
+        assert [r.id for r in listed] == [results[2].id, results[1].id]
+    
+    @pytest.mark.asyncio
+    async def test_delete(self, repo, make_result):
+        result = make_result(fitness=2.5, generations=1)
+        await repo.save(result)
+        
+        assert await repo.delete(result.id) is True
+        assert await repo.delete(result.id) is False
+        assert await repo.get_by_id(result.id) is None
+    
+    @pytest.mark.asyncio
+    async def test_ping(self, repo):
+        await repo.ping()
+    
+    @pytest.mark.asyncio
+    async def test_summary_skips_generations(self, repo, make_result):
+        result = make_result(fitness=2.5, generations=1)
+        await repo.save(result)
+        
+        summary = await repo.get_by_id(result.id, include_generations=False)
+        assert summary.generations == []
+        assert summary.total_generations == 1
+        
+        listed = await repo.list_all(include_generations=False)
+        assert listed[0].total_generations == 1
+        assert listed[0].best_agent.fitness == 2.5
+    
+    @pytest.mark.asyncio
+    async def test_resave_appends_new_generations(self, repo, make_result):
+        result = make_result(generations=2)
+        await repo.save(result)
+        
+        # Stored generations aren't rewritten; only later ones are inserted
+        result.generations[0].avg_fitness = 9.0
+        result.generations.extend(make_result(fitness=2.0, generations=4).generations[2:])
+        await repo.save(result)
+        loaded = await repo.get_by_id(result.id)
+        assert [g.generation_number for g in loaded.generations] == [1, 2, 3, 4]
+        assert [g.avg_fitness for g in loaded.generations] == [1.0, 1.0, 2.0, 2.0]
+        
+        result.generations = result.generations[:1]
+        await repo.save(result)
+        assert [g.generation_number for g in (await repo.get_by_id(result.id)).generations] == [1]
+    
+    @pytest.mark.asyncio
+    async def test_resaving_summary_keeps_history(self, repo, make_result):
+        result = make_result(fitness=2.5, generations=1)
+        await repo.save(result)
+        
+        summary = await repo.get_by_id(result.id, include_generations=False)
+        await repo.save(summary)
+        
+        loaded = await repo.get_by_id(result.id)
+        assert len(loaded.generations) == 1
+
+
+class TestSchemaMigration:
+    """Test migration from the JSON-blob schema"""
+    
+    @pytest.mark.asyncio
+    async def test_legacy_rows_are_normalized(self, tmp_path, make_result):
+        import json
+        import sqlite3
+        
+        db_path = str(tmp_path / "legacy.db")
+        legacy = make_result("legacy-1", fitness=3.0, generations=1)
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE evolution_results (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    parameters TEXT NOT NULL,
+                    generations TEXT NOT NULL,
+                    best_agent TEXT,
+                    created_at TEXT NOT NULL,
+                    completed_at TEXT,
+                    execution_time_ms INTEGER,
+                    error_message TEXT
+                )
+            """)
+            conn.execute(
+                "INSERT INTO evolution_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    legacy.id,
+                    legacy.status.value,
+                    json.dumps(legacy.parameters),
+                    json.dumps([g.to_dict() for g in legacy.generations]),
+                    json.dumps({
+                        "id": "agent-1",
+                        "genome": legacy.best_agent.genome.to_dict(),
+                        "fitness": 3.0,
+                        "generation": 0
+                    }),
+                    legacy.created_at.isoformat(),
+                    None,
+                    12,
+                    None
+                )
+            )
+        
+        repo = SQLiteEvolutionRepository(db_path)
+        try:
+            assert repo.schema_version == 6
+            loaded = await repo.get_by_id("legacy-1")
+            assert loaded.best_agent.fitness == 3.0
+            assert [g.generation_number for g in loaded.generations] == [1]
+            assert loaded.generations[0].max_fitness == 3.0
+            assert loaded.generations[0].pairwise_distance is None
+        finally:
+            repo.close()
+        
+        # Re-opening an up-to-date database is a no-op
+        reopened = SQLiteEvolutionRepository(db_path)
+        assert reopened.schema_version == 6
+        reopened.close()
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def population_repo(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryEvolutionRepository()
+        return
+    repository = SQLiteEvolutionRepository(str(tmp_path / "population.db"))
+    yield repository
+    repository.close()
+
+
+class TestFinalPopulation:
+    """Test packed final populations (both repositories share the format)"""
+    
+    @pytest.mark.asyncio
+    async def test_population_pages(self, population_repo, make_result):
+        repo = population_repo
+        result = make_result("with-population")
+        result.final_population = [
+            Agent(id="", genome=Genome(0.1 * i, 0.0, 0.0, 0.0, 0.0), fitness=float(i % 7), generation=i)
+            for i in range(30)
+        ]
+        await repo.save(result)
+        
+        page = await repo.get_population(result.id, limit=10, offset=5)
+        assert page.total == 30
+        assert [a.generation for a in page.agents] == list(range(5, 15))
+        assert page.agents[0].id == result.final_population[5].id
+        
+        top = await repo.get_population(result.id, limit=3, by_fitness=True)
+        assert [a.fitness for a in top.agents] == [6.0, 6.0, 6.0]
+        assert [a.generation for a in top.agents] == [6, 13, 20]
+        
+        # Re-saving without a population keeps the stored one
+        await repo.save(make_result("with-population"))
+        assert (await repo.get_population(result.id)).total == 30
+        assert (await repo.get_by_id(result.id)).final_population == []
+    
+    @pytest.mark.asyncio
+    async def test_non_uuid_ids(self, population_repo, make_result):
+        result = make_result("named")
+        result.final_population = [
+            Agent(id=f"agent-{i}", genome=Genome(0.5, 0.5, 0.5, 0.5, 0.5), fitness=2.5) for i in range(3)
+        ]
+        await population_repo.save(result)
+        page = await population_repo.get_population("named", limit=2, offset=1)
+        assert [a.id for a in page.agents] == ["agent-1", "agent-2"]
+    
+    @pytest.mark.asyncio
+    async def test_missing_population(self, population_repo, make_result):
+        repo = population_repo
+        await repo.save(make_result("no-population"))
+        assert (await repo.get_population("no-population")).total == 0
+        assert await repo.get_population("missing") is None
+        
+        await repo.delete("no-population")
+        assert await repo.get_population("no-population") is None
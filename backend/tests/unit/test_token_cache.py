@@ -0,0 +1,53 @@
+"""
+Unit tests for the verified-token cache
+"""
+import pytest
+
+from src.adapters.api.token_cache import TokenCache
+
+
+class TestTokenCache:
+    """Test TokenCache"""
+    
+    def test_hit_until_exp(self, clock):
+        clock.now = 1000
+        cache = TokenCache(clock=clock)
+        claims = {"sub": "user-1", "exp": 1060}
+        assert cache.get("token") is None
+        cache.put("token", claims)
+        
+        clock.now = 1059
+        assert cache.get("token") is claims
+        clock.now = 1060
+        assert cache.get("token") is None
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (1, 2)
+    
+    def test_evicts_least_recently_used(self, clock):
+        cache = TokenCache(max_entries=2, clock=clock)
+        for token in ("a", "b"):
+            cache.put(token, {"sub": token, "exp": 2000})
+        cache.get("a")
+        cache.put("c", {"sub": "c", "exp": 2000})
+        
+        assert cache.get("b") is None
+        assert cache.get("a")["sub"] == "a"
+    
+    def test_discard_and_digest_keys(self, clock):
+        cache = TokenCache(clock=clock)
+        cache.put("secret-token", {"sub": "user-1", "exp": 2000})
+        # Keys are digests, so the bearer token itself is not retained
+        assert all(key != b"secret-token" and len(key) == 32 for key in cache._entries)
+        
+        cache.discard("secret-token")
+        cache.discard("never-cached")
+        assert cache.get("secret-token") is None
+    
+    def test_tokens_without_exp_not_cached(self, clock):
+        cache = TokenCache(clock=clock)
+        cache.put("token", {"sub": "user-1"})
+        assert len(cache) == 0
+    
+    def test_rejects_empty_bound(self):
+        with pytest.raises(ValueError):
+            TokenCache(max_entries=0)
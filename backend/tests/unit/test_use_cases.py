@@ -3,6 +3,7 @@ Unit tests for evolution use cases
 """
 import pytest
 import asyncio
+import gc
 from src.domain.entities import EvolutionParameters, EvolutionStatus, Genome
 from src.domain.exceptions import ValidationError
 from src.application.evolution_use_cases import EvolutionEngine, RunEvolutionUseCase
@@ -189,3 +190,52 @@ class TestRunEvolutionUseCase:
         
         assert last_gen.avg_fitness >= first_gen.avg_fitness * 0.8  # Allow some variance
         assert last_gen.max_fitness >= first_gen.max_fitness
+    
+    def test_run_calls_generation_hook(self):
+        params = EvolutionParameters(population_size=10, generations=4, random_seed=1)
+        seen = []
+        
+        result = RunEvolutionUseCase().run(params, on_generation=seen.append)
+        
+        assert [s.generation_number for s in seen] == [1, 2, 3, 4]
+        assert seen == result.generations
+    
+    @pytest.mark.asyncio
+    async def test_stream_yields_generations_then_result(self):
+        from src.adapters.persistence import InMemoryEvolutionRepository
+        from src.domain.entities import EvolutionResult, GenerationStats
+        
+        repo = InMemoryEvolutionRepository()
+        params = EvolutionParameters(population_size=10, generations=5, random_seed=1)
+        
+        items = [item async for item in RunEvolutionUseCase(repository=repo).stream(params)]
+        
+        assert all(isinstance(i, GenerationStats) for i in items[:-1])
+        assert [i.generation_number for i in items[:-1]] == [1, 2, 3, 4, 5]
+        assert isinstance(items[-1], EvolutionResult)
+        assert await repo.get_by_id(items[-1].id) is not None
+    
+    @pytest.mark.asyncio
+    async def test_stream_closed_early_retrieves_run_error(self):
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        try:
+            params = EvolutionParameters(population_size=200, generations=1000, random_seed=1)
+            stream = RunEvolutionUseCase().stream(params)
+            await stream.__anext__()
+            await stream.aclose()
+            # The worker stops at its next generation; its future is then dropped
+            await asyncio.sleep(0.5)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        
+        assert unhandled == []
+    
+    @pytest.mark.asyncio
+    async def test_stream_validates(self):
+        with pytest.raises(ValidationError):
+            async for _ in RunEvolutionUseCase().stream(EvolutionParameters(population_size=1)):
+                pass
+
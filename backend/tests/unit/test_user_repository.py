@@ -0,0 +1,95 @@
+"""
+Unit tests for user repositories
+"""
+import sqlite3
+
+import pytest
+
+from src.domain.entities import User
+from src.domain.exceptions import ConflictError
+from src.adapters.persistence import InMemoryUserRepository, SQLiteUserRepository
+
+
+def make_user(email: str = "ada@example.com") -> User:
+    return User(id="", email=email, name="Ada", hashed_password="hash")
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def users(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryUserRepository()
+    else:
+        repository = SQLiteUserRepository(str(tmp_path / "users.db"))
+        yield repository
+        repository.close()
+
+
+class TestUserRepository:
+    """Test every user repository implementation"""
+    
+    @pytest.mark.asyncio
+    async def test_lookup_by_id_and_email(self, users):
+        user = make_user()
+        await users.add(user)
+        
+        by_id = await users.get_by_id(user.id)
+        by_email = await users.get_by_email("ada@example.com")
+        assert by_id == user
+        assert by_email == user
+        assert await users.get_by_email("bob@example.com") is None
+        assert await users.get_by_id("missing") is None
+    
+    @pytest.mark.asyncio
+    async def test_duplicate_email_rejected(self, users):
+        await users.add(make_user())
+        with pytest.raises(ConflictError):
+            await users.add(make_user())
+        await users.add(make_user("bob@example.com"))
+    
+    @pytest.mark.asyncio
+    async def test_increment_token_version(self, users):
+        user = make_user()
+        await users.add(user)
+        assert await users.increment_token_version(user.id) == 1
+        assert await users.increment_token_version(user.id) == 2
+        assert (await users.get_by_email(user.email)).token_version == 2
+        assert await users.increment_token_version("missing") is None
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_adds_token_version_column(self, tmp_path):
+        path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE users (
+                id TEXT PRIMARY KEY, email TEXT NOT NULL, name TEXT NOT NULL,
+                hashed_password TEXT NOT NULL, created_at TEXT NOT NULL,
+                is_active INTEGER NOT NULL DEFAULT 1
+            )
+        """)
+        conn.execute(
+            "INSERT INTO users VALUES ('u1', 'ada@example.com', 'Ada', 'hash', '2026-01-01T00:00:00', 1)"
+        )
+        conn.commit()
+        conn.close()
+        
+        users = SQLiteUserRepository(path)
+        try:
+            assert (await users.get_by_id("u1")).token_version == 0
+            assert await users.increment_token_version("u1") == 1
+        finally:
+            users.close()
+    
+    @pytest.mark.asyncio
+    async def test_sqlite_shared_between_workers(self, tmp_path):
+        # Each worker process opens its own repository on the same file
+        path = str(tmp_path / "shared.db")
+        first, second = SQLiteUserRepository(path), SQLiteUserRepository(path)
+        try:
+            user = make_user()
+            await first.add(user)
+            assert (await second.get_by_email(user.email)).id == user.id
+            with pytest.raises(ConflictError):
+                await second.add(make_user())
+        finally:
+            first.close()
+            second.close()
@@ -0,0 +1,136 @@
+"""
+Unit tests for the vectorized evolution engine
+"""
+import numpy as np
+import pytest
+
+from src.domain.entities import EvolutionParameters, EvolutionStatus
+from src.application.evolution_use_cases import RunEvolutionUseCase, create_engine
+from src.application.vectorized_engine import PopulationArray, VectorizedEvolutionEngine
+
+
+class TestVectorizedEvolutionEngine:
+    """Test VectorizedEvolutionEngine"""
+    
+    def test_create_engine_selects_vectorized(self):
+        params = EvolutionParameters(engine="vectorized")
+        assert isinstance(create_engine(params), VectorizedEvolutionEngine)
+    
+    def test_initial_population_shape(self):
+        params = EvolutionParameters(population_size=30, random_seed=42, engine="vectorized")
+        engine = VectorizedEvolutionEngine(params)
+        population = engine.initial_population()
+        
+        assert population.genomes.shape == (30, 5)
+        assert np.all((population.genomes >= 0) & (population.genomes <= 1))
+    
+    def test_calculate_fitness(self):
+        engine = VectorizedEvolutionEngine(EvolutionParameters(engine="vectorized"))
+        genomes = np.full((3, 5), 0.5)
+        assert np.allclose(engine.calculate_fitness(genomes), 2.5)
+    
+    def test_mutate_clamps(self):
+        params = EvolutionParameters(mutation_rate=1.0, random_seed=42, engine="vectorized")
+        engine = VectorizedEvolutionEngine(params)
+        genomes = np.vstack([np.zeros(5), np.ones(5)])
+        
+        mutated = engine.mutate(genomes)
+        assert np.all((mutated >= 0) & (mutated <= 1))
+        assert not np.array_equal(mutated, genomes)
+    
+    def test_crossover_takes_parent_genes(self):
+        engine = VectorizedEvolutionEngine(EvolutionParameters(random_seed=42, engine="vectorized"))
+        parents1 = np.full((4, 5), 0.1)
+        parents2 = np.full((4, 5), 0.9)
+        
+        child = engine.crossover(parents1, parents2)
+        assert np.all(np.isin(child, [0.1, 0.9]))
+    
+    def test_tournament_select_full_size_picks_best(self):
+        params = EvolutionParameters(population_size=3, tournament_size=3, engine="vectorized")
+        engine = VectorizedEvolutionEngine(params)
+        fitness = np.array([1.0, 5.0, 3.0])
+        
+        winners = engine.tournament_select(fitness, 10)
+        assert np.all(winners == 1)
+    
+    def test_natural_selection(self):
+        engine = VectorizedEvolutionEngine(EvolutionParameters(survival_rate=0.5, engine="vectorized"))
+        population = PopulationArray(
+            genomes=np.zeros((4, 5)),
+            fitness=np.array([1.0, 5.0, 3.0, 2.0]),
+            generation=np.zeros(4, dtype=np.int64)
+        )
+        
+        survivors = engine.natural_selection(population)
+        assert survivors.fitness.tolist() == [5.0, 3.0]
+    
+    def test_calculate_diversity_matches_standard(self):
+        params = EvolutionParameters(random_seed=7)
+        standard = create_engine(params)
+        vectorized = VectorizedEvolutionEngine(params)
+        population = standard.initial_population()
+        genomes = np.array([a.genome.to_tuple() for a in population])
+        
+        assert vectorized.calculate_diversity(genomes) == pytest.approx(
+            standard.calculate_diversity(population)
+        )
+    
+    def test_next_generation_keeps_size(self):
+        params = EvolutionParameters(population_size=25, random_seed=1, engine="vectorized")
+        engine = VectorizedEvolutionEngine(params)
+        population = engine.initial_population()
+        engine.evaluate(population)
+        
+        next_population = engine.next_generation(population)
+        assert len(next_population) == 25
+        assert next_population.generation.max() == 1
+    
+    
+    def test_agent_ids_are_stable(self):
+        engine = VectorizedEvolutionEngine(
+            EvolutionParameters(population_size=20, random_seed=1, engine="vectorized")
+        )
+        population = engine.initial_population()
+        engine.evaluate(population)
+        ids = [a.id for a in engine.to_agents(population)]
+        
+        assert len(set(ids)) == 20
+        assert [a.id for a in engine.to_agents(population)] == ids
+        assert engine.best_agent(population).id in ids
+        # Survivors keep their ids, offspring get new ones
+        survivors = set(ids) & {a.id for a in engine.to_agents(engine.next_generation(population))}
+        assert len(survivors) == int(20 * 0.4)
+
+
+class TestRunVectorizedEvolution:
+    """Test RunEvolutionUseCase with the vectorized engine"""
+    
+    @pytest.mark.asyncio
+    async def test_run_vectorized(self):
+        params = EvolutionParameters(
+            population_size=50,
+            generations=10,
+            random_seed=42,
+            engine="vectorized"
+        )
+        result = await RunEvolutionUseCase().execute(params)
+        
+        assert result.status == EvolutionStatus.COMPLETED
+        assert len(result.generations) == 10
+        assert result.generations[0].population_size == 50
+        assert len(result.final_population) == 50
+        assert result.best_agent.fitness >= result.generations[0].max_fitness
+        assert result.best_agent.id in {agent.id for agent in result.final_population}
+    
+    @pytest.mark.asyncio
+    async def test_run_vectorized_is_reproducible(self):
+        params = EvolutionParameters(population_size=20, generations=5, random_seed=3, engine="vectorized")
+        first = await RunEvolutionUseCase().execute(params)
+        second = await RunEvolutionUseCase().execute(params)
+        
+        assert first.best_agent.fitness == second.best_agent.fitness
+    
+    def test_invalid_engine(self):
+        errors = EvolutionParameters(engine="quantum").validate()
+        assert any("engine" in e for e in errors)
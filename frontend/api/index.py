@@ -11,6 +11,10 @@ sys.path.insert(0, backend_src)
 
 # Force in-memory database for serverless
 os.environ['CLAWDNA_USE_MEMORY_DB'] = 'true'
+# Serverless instances are small and short-lived: keep the store modest
+os.environ.setdefault('CLAWDNA_MEMORY_DB_MAX_MB', '64')
+os.environ.setdefault('CLAWDNA_MEMORY_DB_TTL', '3600')
+os.environ.setdefault('CLAWDNA_RESULT_CACHE_MAX_MB', '8')
 os.environ['CORS_ORIGINS'] = '*'
 
 # Import FastAPI and create app